@@ -3426,11 +3426,7 @@ public partial class Exchange
             if (isTrue(isTrue(reload) || !isTrue((inOp(this.options, "limitsLoaded")))))
             {
                 object response = await this.fetchTradingLimits(symbols);
-                for (object i = 0; isLessThan(i, getArrayLength(symbols)); postFixIncrement(ref i))
-                {
-                    object symbol = getValue(symbols, i);
-                    ((IDictionary<string,object>)this.markets)[(string)symbol] = this.deepExtend(getValue(this.markets, symbol), getValue(response, symbol));
-                }
+                this.setTradingLimits(symbols, response);
                 ((IDictionary<string,object>)this.options)["limitsLoaded"] = this.milliseconds();
             }
         }
@@ -3749,10 +3745,14 @@ public partial class Exchange
         method ??= "GET";
         parameters ??= new Dictionary<string, object>();
         config ??= new Dictionary<string, object>();
+        object priority = null;
+        var priorityparametersVariable = this.handleRateLimitPriority(api, method, parameters, config);
+        priority = ((IList<object>)priorityparametersVariable)[0];
+        parameters = ((IList<object>)priorityparametersVariable)[1];
         if (isTrue(this.enableRateLimit))
         {
             object cost = this.calculateRateLimiterCost(api, method, path, parameters, config);
-            await this.throttle(cost);
+            await this.throttle(cost, api, priority);
         }
         this.lastRestRequestTimestamp = this.milliseconds();
         object request = this.sign(path, api, method, parameters, headers, body);
@@ -557,11 +557,28 @@ public partial class Exchange
         return amount * scale;
     }
 
-    public async Task throttle(object cost)
+    public async Task throttle(object cost, object api = null, object priority = null)
     {
         await (await this.throttler.throttle(cost));
     }
 
+    public object handleRateLimitPriority(object api, object method, object parameters = null, object config = null)
+    {
+        // the throttler has a single lane here, the priority is taken out of the params so that it is not signed
+        parameters ??= new Dictionary<string, object>();
+        config ??= new Dictionary<string, object>();
+        object priority = this.safeString(parameters, "rateLimitPriority");
+        if (priority != null)
+        {
+            parameters = this.omit(parameters, "rateLimitPriority");
+        }
+        else
+        {
+            priority = this.safeString(config, "priority");
+        }
+        return new List<object>() { priority, parameters };
+    }
+
     public object clone(object o)
     {
         return o;
@@ -1082,6 +1099,25 @@ public partial class Exchange
     {
         return new System.Collections.Concurrent.ConcurrentDictionary<string, object>();
     }
+
+    public object getSafeIdsMemo(object name, object id)
+    {
+        // the unknown ids are parsed on every call
+        return null;
+    }
+
+    public void setSafeIdsMemo(object name, object id, object value)
+    {
+    }
+
+    public void setTradingLimits(object symbols, object limits)
+    {
+        for (object i = 0; isLessThan(i, getArrayLength(symbols)); postFixIncrement(ref i))
+        {
+            object symbol = getValue(symbols, i);
+            ((IDictionary<string,object>)this.markets)[(string)symbol] = this.deepExtend(getValue(this.markets, symbol), getValue(limits, symbol));
+        }
+    }
     public class DynamicInvoker
     {
         public static object InvokeMethod(object action, object[] parameters)
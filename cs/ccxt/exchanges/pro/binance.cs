@@ -4317,15 +4317,17 @@ public partial class binance : ccxt.binance
         object positions = await this.fetchPositions(null, parameters);
         ((IDictionary<string,object>)this.positions)[(string)type] = new ArrayCacheBySymbolBySide();
         object cache = getValue(this.positions, type);
+        object openPositions = new List<object>() {};
         for (object i = 0; isLessThan(i, getArrayLength(positions)); postFixIncrement(ref i))
         {
             object position = getValue(positions, i);
             object contracts = this.safeNumber(position, "contracts", 0);
             if (isTrue(isGreaterThan(contracts, 0)))
             {
-                callDynamically(cache, "append", new object[] {position});
+                ((IList<object>)openPositions).Add(position);
             }
         }
+        callDynamically(cache, "appendMany", new object[] {openPositions});
         // don't remove the future from the .futures cache
         var future = getValue(client.futures, messageHash);
         (future as Future).resolve(cache);
@@ -4385,8 +4387,8 @@ public partial class binance : ccxt.binance
             ((IDictionary<string,object>)position)["timestamp"] = timestamp;
             ((IDictionary<string,object>)position)["datetime"] = this.iso8601(timestamp);
             ((IList<object>)newPositions).Add(position);
-            callDynamically(cache, "append", new object[] {position});
         }
+        callDynamically(cache, "appendMany", new object[] {newPositions});
         object messageHashes = this.findMessageHashes(client as WebSocketClient, add(accountType, ":positions::"));
         for (object i = 0; isLessThan(i, getArrayLength(messageHashes)); postFixIncrement(ref i))
         {
@@ -95,6 +95,18 @@ public class ArrayCache : BaseCache
         }
     }
 
+    public void appendMany(object items)
+    {
+        // a snapshot or a burst of updates, under a single lock
+        lock (this.lockObject)
+        {
+            foreach (var item in (IList<object>)items)
+            {
+                _append(item);
+            }
+        }
+    }
+
     private void _append(object item)
     {
         if (this.maxSize != null && this.maxSize != 0 && this.Count == this.maxSize)
@@ -222,6 +234,18 @@ public class ArrayCacheBySymbolById : ArrayCache
         }
     }
 
+    public void appendMany(object items)
+    {
+        // a snapshot or a burst of updates, under a single lock
+        lock (this.lockObject)
+        {
+            foreach (var item in (IList<object>)items)
+            {
+                _append(item);
+            }
+        }
+    }
+
     private void _append(object item)
     {
         var itemSymbol = Exchange.SafeString(item, "symbol");
@@ -310,6 +334,18 @@ public class ArrayCacheBySymbolBySide : ArrayCache
         }
     }
 
+    public void appendMany(object items)
+    {
+        // a snapshot or a burst of updates, under a single lock
+        lock (this.lockObject)
+        {
+            foreach (var item in (IList<object>)items)
+            {
+                _append(item);
+            }
+        }
+    }
+
     private void _append(object item)
     {
         var itemSymbol = Exchange.SafeString(item, "symbol");
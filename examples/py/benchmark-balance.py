@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt  # noqa: E402
+
+# times fetch_balance over the recorded responses of ts/src/test/static, scaled up to a large account:
+#     python examples/py/benchmark-balance.py [assets per account] [iterations]
+
+static = os.path.join(root, 'ts', 'src', 'test', 'static')
+
+# exchange id, recorded response, the list of assets in it and the currency id of an asset
+responses = [
+    ('binance', 'Spot balance', 'balances', 'asset'),
+    ('kucoin', 'fetch balance', 'data', 'currency'),
+    ('bitget', 'spot balance', 'data', 'coin'),
+]
+
+
+def load_fixture(folder, exchange_id):
+    with open(os.path.join(static, folder, exchange_id + '.json')) as file:
+        return json.load(file)
+
+
+def scale(response, key, currency_key, count):
+    # copies of the recorded assets under distinct currency ids, most of them unknown to the markets
+    recorded = response[key]
+    assets = []
+    for i in range(count):
+        asset = dict(recorded[i % len(recorded)])
+        suffix = str(i // len(recorded))
+        if suffix != '0':
+            asset[currency_key] = asset[currency_key] + suffix
+        assets.append(asset)
+    return dict(response, **{key: assets})
+
+
+def benchmark(exchange_id, description, key, currency_key, count, iterations):
+    exchange = getattr(ccxt, exchange_id)({'apiKey': 'key', 'secret': 'secret', 'password': 'password', 'enableRateLimit': False})
+    exchange.set_markets(list(load_fixture('markets', exchange_id).values()))
+    cases = load_fixture('response', exchange_id)['methods']['fetchBalance']
+    case = [case for case in cases if case['description'] == description][0]
+    response = scale(case['httpResponse'], key, currency_key, count)
+    exchange.fetch = lambda url, method='GET', headers=None, body=None: response
+    times = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        balance = exchange.fetch_balance()
+        times.append(time.perf_counter() - start)
+    return len(balance['total']), sorted(times)[len(times) // 2]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    print('exchange'.ljust(12), 'assets'.rjust(8), 'median ms'.rjust(10))
+    for exchange_id, description, key, currency_key in responses:
+        assets, seconds = benchmark(exchange_id, description, key, currency_key, count, iterations)
+        print(exchange_id.ljust(12), str(assets).rjust(8), ('%.2f' % (seconds * 1000)).rjust(10))
+
+
+main()
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+import os
+import random
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+from ccxt.async_support.base.ws.cache import ArrayCacheBySymbolById, ArrayCacheBySymbolBySide  # noqa: E402
+
+# times the updates of the websocket caches, as a market maker with many live orders or positions receives them:
+#     python examples/py/benchmark-cache.py [live orders or positions] [updates]
+
+
+def orders(count, updates):
+    # the live orders first, then updates of random ones
+    rng = random.Random(0)
+    symbols = ['BTC/USDT', 'ETH/USDT', 'SOL/USDT', 'XRP/USDT']
+    result = [{'symbol': symbols[i % len(symbols)], 'id': str(i), 'status': 'open', 'filled': 0} for i in range(count)]
+    for i in range(updates):
+        order = result[rng.randrange(count)]
+        result.append({'symbol': order['symbol'], 'id': order['id'], 'status': 'open', 'filled': i})
+    return result
+
+
+def benchmark_by_id(count, updates, reads, iterations=5):
+    times = []
+    for _ in range(iterations):
+        messages = orders(count, updates)
+        cache = ArrayCacheBySymbolById(count)
+        for order in messages[:count]:
+            cache.append(order)
+        start = time.perf_counter()
+        for i, order in enumerate(messages[count:]):
+            cache.append(order)
+            if reads and i % reads == 0:
+                # a watch_orders() call reads the new updates
+                limit = cache.getLimit(None, None)
+                assert len(cache[-limit:]) == limit
+        times.append((time.perf_counter() - start) / updates)
+    return sorted(times)[len(times) // 2]
+
+
+def positions(count, bursts, burst_size=50):
+    # both sides of the perpetual swaps, then account updates of random ones
+    rng = random.Random(0)
+    symbols = ['S%d/USDT:USDT' % i for i in range(count // 2)]
+    snapshot = [{'symbol': symbol, 'side': side, 'contracts': 1} for symbol in symbols for side in ['long', 'short']]
+    result = []
+    for i in range(bursts):
+        result.append([dict(position, contracts=i) for position in rng.sample(snapshot, burst_size)])
+    return snapshot, result
+
+
+def benchmark_by_side(count, bursts, iterations=5):
+    times = []
+    for _ in range(iterations):
+        snapshot, messages = positions(count, bursts)
+        cache = ArrayCacheBySymbolBySide()
+        cache.append_many(snapshot)
+        start = time.perf_counter()
+        updates = 0
+        for burst in messages:
+            cache.append_many(burst)
+            updates += len(burst)
+            limit = cache.getLimit(None, None)
+            assert len(cache[-limit:]) == limit
+        times.append((time.perf_counter() - start) / updates)
+    return sorted(times)[len(times) // 2]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    updates = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+    print('cache'.ljust(28), 'items'.rjust(8), 'reads'.rjust(18), 'us per update'.rjust(14))
+    # without reads and with a read every 50 updates
+    for reads in [0, 50]:
+        title = 'every %d updates' % reads if reads else 'none'
+        print('ArrayCacheBySymbolById'.ljust(28), str(count).rjust(8), title.rjust(18), ('%.2f' % (benchmark_by_id(count, updates, reads) * 1e6)).rjust(14))
+    # the positions of an account, bursts of 50 updates read once each
+    print('ArrayCacheBySymbolBySide'.ljust(28), str(count).rjust(8), 'every burst'.rjust(18), ('%.2f' % (benchmark_by_side(count, updates // 50) * 1e6)).rjust(14))
+
+
+main()
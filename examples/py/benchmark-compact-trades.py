@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import time
+import tracemalloc
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt.pro  # noqa: E402
+from ccxt.async_support.base.ws.cache import ArrayCache, CompactTradeCaches  # noqa: E402
+
+# the memory of full watch_trades caches of binance trades, as dicts and as CompactTrade records:
+#     python examples/py/benchmark-compact-trades.py [caches] [trades per cache]
+
+
+def messages(symbol, count):
+    return [{
+        'e': 'trade', 'E': 1579482900000 + i, 's': symbol, 't': 1000000 + i, 'p': '10000.5', 'q': '0.1',
+        'b': 88, 'a': 50, 'T': 1579482900000 + i, 'm': True, 'M': True,
+    } for i in range(count)]
+
+
+def fill(exchange, caches, count, compact, keep_info):
+    result = CompactTradeCaches({}, keep_info) if compact else {}
+    seconds = 0
+    for i in range(caches):
+        symbol = 'S%dUSDT' % i
+        trades = [exchange.parse_ws_trade(message) for message in messages(symbol, count)]
+        result[symbol] = ArrayCache(count)
+        cache = result[symbol]
+        start = time.perf_counter()
+        for trade in trades:
+            cache.append(trade)
+        seconds += time.perf_counter() - start
+    return result, seconds / (caches * count)
+
+
+def memory(exchange, caches, count, compact, keep_info):
+    tracemalloc.start()
+    result = fill(exchange, caches, count, compact, keep_info)[0]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    # timed apart from tracemalloc
+    return size, fill(exchange, caches, count, compact, keep_info)[1]
+
+
+def main():
+    caches = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    exchange = ccxt.pro.binance()
+    print('trades'.ljust(24), 'caches'.rjust(8), 'MB'.rjust(8), 'us per append'.rjust(14))
+    for title, compact, keep_info in [('dict', False, True), ('CompactTrade', True, True), ('CompactTrade, no info', True, False)]:
+        size, seconds = memory(exchange, caches, count, compact, keep_info)
+        print(title.ljust(24), str(caches).rjust(8), ('%.1f' % (size / 1e6)).rjust(8), ('%.2f' % (seconds * 1e6)).rjust(14))
+
+
+main()
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import time
+import tracemalloc
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+from ccxt.async_support.base.ws.cache import ArrayCacheByTimestamp, ColumnarArrayCacheByTimestamp  # noqa: E402
+
+# the memory of full watch_ohlcv caches and the time of a kline update, with the default OHLCVLimit:
+#     python examples/py/benchmark-ohlcv-cache.py [caches] [candles per cache]
+
+
+def fill(cls, caches, candles):
+    result = []
+    for i in range(caches):
+        cache = cls(candles)
+        for j in range(candles):
+            close = float(i + j)
+            cache.append([1700000000000 + j * 60000, close, close + 1, close - 1, close, float(j)])
+        # as read by watch_ohlcv
+        cache.getLimit(None, None)
+        cache.append(cache[-1])
+        result.append(cache)
+    return result
+
+
+def memory(cls, caches, candles):
+    tracemalloc.start()
+    result = fill(cls, caches, candles)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def benchmark_updates(cls, candles, updates=100000, iterations=5):
+    # the updates of the last candle, then a new candle every 60
+    times = []
+    for _ in range(iterations):
+        cache = fill(cls, 1, candles)[0]
+        timestamp = 1700000000000 + (candles - 1) * 60000
+        start = time.perf_counter()
+        for i in range(updates):
+            if i % 60 == 0:
+                timestamp += 60000
+            cache.append([timestamp, 1.0, 2.0, 0.5, float(i), 10.0])
+        times.append((time.perf_counter() - start) / updates)
+    return sorted(times)[len(times) // 2]
+
+
+def main():
+    caches = int(sys.argv[1]) if len(sys.argv) > 1 else 600
+    candles = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    print('cache'.ljust(32), 'caches'.rjust(8), 'MB'.rjust(8), 'us per update'.rjust(14))
+    for cls in [ArrayCacheByTimestamp, ColumnarArrayCacheByTimestamp]:
+        size = memory(cls, caches, candles) / 1e6
+        print(cls.__name__.ljust(32), str(caches).rjust(8), ('%.1f' % size).rjust(8), ('%.2f' % (benchmark_updates(cls, candles) * 1e6)).rjust(14))
+
+
+main()
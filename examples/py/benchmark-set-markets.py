@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt  # noqa: E402
+
+# times set_markets over the recorded markets of ts/src/test/static, scaled up to a realistic size:
+#     python examples/py/benchmark-set-markets.py [markets per exchange] [iterations]
+
+static = os.path.join(root, 'ts', 'src', 'test', 'static')
+
+
+def load_fixture(folder, exchange_id):
+    path = os.path.join(static, folder, exchange_id + '.json')
+    if not os.path.exists(path):
+        return None
+    with open(path) as file:
+        return json.load(file)
+
+
+def scale(markets, count):
+    # copies of the recorded markets under distinct ids, symbols and currencies
+    result = []
+    recorded = list(markets.values())
+    for i in range(count):
+        market = json.loads(json.dumps(recorded[i % len(recorded)]))
+        suffix = str(i // len(recorded))
+        if suffix != '0':
+            market['id'] = market['id'] + suffix
+            market['symbol'] = market['symbol'].replace(market['base'] + '/', market['base'] + suffix + '/', 1)
+            market['base'] = market['base'] + suffix
+            market['baseId'] = (market.get('baseId') or '') + suffix
+        result.append(market)
+    return result
+
+
+def benchmark(exchange_id, count, iterations):
+    exchange = getattr(ccxt, exchange_id)()
+    markets = scale(load_fixture('markets', exchange_id), count)
+    currencies = load_fixture('currencies', exchange_id)
+    results = []
+    for title, argument in [('derived currencies', None), ('fetched currencies', currencies)]:
+        if title == 'fetched currencies' and argument is None:
+            continue
+        times = []
+        for _ in range(iterations):
+            exchange.currencies = {}
+            start = time.perf_counter()
+            exchange.set_markets(markets, argument)
+            times.append(time.perf_counter() - start)
+        results.append((exchange_id, title, len(exchange.markets), len(exchange.currencies), sorted(times)[len(times) // 2]))
+    return results
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    print('exchange'.ljust(12), 'currencies'.ljust(20), 'markets'.rjust(8), 'codes'.rjust(6), 'median ms'.rjust(10))
+    for exchange_id in ['binance', 'okx', 'gate', 'bybit']:
+        for exchange_id, title, markets, codes, seconds in benchmark(exchange_id, count, iterations):
+            print(exchange_id.ljust(12), title.ljust(20), str(markets).rjust(8), str(codes).rjust(6), ('%.1f' % (seconds * 1000)).rjust(10))
+
+
+main()
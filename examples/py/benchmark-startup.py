@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+
+import os
+import subprocess
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# measures the cold start of import ccxt in fresh interpreters:
+#     python examples/py/benchmark-startup.py [exchange_id] [iterations]
+
+script = '''
+import resource
+import sys
+import time
+sys.path.insert(0, sys.argv[1])
+start = time.perf_counter()
+import ccxt
+imported = time.perf_counter()
+if sys.argv[2]:
+    exchange = getattr(ccxt, sys.argv[2])()
+    # the first signature pulls in the signing dependencies of a dex exchange
+    exchange.eth_encode_structured_data({'name': 'ccxt', 'chainId': 1}, {'Test': [{'name': 'value', 'type': 'uint256'}]}, {'value': 1})
+end = time.perf_counter()
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+# kilobytes on linux, bytes on macos
+rss = rss / 1024 if sys.platform == 'darwin' else rss
+print(imported - start, end - start, rss / 1024)
+'''
+
+
+def run(exchange_id, iterations):
+    results = []
+    for _ in range(iterations):
+        output = subprocess.check_output([sys.executable, '-c', script, root + '/python', exchange_id])
+        results.append([float(value) for value in output.split()])
+    # median of each column
+    return [sorted(column)[len(column) // 2] for column in zip(*results)]
+
+
+def main():
+    exchange_id = sys.argv[1] if len(sys.argv) > 1 else 'hyperliquid'
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    print('scenario'.ljust(32), 'import ms'.rjust(10), 'total ms'.rjust(10), 'max rss MB'.rjust(12))
+    for title, id in [('import ccxt', ''), ('import ccxt + ' + exchange_id, exchange_id)]:
+        imported, total, rss = run(id, iterations)
+        print(title.ljust(32), ('%.1f' % (imported * 1000)).rjust(10), ('%.1f' % (total * 1000)).rjust(10), ('%.1f' % rss).rjust(12))
+
+
+main()
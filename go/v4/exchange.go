@@ -285,7 +285,7 @@ func (this *Exchange) LoadMarkets(params ...interface{}) <-chan interface{} {
 	return ch
 }
 
-func (this *Exchange) Throttle(cost interface{}) <-chan interface{} {
+func (this *Exchange) Throttle(cost interface{}, optionalArgs ...interface{}) <-chan interface{} {
 	// to do
 	ch := make(chan interface{})
 	go func() {
@@ -296,6 +296,19 @@ func (this *Exchange) Throttle(cost interface{}) <-chan interface{} {
 	return ch
 }
 
+func (this *Exchange) HandleRateLimitPriority(api interface{}, method interface{}, optionalArgs ...interface{}) interface{} {
+	// the throttler has a single lane here, the priority is taken out of the params so that it is not signed
+	params := GetArg(optionalArgs, 0, map[string]interface{}{})
+	config := GetArg(optionalArgs, 1, map[string]interface{}{})
+	var priority interface{} = this.SafeString(params, "rateLimitPriority")
+	if priority != nil {
+		params = this.Omit(params, "rateLimitPriority")
+	} else {
+		priority = this.SafeString(config, "priority")
+	}
+	return []interface{}{priority, params}
+}
+
 func (this *Exchange) FetchMarkets(optionalArgs ...interface{}) <-chan interface{} {
 	ch := make(chan interface{})
 	go func() interface{} {
@@ -1068,6 +1081,21 @@ func (this *Exchange) ExtendExchangeOptions(options2 interface{}) {
 	this.Options = extended
 }
 
+func (this *Exchange) GetSafeIdsMemo(name interface{}, id interface{}) interface{} {
+	// the unknown ids are parsed on every call
+	return nil
+}
+
+func (this *Exchange) SetSafeIdsMemo(name interface{}, id interface{}, value interface{}) {
+}
+
+func (this *Exchange) SetTradingLimits(symbols interface{}, limits interface{}) {
+	for i := 0; IsLessThan(i, GetArrayLength(symbols)); i++ {
+		var symbol interface{} = GetValue(symbols, i)
+		AddElementToObject(this.Markets, symbol, this.DeepExtend(GetValue(this.Markets, symbol), GetValue(limits, symbol)))
+	}
+}
+
 // func (this *Exchange) Init(userConfig map[string]interface{}) {
 // }
 
@@ -3724,10 +3724,7 @@ func  (this *Exchange) LoadTradingLimits(optionalArgs ...interface{}) <- chan in
         
                     response:= (<-this.FetchTradingLimits(symbols))
                     PanicOnError(response)
-                    for i := 0; IsLessThan(i, GetArrayLength(symbols)); i++ {
-                        var symbol interface{} = GetValue(symbols, i)
-                        AddElementToObject(this.Markets, symbol, this.DeepExtend(GetValue(this.Markets, symbol), GetValue(response, symbol)))
-                    }
+                    this.SetTradingLimits(symbols, response)
                     AddElementToObject(this.Options, "limitsLoaded", this.Milliseconds())
                 }
             }
@@ -4043,10 +4040,14 @@ func  (this *Exchange) Fetch2(path interface{}, optionalArgs ...interface{}) <-
             _ = body
             config := GetArg(optionalArgs, 5, map[string]interface{} {})
             _ = config
+            var priority interface{} = nil
+            priorityparamsVariable := this.HandleRateLimitPriority(api, method, params, config);
+            priority = GetValue(priorityparamsVariable,0);
+            params = GetValue(priorityparamsVariable,1)
             if IsTrue(this.EnableRateLimit) {
                 var cost interface{} = this.CalculateRateLimiterCost(api, method, path, params, config)
         
-                retRes466512 := (<-this.Throttle(cost))
+                retRes466512 := (<-this.Throttle(cost, api, priority))
                 PanicOnError(retRes466512)
             }
             this.LastRestRequestTimestamp = this.Milliseconds()
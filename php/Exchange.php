@@ -1356,7 +1356,7 @@ class Exchange {
         return MessagePack::pack($data);
     }
 
-    public function throttle($cost = null) {
+    public function throttle($cost = null, $api = null, $priority = null) {
         // TODO: use a token bucket here
         $now = $this->milliseconds();
         $elapsed = $now - $this->lastRestRequestTimestamp;
@@ -1368,6 +1368,17 @@ class Exchange {
         }
     }
 
+    public function handle_rate_limit_priority($api, $method, $params = array(), $config = array()) {
+        // the throttler has a single lane here, the priority is taken out of the params so that it is not signed
+        $priority = $this->safe_string($params, 'rateLimitPriority');
+        if ($priority !== null) {
+            $params = $this->omit($params, 'rateLimitPriority');
+        } else {
+            $priority = $this->safe_string($config, 'priority');
+        }
+        return array($priority, $params);
+    }
+
     public function parse_json($json_string, $as_associative_array = true) {
         return json_decode($this->on_json_response($json_string), $as_associative_array);
     }
@@ -2201,6 +2212,21 @@ class Exchange {
         return array();
     }
 
+    public function set_trading_limits(array $symbols, array $limits) {
+        for ($i = 0; $i < count($symbols); $i++) {
+            $symbol = $symbols[$i];
+            $this->markets[$symbol] = $this->deep_extend($this->markets[$symbol], $limits[$symbol]);
+        }
+    }
+
+    public function get_safe_ids_memo(string $name, string $id) {
+        // the unknown ids are parsed on every call, arrays are values and their identity can't tell a change
+        return null;
+    }
+
+    public function set_safe_ids_memo(string $name, string $id, $value) {
+    }
+
     public function rand_number($size) {
         $number = '';
         for ($i = 0; $i < $size; $i++) {
@@ -5039,10 +5065,7 @@ class Exchange {
         if ($this->has['fetchTradingLimits']) {
             if ($reload || !(is_array($this->options) && array_key_exists('limitsLoaded', $this->options))) {
                 $response = $this->fetch_trading_limits($symbols);
-                for ($i = 0; $i < count($symbols); $i++) {
-                    $symbol = $symbols[$i];
-                    $this->markets[$symbol] = $this->deep_extend($this->markets[$symbol], $response[$symbol]);
-                }
+                $this->set_trading_limits($symbols, $response);
                 $this->options['limitsLoaded'] = $this->milliseconds();
             }
         }
@@ -5295,9 +5318,11 @@ class Exchange {
     }
 
     public function fetch2($path, mixed $api = 'public', $method = 'GET', $params = array (), mixed $headers = null, mixed $body = null, $config = array ()) {
+        $priority = null;
+        list($priority, $params) = $this->handle_rate_limit_priority($api, $method, $params, $config);
         if ($this->enableRateLimit) {
             $cost = $this->calculate_rate_limiter_cost($api, $method, $path, $params, $config);
-            $this->throttle($cost);
+            $this->throttle($cost, $api, $priority);
         }
         $this->lastRestRequestTimestamp = $this->milliseconds();
         $request = $this->sign($path, $api, $method, $params, $headers, $body);
@@ -297,7 +297,7 @@ class Exchange extends \ccxt\Exchange {
         $this->throttler = new Throttler($this->tokenBucket);
     }
 
-    public function throttle($cost = null) {
+    public function throttle($cost = null, $api = null, $priority = null) {
         // stub so the async throttler gets called instead of the sync throttler
         return call_user_func($this->throttler, $cost);
     }
@@ -3160,10 +3160,7 @@ class Exchange extends \ccxt\Exchange {
             if ($this->has['fetchTradingLimits']) {
                 if ($reload || !(is_array($this->options) && array_key_exists('limitsLoaded', $this->options))) {
                     $response = Async\await($this->fetch_trading_limits($symbols));
-                    for ($i = 0; $i < count($symbols); $i++) {
-                        $symbol = $symbols[$i];
-                        $this->markets[$symbol] = $this->deep_extend($this->markets[$symbol], $response[$symbol]);
-                    }
+                    $this->set_trading_limits($symbols, $response);
                     $this->options['limitsLoaded'] = $this->milliseconds();
                 }
             }
@@ -3418,9 +3415,11 @@ class Exchange extends \ccxt\Exchange {
 
     public function fetch2($path, mixed $api = 'public', $method = 'GET', $params = array (), mixed $headers = null, mixed $body = null, $config = array ()) {
         return Async\async(function () use ($path, $api, $method, $params, $headers, $body, $config) {
+            $priority = null;
+            list($priority, $params) = $this->handle_rate_limit_priority($api, $method, $params, $config);
             if ($this->enableRateLimit) {
                 $cost = $this->calculate_rate_limiter_cost($api, $method, $path, $params, $config);
-                Async\await($this->throttle($cost));
+                Async\await($this->throttle($cost, $api, $priority));
             }
             $this->lastRestRequestTimestamp = $this->milliseconds();
             $request = $this->sign($path, $api, $method, $params, $headers, $body);
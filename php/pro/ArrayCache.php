@@ -60,4 +60,11 @@ class ArrayCache extends BaseCache {
         $this->new_updates_by_symbol[$item['symbol']] = ($this->new_updates_by_symbol[$item['symbol']] ?? 0) + 1;
         $this->all_new_updates = ($this->all_new_updates ?? 0) + 1;
     }
+
+    public function appendMany($items) {
+        // a snapshot or a burst of updates
+        foreach ($items as $item) {
+            $this->append($item);
+        }
+    }
 }
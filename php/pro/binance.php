@@ -3924,13 +3924,15 @@ class binance extends \ccxt\async\binance {
             $positions = Async\await($this->fetch_positions(null, $params));
             $this->positions[$type] = new ArrayCacheBySymbolBySide ();
             $cache = $this->positions[$type];
+            $openPositions = array();
             for ($i = 0; $i < count($positions); $i++) {
                 $position = $positions[$i];
                 $contracts = $this->safe_number($position, 'contracts', 0);
                 if ($contracts > 0) {
-                    $cache->append ($position);
+                    $openPositions[] = $position;
                 }
             }
+            $cache->appendMany ($openPositions);
             // don't remove the $future from the .futures $cache
             $future = $client->futures[$messageHash];
             $future->resolve ($cache);
@@ -3987,8 +3989,8 @@ class binance extends \ccxt\async\binance {
             $position['timestamp'] = $timestamp;
             $position['datetime'] = $this->iso8601($timestamp);
             $newPositions[] = $position;
-            $cache->append ($position);
         }
+        $cache->appendMany ($newPositions);
         $messageHashes = $this->find_message_hashes($client, $accountType . ':$positions::');
         for ($i = 0; $i < count($messageHashes); $i++) {
             $messageHash = $messageHashes[$i];
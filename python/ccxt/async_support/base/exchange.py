@@ -8,6 +8,7 @@ __version__ = '4.4.63'
 
 import asyncio
 import concurrent.futures
+import contextvars
 import socket
 import certifi
 import aiohttp
@@ -20,7 +21,7 @@ from ccxt.base.types import Int, Str, Num, Strings
 
 # -----------------------------------------------------------------------------
 
-from ccxt.async_support.base.throttler import Throttler
+from ccxt.async_support.base.throttler import Throttler, get_shared_throttler
 
 # -----------------------------------------------------------------------------
 
@@ -36,7 +37,8 @@ from ccxt.base.exchange import Exchange as BaseExchange, ArgumentsRequired
 from ccxt.async_support.base.ws.functions import inflate, inflate64, gunzip
 from ccxt.async_support.base.ws.fast_client import FastClient
 from ccxt.async_support.base.ws.future import Future
-from ccxt.async_support.base.ws.order_book import OrderBook, IndexedOrderBook, CountedOrderBook
+from ccxt.async_support.base.ws.cache import ArrayCache, ColumnarCaches, CompactTradeCaches, CompactTradesArrayCache
+from ccxt.async_support.base.ws.order_book import OrderBook, IndexedOrderBook, CountedOrderBook, SortedOrderBook, SortedIndexedOrderBook, SortedCountedOrderBook
 
 
 # -----------------------------------------------------------------------------
@@ -55,6 +57,11 @@ __all__ = [
 
 # -----------------------------------------------------------------------------
 
+# the throttler that released the current request, used to feed the rate limit headers of its response back
+request_throttler = contextvars.ContextVar('request_throttler', default=None)
+
+# -----------------------------------------------------------------------------
+
 
 class Exchange(BaseExchange):
     synchronous = False
@@ -66,6 +73,9 @@ class Exchange(BaseExchange):
     newUpdates = True
     clients = {}
     timeout_on_exit = 250  # needed for: https://github.com/ccxt/ccxt/pull/23470
+    boundMessageHandlers = None
+    compact_trades = None  # whether the CompactTrade records of self.trades keep the raw info, see __init__()
+    _trades = None
 
     def __init__(self, config={}):
         if 'asyncio_loop' in config:
@@ -75,18 +85,99 @@ class Exchange(BaseExchange):
         self.own_session = 'session' not in config
         self.cafile = config.get('cafile', certifi.where())
         self.throttler = None
+        self.throttlers = {}
         super(Exchange, self).__init__(config)
+        if self.is_columnar_ohlcv_cache():
+            self.ohlcvs = ColumnarCaches(self.ohlcvs)
+        # options['ws']['compactTrades'] = True keeps the trades of watch_trades as CompactTrade records instead of dicts,
+        # options['ws']['compactTradesInfo'] = False drops their raw info as well
+        ws_options = self.safe_dict(self.options, 'ws')
+        if self.safe_bool(ws_options, 'compactTrades', False):
+            self.compact_trades = self.safe_bool(ws_options, 'compactTradesInfo', True)
+            # converted by the setter
+            self.trades = self.trades
         self.markets_loading = None
         self.reloading_markets = False
+        self.markets_refreshing = None
+
+    @property
+    def trades(self):
+        return self._trades
+
+    @trades.setter
+    def trades(self, trades):
+        # the handlers that replace self.trades, cex with the ArrayCache of its only symbol for instance, keep
+        # CompactTrade records as well, an ArrayCacheBySymbolById (idex) updates its trades in place and keeps dicts
+        if self.compact_trades is not None:
+            if type(trades) is dict:
+                trades = CompactTradeCaches(trades, self.compact_trades)
+            elif type(trades) is ArrayCache:
+                CompactTradesArrayCache.convert(trades, self.compact_trades)
+        self._trades = trades
 
     def get_event_loop(self):
         return self.asyncio_loop
 
     def init_throttler(self, cost=None):
-        self.throttler = Throttler(self.tokenBucket, self.asyncio_loop)
-
-    async def throttle(self, cost=None):
-        return await self.throttler(cost)
+        # options['sharedRateLimit'] = True attaches the instance to a process-wide bucket keyed by its apiKey,
+        # a string value names the bucket explicitly, i.e. to share one weight budget between binance and binanceusdm
+        # options['rateLimitGroups'] = {'sapi': {...}, 'fapiPrivate': {...}, 'fapiPublic': 'fapiPrivate'} gives an api
+        # its own bucket (extending self.tokenBucket) or points it at the bucket of another group
+        shared_name = self.get_shared_rate_limit_name()
+        self.throttler = self.create_throttler(self.tokenBucket, shared_name)
+        self.throttlers = {}
+        groups = self.safe_dict(self.options, 'rateLimitGroups', {})
+        for group in groups:
+            if isinstance(groups[group], dict):
+                self.throttlers[group] = self.create_throttler(self.extend(self.tokenBucket, groups[group]), shared_name, group)
+        for group in groups:
+            alias = groups[group]
+            if isinstance(alias, str):
+                if alias not in self.throttlers:
+                    raise ExchangeError(self.id + ' rateLimitGroups["' + group + '"] refers to an unknown group "' + alias + '"')
+                self.throttlers[group] = self.throttlers[alias]
+
+    def get_shared_rate_limit_name(self):
+        shared = self.safe_value(self.options, 'sharedRateLimit')
+        if not shared:
+            return None
+        if isinstance(shared, str):
+            return shared
+        # public endpoints are limited per ip, so unauthenticated instances share a bucket per exchange
+        return self.apiKey if self.apiKey else self.id
+
+    def create_throttler(self, bucket, shared_name=None, group=None):
+        if shared_name is None:
+            return Throttler(bucket, self.asyncio_loop)
+        return get_shared_throttler((shared_name, group), bucket, self.asyncio_loop)
+
+    async def throttle(self, cost=None, api=None, priority=None):
+        throttler = self.throttler
+        if api is not None and self.throttlers:
+            group = api if isinstance(api, str) else '/'.join(api)
+            throttler = self.throttlers.get(group, throttler)
+        request_throttler.set(throttler)
+        return await throttler(cost, priority)
+
+    def adapt_rate_limit(self, headers):
+        # options['adaptiveRateLimit'] = True lets the rate limit headers of the exchange steer the throttler,
+        # the server budget is converted to tokens assuming the configured bucket matches the documented limit
+        if not self.enableRateLimit or not self.safe_bool(self.options, 'adaptiveRateLimit', False):
+            return
+        budget = self.parse_rate_limit_headers(headers)
+        if budget is None:
+            return
+        # not `or`, a throttler with an empty queue is falsy
+        throttler = request_throttler.get()
+        if throttler is None:
+            throttler = self.throttler
+        if budget['scope'] == 'group' and throttler is self.throttler:
+            # the budget of an endpoint only steers the bucket of its options['rateLimitGroups'] entry, never the
+            # bucket of the whole exchange, which the other endpoints with budgets of their own go through as well
+            return
+        tokens_per_unit = budget['window'] * throttler.refill_rate / budget['limit']
+        max_factor = self.safe_number(self.options, 'adaptiveRateLimitMaxFactor', 2)
+        throttler.adapt(budget['remaining'] * tokens_per_unit, budget['period'], max_factor)
 
     def get_session(self):
         return self.session
@@ -109,7 +200,9 @@ class Exchange(BaseExchange):
                 self.asyncio_loop = asyncio.get_running_loop()
             else:
                 self.asyncio_loop = asyncio.get_event_loop()
-            self.throttler.loop = self.asyncio_loop
+            for throttler in [self.throttler] + list(self.throttlers.values()):
+                if throttler.loop is None:
+                    throttler.loop = self.asyncio_loop
 
         if self.ssl_context is None:
             # Create our SSL context object with our CA cert file
@@ -121,6 +214,9 @@ class Exchange(BaseExchange):
             self.session = aiohttp.ClientSession(loop=self.asyncio_loop, connector=self.tcp_connector, trust_env=self.aiohttp_trust_env)
 
     async def close(self):
+        if self.markets_refreshing is not None:
+            self.markets_refreshing.cancel()
+            self.markets_refreshing = None
         await self.ws_close()
         if self.session is not None:
             if self.own_session:
@@ -225,6 +321,7 @@ class Exchange(BaseExchange):
                         headers[header] = raw_headers[header]
                 http_status_code = response.status
                 http_status_text = response.reason
+                self.adapt_rate_limit(headers)
                 http_response = self.on_rest_response(http_status_code, http_status_text, url, method, headers, http_response, request_headers, request_body)
                 json_response = self.parse_json(http_response)
                 if self.enableLastHttpResponse:
@@ -264,16 +361,36 @@ class Exchange(BaseExchange):
         return response.content
 
     async def load_markets_helper(self, reload=False, params={}):
+        if self.markets_owner is not None:
+            return await self.markets_owner.load_markets(reload, params)
         if not reload:
             if self.markets:
                 if not self.markets_by_id:
                     return self.set_markets(self.markets)
                 return self.markets
+            cache = self.read_markets_cache(params)
+            if cache is not None:
+                markets = self.set_cached_markets(cache)
+                if cache['expired']:
+                    self.markets_refreshing = asyncio.ensure_future(self.refresh_markets(params))
+                return markets
+        return await self.load_markets_from_exchange(params)
+
+    async def load_markets_from_exchange(self, params={}):
+        prepared = self.prepare_markets_cache(params)
         currencies = None
         if self.has['fetchCurrencies'] is True:
             currencies = await self.fetch_currencies()
         markets = await self.fetch_markets(params)
-        return self.set_markets(markets, currencies)
+        self.write_markets_cache(prepared, markets, currencies)
+        return self.set_loaded_markets(markets, currencies)
+
+    async def refresh_markets(self, params={}):
+        # replaces expired cached markets in the background, on failure the cached ones stay until the next load
+        try:
+            return await self.load_markets_from_exchange(params)
+        except Exception as e:
+            self.logger.warning('%s failed to refresh the cached markets: %s', self.id, e)
 
     async def load_markets(self, reload=False, params={}):
         if (reload and not self.reloading_markets) or not self.markets_loading:
@@ -354,13 +471,35 @@ class Exchange(BaseExchange):
     def gunzip(data):
         return gunzip(data)
 
+    def is_sorted_order_book_backend(self):
+        # options['ws']['orderBookBackend'] = 'sorted' keeps the price levels in sorted dicts instead of plain lists,
+        # which pays off on full-depth books with thousands of levels
+        backend = self.safe_string(self.safe_dict(self.options, 'ws'), 'orderBookBackend', 'list')
+        if backend not in ['list', 'sorted']:
+            raise NotSupported(self.id + ' orderBookBackend must be "list" or "sorted"')
+        return backend == 'sorted'
+
+    def is_columnar_ohlcv_cache(self):
+        # options['ws']['ohlcvCache'] = 'columnar' keeps the candles of watch_ohlcv in float64 columns instead of a list
+        # per candle, which pays off with thousands of symbols and timeframes, see ColumnarArrayCacheByTimestamp
+        cache = self.safe_string(self.safe_dict(self.options, 'ws'), 'ohlcvCache', 'list')
+        if cache not in ['list', 'columnar']:
+            raise NotSupported(self.id + ' ohlcvCache must be "list" or "columnar"')
+        return cache == 'columnar'
+
     def order_book(self, snapshot={}, depth=None):
+        if self.is_sorted_order_book_backend():
+            return SortedOrderBook(snapshot, depth)
         return OrderBook(snapshot, depth)
 
     def indexed_order_book(self, snapshot={}, depth=None):
+        if self.is_sorted_order_book_backend():
+            return SortedIndexedOrderBook(snapshot, depth)
         return IndexedOrderBook(snapshot, depth)
 
     def counted_order_book(self, snapshot={}, depth=None):
+        if self.is_sorted_order_book_backend():
+            return SortedCountedOrderBook(snapshot, depth)
         return CountedOrderBook(snapshot, depth)
 
     def client(self, url):
@@ -858,16 +997,16 @@ class Exchange(BaseExchange):
         if self.has['fetchTradingLimits']:
             if reload or not ('limitsLoaded' in self.options):
                 response = await self.fetch_trading_limits(symbols)
-                for i in range(0, len(symbols)):
-                    symbol = symbols[i]
-                    self.markets[symbol] = self.deep_extend(self.markets[symbol], response[symbol])
+                self.set_trading_limits(symbols, response)
                 self.options['limitsLoaded'] = self.milliseconds()
         return self.markets
 
     async def fetch2(self, path, api: Any = 'public', method='GET', params={}, headers: Any = None, body: Any = None, config={}):
+        priority = None
+        priority, params = self.handle_rate_limit_priority(api, method, params, config)
         if self.enableRateLimit:
             cost = self.calculate_rate_limiter_cost(api, method, path, params, config)
-            await self.throttle(cost)
+            await self.throttle(cost, api, priority)
         self.lastRestRequestTimestamp = self.milliseconds()
         request = self.sign(path, api, method, params, headers, body)
         self.last_request_headers = request['headers']
@@ -2,6 +2,10 @@ import asyncio
 import collections
 from time import time
 
+from ccxt.base.throttler import PRIORITIES
+
+DEFAULT_PRIORITY = 'marketData'
+
 
 class Throttler:
     def __init__(self, config, loop=None):
@@ -15,36 +19,101 @@ class Throttler:
             'capacity': 1.0,
         }
         self.config.update(config)
-        self.queue = collections.deque()
+        # the configured refill rate, the actual one may be adjusted by adapt()
+        self.refill_rate = self.config['refillRate']
+        self.queues = [collections.deque() for _ in PRIORITIES]
         self.running = False
+        # resolved to interrupt the looper's sleep whenever the queue changes
+        self.wakeup = None
+
+    def get_loop(self):
+        return self.loop if self.loop is not None else asyncio.get_event_loop()
+
+    def notify(self):
+        wakeup = self.wakeup
+        if wakeup is not None and not wakeup.done():
+            wakeup.set_result(None)
+
+    def time_to_next_token(self):
+        # seconds until the bucket is refilled back to zero, the head of the queue
+        # is released as soon as there are no outstanding tokens left to pay back
+        milliseconds = -self.config['tokens'] / self.config['refillRate'] if self.config['refillRate'] > 0 else 0
+        return max(milliseconds / 1000, self.config['delay'])
+
+    async def sleep(self, seconds):
+        loop = self.get_loop()
+        self.wakeup = loop.create_future()
+        handle = loop.call_later(seconds, self.notify)
+        try:
+            await self.wakeup
+        finally:
+            handle.cancel()
+            self.wakeup = None
+
+    def adapt(self, remaining, period, max_factor=1.0):
+        # spread the budget the server has left for the current window over the rest of that window,
+        # never refilling faster than max_factor times the configured rate
+        if remaining <= 0:
+            # exhausted, hold the queue until the window resets
+            self.config['refillRate'] = self.refill_rate
+            self.config['tokens'] = min(self.config['tokens'], -period * self.refill_rate)
+        else:
+            self.config['refillRate'] = min(remaining / period, self.refill_rate * max_factor)
+        self.notify()
+
+    def __len__(self):
+        return sum(len(queue) for queue in self.queues)
+
+    def head(self):
+        for queue in self.queues:
+            if queue:
+                return queue
+        return None
 
     async def looper(self):
         last_timestamp = time() * 1000
         while self.running:
-            future, cost = self.queue[0]
+            queue = self.head()
+            future, cost = queue[0]
             cost = self.config['cost'] if cost is None else cost
             if self.config['tokens'] >= 0:
                 self.config['tokens'] -= cost
                 if not future.done():
                     future.set_result(None)
-                self.queue.popleft()
+                queue.popleft()
                 # context switch
                 await asyncio.sleep(0)
-                if len(self.queue) == 0:
+                if self.head() is None:
                     self.running = False
             else:
-                await asyncio.sleep(self.config['delay'])
+                await self.sleep(self.time_to_next_token())
                 now = time() * 1000
                 elapsed = now - last_timestamp
                 last_timestamp = now
                 self.config['tokens'] = min(self.config['tokens'] + elapsed * self.config['refillRate'], self.config['capacity'])
 
-    def __call__(self, cost=None):
+    def __call__(self, cost=None, priority=None):
         future = asyncio.Future()
-        if len(self.queue) > self.config['maxCapacity']:
+        if len(self) > self.config['maxCapacity']:
             raise RuntimeError('throttle queue is over maxCapacity (' + str(int(self.config['maxCapacity'])) + '), see https://github.com/ccxt/ccxt/issues/11645#issuecomment-1195695526')
-        self.queue.append((future, cost))
+        lane = PRIORITIES.index(DEFAULT_PRIORITY if priority is None else priority)
+        self.queues[lane].append((future, cost))
         if not self.running:
             self.running = True
             asyncio.ensure_future(self.looper(), loop=self.loop)
+        else:
+            self.notify()
         return future
+
+
+# process-wide token buckets that several exchange instances can attach to,
+# keyed by (name, group), see Exchange.init_throttler
+shared_throttlers = {}
+
+
+def get_shared_throttler(key, config, loop=None):
+    throttler = shared_throttlers.get(key)
+    if throttler is None:
+        throttler = Throttler(config, loop)
+        shared_throttlers[key] = throttler
+    return throttler
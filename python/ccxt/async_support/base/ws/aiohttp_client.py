@@ -9,9 +9,9 @@ except ImportError:
 import json
 from asyncio import sleep, ensure_future
 from aiohttp import WSMsgType
-from .functions import milliseconds, iso8601, is_json_encoded_object
+from .functions import milliseconds, iso8601, is_json_encoded_object, is_json_encoded_bytes
 from ccxt.async_support.base.ws.client import Client
-from ccxt.async_support.base.ws.functions import gunzip, inflate
+from ccxt.async_support.base.ws.functions import gunzip_bytes, inflate
 from ccxt import NetworkError, RequestTimeout, ExchangeClosedByUser
 
 
@@ -29,11 +29,17 @@ class AiohttpClient(Client):
     def handle_text_or_binary_message(self, data):
         if self.verbose:
             self.log(iso8601(milliseconds()), 'message', data)
-        if isinstance(data, bytes):
-            data = data.decode()
-        # decoded = json.loads(data) if is_json_encoded_object(data) else data
         decode = None
-        if is_json_encoded_object(data):
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            # binary frames are handed to the json decoder as they are, without a round-trip through str
+            if is_json_encoded_bytes(data):
+                if orjson is None:
+                    decode = json.loads(bytes(data))
+                else:
+                    decode = orjson.loads(data)
+            else:
+                decode = bytes(data).decode()
+        elif is_json_encoded_object(data):
             if orjson is None:
                 decode = json.loads(data)
             else:
@@ -49,7 +55,7 @@ class AiohttpClient(Client):
         elif message.type == WSMsgType.BINARY:
             data = message.data
             if self.gunzip:
-                data = gunzip(data)
+                data = gunzip_bytes(data)
             elif self.inflate:
                 data = inflate(data)
             self.handle_text_or_binary_message(data)
@@ -1,4 +1,22 @@
 import collections
+import collections.abc
+from array import array
+import math
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from ccxt.base.errors import NotSupported
+from ccxt.base.exchange import Exchange
+
+iso8601 = Exchange.iso8601
+
+# the values of the absent keys of a CompactTrade, of the datetime computed on access and of empty fees
+_MISSING = object()
+_LAZY = object()
+_NO_FEES = object()
 
 
 class Delegate:
@@ -96,6 +114,15 @@ class ArrayCache(BaseCache):
         self._new_updates_by_symbol[item['symbol']] = self._new_updates_by_symbol.get(item['symbol'], 0) + 1
         self._all_new_updates = (self._all_new_updates or 0) + 1
 
+    def append_many(self, items):
+        # a snapshot or a burst of updates
+        for item in items:
+            self.append(item)
+
+    # support transpiled camelCase calls
+    def appendMany(self, items):
+        return self.append_many(items)
+
 
 class ArrayCacheByTimestamp(BaseCache):
     def __init__(self, max_size=None):
@@ -129,85 +156,508 @@ class ArrayCacheByTimestamp(BaseCache):
         self._new_updates = len(self._size_tracker)
 
 
-class ArrayCacheBySymbolById(ArrayCache):
+class ColumnarArrayCacheByTimestamp(ArrayCacheByTimestamp):
+    # the candles as six float64 columns instead of a list per candle, the rows are built on access
+    # a bounded cache writes past its window into a slack of max_size // 4 rows and then moves the window back
+    # to the start of the columns, so that the window is always contiguous and columns() is zero-copy
+    fields = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+
     def __init__(self, max_size=None):
-        super(ArrayCacheBySymbolById, self).__init__(max_size)
-        self._nested_new_updates_by_symbol = True
-        self.hashmap = {}
-        self._index = collections.deque([], max_size)
+        list.__init__(self)
+        self.max_size = max_size
+        self._size_tracker = set()
+        self._new_updates = 0
+        self._clear_updates = False
+        self._init_columns()
+
+    @classmethod
+    def convert(cls, cache):
+        # turns an ArrayCacheByTimestamp into a columnar cache in place, for the references held by the handlers
+        candles = list(cache)
+        cache.__class__ = cls
+        del cache._deque
+        del cache.hashmap
+        cache._init_columns()
+        for candle in candles:
+            cache._store(candle)
+        return cache
+
+    def _init_columns(self):
+        self._columns = [array('d') for _ in self.fields]
+        self._start = 0
+        self._end = 0
+        self._sorted = True
+        self._capacity = None if self.max_size is None else self.max_size + max(self.max_size // 4, 16)
+
+    def _row(self, index):
+        # missing values are stored as nan
+        row = [value if value == value else None for value in [column[index] for column in self._columns]]
+        if row[0] is not None:
+            row[0] = int(row[0])
+        return row
+
+    def _index(self, item):
+        length = self._end - self._start
+        if isinstance(item, slice):
+            return range(length)[item]
+        if item < 0:
+            item += length
+        if item < 0 or item >= length:
+            raise IndexError('cache index out of range')
+        return self._start + item
+
+    def _find(self, timestamp):
+        # the absolute index of a candle, the candles are usually appended in the order of their timestamps
+        timestamps = self._columns[0]
+        if self._sorted:
+            low = self._start
+            high = self._end
+            while low < high:
+                middle = (low + high) // 2
+                if timestamps[middle] < timestamp:
+                    low = middle + 1
+                else:
+                    high = middle
+            return low if low < self._end and timestamps[low] == timestamp else None
+        for index in range(self._start, self._end):
+            if timestamps[index] == timestamp:
+                return index
+        return None
+
+    def _write(self, index, candle):
+        columns = self._columns
+        if len(candle) == 6 and None not in candle:
+            timestamps, opens, highs, lows, closes, volumes = columns
+            timestamps[index], opens[index], highs[index], lows[index], closes[index], volumes[index] = candle
+            return
+        for i in range(len(candle)):
+            value = candle[i]
+            columns[i][index] = math.nan if value is None else value
+
+    def _push(self, candle):
+        columns = self._columns
+        if self._end - self._start == self.max_size:
+            self._start += 1
+        if self._end == self._capacity:
+            # moves the window to the start of the columns
+            length = self._end - self._start
+            for column in columns:
+                column[0:length] = column[self._start:self._end]
+            self._start = 0
+            self._end = length
+        index = self._end
+        if index == len(columns[0]):
+            for i in range(6):
+                # a view held by the user pins the size of a column, which is copied then
+                try:
+                    columns[i].append(math.nan)
+                except BufferError:
+                    columns[i] = array('d', columns[i])
+                    columns[i].append(math.nan)
+        else:
+            for column in columns:
+                column[index] = math.nan
+        self._write(index, candle)
+        self._end = index + 1
+
+    def _store(self, candle):
+        if len(candle) > 6:
+            raise NotSupported('ColumnarArrayCacheByTimestamp stores [timestamp, open, high, low, close, volume] candles')
+        timestamp = candle[0]
+        end = self._end
+        if end > self._start:
+            last = self._columns[0][end - 1]
+            if last == timestamp:
+                # an update of the last candle
+                self._write(end - 1, candle)
+                return
+            if timestamp < last or not self._sorted:
+                index = self._find(timestamp)
+                if index is not None:
+                    self._write(index, candle)
+                    return
+                self._sorted = self._sorted and timestamp > last
+        self._push(candle)
 
     def append(self, item):
-        by_id = self.hashmap.setdefault(item['symbol'], {})
-        if item['id'] in by_id:
-            reference = by_id[item['id']]
-            if reference != item:
-                reference.update(item)
-            item = reference
-            index = self._index.index(item['id'])
-            del self._deque[index]
-            del self._index[index]
+        self._store(item)
+        if self._clear_updates:
+            self._clear_updates = False
+            self._size_tracker.clear()
+        self._size_tracker.add(item[0])
+        self._new_updates = len(self._size_tracker)
+
+    def columns(self):
+        # zero-copy memoryviews of the float64 columns by field, valid until the next update
+        start = self._start
+        end = self._end
+        return {field: memoryview(column)[start:end] for field, column in zip(self.fields, self._columns)}
+
+    def as_arrays(self):
+        # zero-copy numpy views of the columns by field, valid until the next update, numpy is optional
+        if numpy is None:
+            raise NotSupported('as_arrays() requires the numpy package, pip install numpy')
+        return {field: numpy.frombuffer(view, numpy.float64) for field, view in self.columns().items()}
+
+    def __iter__(self):
+        for index in range(self._start, self._end):
+            yield self._row(index)
+
+    def __reversed__(self):
+        for index in range(self._end - 1, self._start - 1, -1):
+            yield self._row(index)
+
+    def __len__(self):
+        return self._end - self._start
+
+    def __contains__(self, item):
+        return any(row == item for row in self)
+
+    def __getitem__(self, item):
+        index = self._index(item)
+        if isinstance(index, range):
+            return [self._row(self._start + i) for i in index]
+        return self._row(index)
+
+    def __setitem__(self, index, item):
+        index = self._index(index)
+        self._write(index, item)
+        self._sorted = False
+
+    def __delitem__(self, index):
+        index = self._index(index)
+        for i in range(6):
+            try:
+                del self._columns[i][index]
+            except BufferError:
+                self._columns[i] = array('d', self._columns[i])
+                del self._columns[i][index]
+        self._end -= 1
+
+    def pop(self, index=-1):
+        row = self[index]
+        del self[index]
+        return row
+
+    def clear(self):
+        self._init_columns()
+
+
+class ConvertedCaches(dict):
+    # the caches of the transpiled handlers by symbol, and by timeframe or another nested key,
+    # every cache is passed through convert() as it is stored
+    def __init__(self, caches={}):
+        super(ConvertedCaches, self).__init__()
+        for key in caches:
+            self[key] = caches[key]
+
+    def nested(self, caches):
+        return type(self)(caches)
+
+    def convert(self, cache):
+        return cache
+
+    def __setitem__(self, key, value):
+        if type(value) is dict:
+            value = self.nested(value)
         else:
-            by_id[item['id']] = item
-        if len(self._deque) == self._deque.maxlen:
-            delete_item = self._deque.popleft()
-            self._index.popleft()
-            del self.hashmap[delete_item['symbol']][delete_item['id']]
-        self._deque.append(item)
-        self._index.append(item['id'])
-        if self._clear_all_updates:
-            self._clear_all_updates = False
-            self._clear_updates_by_symbol.clear()
-            self._all_new_updates = 0
-            self._new_updates_by_symbol.clear()
-        if item['symbol'] not in self._new_updates_by_symbol:
-            self._new_updates_by_symbol[item['symbol']] = set()
-        if self._clear_updates_by_symbol.get(item['symbol']):
-            self._clear_updates_by_symbol[item['symbol']] = False
-            self._new_updates_by_symbol[item['symbol']].clear()
-        id_set = self._new_updates_by_symbol[item['symbol']]
-        before_length = len(id_set)
-        id_set.add(item['id'])
-        after_length = len(id_set)
-        self._all_new_updates = (self._all_new_updates or 0) + (after_length - before_length)
+            value = self.convert(value)
+        super(ConvertedCaches, self).__setitem__(key, value)
+
+
+class ColumnarCaches(ConvertedCaches):
+    # self.ohlcvs with options['ws']['ohlcvCache'] = 'columnar', the handlers store an ArrayCacheByTimestamp
+    # by symbol and timeframe, it becomes a columnar cache in place
+    def convert(self, cache):
+        if type(cache) is ArrayCacheByTimestamp:
+            ColumnarArrayCacheByTimestamp.convert(cache)
+        return cache
+
+
+class CompactTrade(collections.abc.MutableMapping):
+    # a unified trade in slots instead of a dict, the datetime is computed from the timestamp on access
+    # keys other than the unified ones are kept in a dict of their own
+    # it is a Mapping and not a dict, isinstance(trade, dict) is False and json.dumps() needs default=dict,
+    # exchange.json(), extend() and deep_extend() take it as the dict it stands for
+    __slots__ = ['info', 'timestamp', '_datetime', 'symbol', 'id', 'order', 'type', 'side', 'takerOrMaker', 'price', 'amount', 'cost', 'fee', 'fees', '_extra']
+    unified_keys = ['info', 'timestamp', 'datetime', 'symbol', 'id', 'order', 'type', 'side', 'takerOrMaker', 'price', 'amount', 'cost', 'fee', 'fees']
+    unified_key_set = frozenset(unified_keys)
+    slot_keys = unified_key_set - {'datetime'}
+
+    def __init__(self, trade, keep_info=True):
+        missing = _MISSING
+        get = trade.get
+        self.info = get('info', missing) if keep_info else None
+        timestamp = get('timestamp', missing)
+        self.timestamp = timestamp
+        datetime = get('datetime', missing)
+        self._datetime = _LAZY if datetime is not missing and type(timestamp) is int else datetime
+        self.symbol = get('symbol', missing)
+        self.id = get('id', missing)
+        self.order = get('order', missing)
+        self.type = get('type', missing)
+        self.side = get('side', missing)
+        self.takerOrMaker = get('takerOrMaker', missing)
+        self.price = get('price', missing)
+        self.amount = get('amount', missing)
+        self.cost = get('cost', missing)
+        self.fee = get('fee', missing)
+        fees = get('fees', missing)
+        # most trades have no fees, the list is created on access
+        self.fees = _NO_FEES if fees == [] else fees
+        self._extra = None
+        if not CompactTrade.unified_key_set.issuperset(trade):
+            self._extra = {key: trade[key] for key in trade if key not in CompactTrade.unified_key_set}
+
+    def __getitem__(self, key):
+        if key in CompactTrade.slot_keys:
+            value = getattr(self, key)
+            if value is _MISSING:
+                raise KeyError(key)
+            if value is _NO_FEES:
+                value = self.fees = []
+            return value
+        if key == 'datetime':
+            value = self._datetime
+            if value is _LAZY:
+                return iso8601(self.timestamp)
+            if value is _MISSING:
+                raise KeyError(key)
+            return value
+        if self._extra is None:
+            raise KeyError(key)
+        return self._extra[key]
+
+    def __setitem__(self, key, value):
+        if key in CompactTrade.slot_keys:
+            setattr(self, key, value)
+        elif key == 'datetime':
+            self._datetime = value
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key):
+        if key in CompactTrade.slot_keys:
+            if getattr(self, key) is _MISSING:
+                raise KeyError(key)
+            setattr(self, key, _MISSING)
+        elif key == 'datetime':
+            if self._datetime is _MISSING:
+                raise KeyError(key)
+            self._datetime = _MISSING
+        else:
+            if self._extra is None:
+                raise KeyError(key)
+            del self._extra[key]
+
+    def __iter__(self):
+        for key in CompactTrade.unified_keys:
+            if (self._datetime if key == 'datetime' else getattr(self, key)) is not _MISSING:
+                yield key
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def __repr__(self):
+        return repr(dict(self))
+
+    def __getstate__(self):
+        state = dict(self)
+        lazy = self._datetime is _LAZY
+        if lazy:
+            del state['datetime']
+        return state, lazy
+
+    def __setstate__(self, state):
+        trade, lazy = state
+        self.__init__(trade)
+        if lazy:
+            self._datetime = _LAZY
+        elif 'datetime' in trade:
+            self._datetime = trade['datetime']
+
+
+class CompactTradesArrayCache(ArrayCache):
+    # an ArrayCache of CompactTrade records
+    keep_info = True
+
+    @classmethod
+    def convert(cls, cache, keep_info=True):
+        cache.__class__ = cls
+        cache.keep_info = keep_info
+        cache._deque = collections.deque([cache.compact(trade) for trade in cache._deque], cache._deque.maxlen)
+        return cache
+
+    def compact(self, trade):
+        return CompactTrade(trade, self.keep_info) if type(trade) is dict else trade
+
+    def append(self, item):
+        if type(item) is dict:
+            item = CompactTrade(item, self.keep_info)
+        ArrayCache.append(self, item)
+
+
+class CompactTradeCaches(ConvertedCaches):
+    # self.trades with options['ws']['compactTrades'] = True, the ArrayCache of a symbol keeps CompactTrade records,
+    # options['ws']['compactTradesInfo'] = False drops the raw info of the trades
+    def __init__(self, caches={}, keep_info=True):
+        self.keep_info = keep_info
+        super(CompactTradeCaches, self).__init__(caches)
 
+    def nested(self, caches):
+        return CompactTradeCaches(caches, self.keep_info)
+
+    def convert(self, cache):
+        if type(cache) is ArrayCache:
+            CompactTradesArrayCache.convert(cache, self.keep_info)
+        return cache
+
+
+class ArrayCacheBySymbolByKey(ArrayCache):
+    # the items of a symbol are identified by the value of _key, an update of an item replaces it in place
+    _key = None
 
-class ArrayCacheBySymbolBySide(ArrayCache):
     def __init__(self, max_size=None):
-        super(ArrayCacheBySymbolBySide, self).__init__(max_size)
+        super(ArrayCacheBySymbolByKey, self).__init__(max_size)
         self._nested_new_updates_by_symbol = True
         self.hashmap = {}
-        self._index = collections.deque([], max_size)
+        # the items by (symbol, key) in the order of their last update, so that an update moves an item to the end
+        # and the oldest item is evicted in constant time, _deque is a list of them built on the first read after a change
+        self._items = collections.OrderedDict()
+        self._deque = None
+
+    def _values(self):
+        if self._deque is None:
+            self._deque = list(self._items.values())
+        return self._deque
+
+    def __iter__(self):
+        return iter(self._values())
+
+    def __reversed__(self):
+        return reversed(self._values())
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, item):
+        return item in self._values()
+
+    def __getitem__(self, item):
+        return self._values()[item]
+
+    def __setitem__(self, index, item):
+        previous = self._values()[index]
+        self._items[(previous['symbol'], previous[self._key])] = item
+        self.hashmap[previous['symbol']][previous[self._key]] = item
+        self._deque[index] = item
+
+    def __delitem__(self, index):
+        previous = self._values()[index]
+        del self._items[(previous['symbol'], previous[self._key])]
+        del self.hashmap[previous['symbol']][previous[self._key]]
+        self._deque = None
+
+    def pop(self, index=-1):
+        item = self._values()[index]
+        del self[index]
+        return item
+
+    def clear(self):
+        self._items.clear()
+        self.hashmap.clear()
+        self._deque = None
 
     def append(self, item):
-        by_side = self.hashmap.setdefault(item['symbol'], {})
-        if item['side'] in by_side:
-            reference = by_side[item['side']]
+        symbol = item['symbol']
+        value = item[self._key]
+        by_key = self.hashmap.setdefault(symbol, {})
+        key = (symbol, value)
+        if value in by_key:
+            reference = by_key[value]
             if reference != item:
                 reference.update(item)
             item = reference
-            index = self._index.index(item['symbol'] + item['side'])
-            del self._deque[index]
-            del self._index[index]
+            self._items.move_to_end(key)
+            self._deque = None
         else:
-            by_side[item['side']] = item
-        if len(self._deque) == self._deque.maxlen:
-            delete_item = self._deque.popleft()
-            self._index.popleft()
-            del self.hashmap[delete_item['symbol']][delete_item['side']]
-        self._deque.append(item)
-        self._index.append(item['symbol'] + item['side'])
+            by_key[value] = item
+            if len(self._items) == self.max_size:
+                delete_symbol, delete_value = self._items.popitem(last=False)[0]
+                del self.hashmap[delete_symbol][delete_value]
+                self._deque = None
+            elif self._deque is not None:
+                self._deque.append(item)
+            self._items[key] = item
         if self._clear_all_updates:
             self._clear_all_updates = False
             self._clear_updates_by_symbol.clear()
             self._all_new_updates = 0
             self._new_updates_by_symbol.clear()
-        if item['symbol'] not in self._new_updates_by_symbol:
-            self._new_updates_by_symbol[item['symbol']] = set()
-        if self._clear_updates_by_symbol.get(item['symbol']):
-            self._clear_updates_by_symbol[item['symbol']] = False
-            self._new_updates_by_symbol[item['symbol']].clear()
-        side_set = self._new_updates_by_symbol[item['symbol']]
-        before_length = len(side_set)
-        side_set.add(item['side'])
-        after_length = len(side_set)
+        if symbol not in self._new_updates_by_symbol:
+            self._new_updates_by_symbol[symbol] = set()
+        if self._clear_updates_by_symbol.get(symbol):
+            self._clear_updates_by_symbol[symbol] = False
+            self._new_updates_by_symbol[symbol].clear()
+        key_set = self._new_updates_by_symbol[symbol]
+        before_length = len(key_set)
+        key_set.add(value)
+        after_length = len(key_set)
         self._all_new_updates = (self._all_new_updates or 0) + (after_length - before_length)
+
+    def append_many(self, items):
+        # a snapshot or a burst of updates merged in one pass, the list of the items is rebuilt once on the next read
+        if not items:
+            return
+        if self._clear_all_updates:
+            self._clear_all_updates = False
+            self._clear_updates_by_symbol.clear()
+            self._all_new_updates = 0
+            self._new_updates_by_symbol.clear()
+        all_new_updates = self._all_new_updates or 0
+        for item in items:
+            symbol = item['symbol']
+            value = item[self._key]
+            by_key = self.hashmap.setdefault(symbol, {})
+            key = (symbol, value)
+            if value in by_key:
+                reference = by_key[value]
+                if reference != item:
+                    reference.update(item)
+                self._items.move_to_end(key)
+            else:
+                by_key[value] = item
+                if len(self._items) == self.max_size:
+                    delete_symbol, delete_value = self._items.popitem(last=False)[0]
+                    del self.hashmap[delete_symbol][delete_value]
+                self._items[key] = item
+            key_set = self._new_updates_by_symbol.get(symbol)
+            if key_set is None:
+                key_set = self._new_updates_by_symbol[symbol] = set()
+            if self._clear_updates_by_symbol.get(symbol):
+                self._clear_updates_by_symbol[symbol] = False
+                key_set.clear()
+            before_length = len(key_set)
+            key_set.add(value)
+            all_new_updates += len(key_set) - before_length
+        self._all_new_updates = all_new_updates
+        self._deque = None
+
+
+class ArrayCacheBySymbolById(ArrayCacheBySymbolByKey):
+    _key = 'id'
+
+
+class ArrayCacheBySymbolBySide(ArrayCacheBySymbolByKey):
+    _key = 'side'
@@ -16,6 +16,9 @@ class Client(object):
     rejections = {}
     message_queue = {}
     useMessageQueue = False
+    batchMessages = False  # drain all buffered frames in one callback and resolve each message hash once per batch
+    batching = False
+    pending_resolves = {}
     on_message_callback = None
     on_error_callback = None
     on_close_callback = None
@@ -47,6 +50,7 @@ class Client(object):
             'futures': {},
             'subscriptions': {},
             'rejections': {},
+            'pending_resolves': {},
             'on_message_callback': on_message_callback,
             'on_error_callback': on_error_callback,
             'on_close_callback': on_close_callback,
@@ -83,7 +87,10 @@ class Client(object):
         if self.verbose and message_hash is None:
             self.log(iso8601(milliseconds()), 'resolve received None messageHash')
 
-        if self.useMessageQueue:
+        if self.batching and not self.useMessageQueue:
+            # only the latest result of the batch is delivered, see flush_resolves
+            self.pending_resolves[message_hash] = result
+        elif self.useMessageQueue:
             if message_hash not in self.message_queue:
                 self.message_queue[message_hash] = deque(maxlen=10)
             queue = self.message_queue[message_hash]
@@ -99,6 +106,12 @@ class Client(object):
                 del self.futures[message_hash]
         return result
 
+    def flush_resolves(self):
+        pending = self.pending_resolves
+        self.pending_resolves = {}
+        for message_hash in pending:
+            self.resolve(pending[message_hash], message_hash)
+
     def reject(self, result, message_hash=None):
         if message_hash:
             if message_hash in self.futures:
@@ -186,6 +199,7 @@ class Client(object):
 
     def reset(self, error):
         self.message_queue = {}
+        self.pending_resolves = {}
         self.reject(error)
 
     async def ping_loop(self):
@@ -17,6 +17,20 @@ class FastClient(AiohttpClient):
         self.stack = collections.deque()
         self.callback_scheduled = False
 
+    def drain_stack(self):
+        # handles every buffered frame in one go, consumers are woken up once per message hash afterwards
+        self.batching = True
+        try:
+            while self.stack:
+                message = self.stack.popleft()
+                try:
+                    self.handle_message(message)
+                except Exception as error:
+                    self.reject(error)
+        finally:
+            self.batching = False
+            self.flush_resolves()
+
     def receive_loop(self):
         def handler():
             if not self.stack:
@@ -29,10 +43,14 @@ class FastClient(AiohttpClient):
                 self.reject(error)
             self.asyncio_loop.call_soon(handler)
 
+        def batch_handler():
+            self.callback_scheduled = False
+            self.drain_stack()
+
         def feed_data(message, size):
             if not self.callback_scheduled:
                 self.callback_scheduled = True
-                self.asyncio_loop.call_soon(handler)
+                self.asyncio_loop.call_soon(batch_handler if self.batchMessages else handler)
             self.stack.append(message)
 
         def feed_eof():
@@ -43,6 +61,8 @@ class FastClient(AiohttpClient):
 
         def wrapper(func):
             def parse_frame(buf):
+                if self.batchMessages:
+                    self.drain_stack()
                 while self.stack:
                     self.handle_message(self.stack.popleft())
                 return func(buf)
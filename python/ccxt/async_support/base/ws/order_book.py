@@ -32,6 +32,14 @@ class OrderBook(dict):
         self['bids'].limit()
         return self
 
+    def as_arrays(self, depth=None):
+        # contiguous float64 columns for vectorized analytics, {'bids': (prices, sizes), 'asks': (prices, sizes)}
+        # numpy is optional, the columns are cached until the side changes
+        return {
+            'bids': self['bids'].as_arrays(depth),
+            'asks': self['asks'].as_arrays(depth),
+        }
+
     def reset(self, snapshot={}):
         self['asks']._index.clear()
         self['asks'].clear()
@@ -76,3 +84,33 @@ class IndexedOrderBook(OrderBook):
             'bids': order_book_side.IndexedBids(snapshot.get('bids', []), depth),
         })
         super(IndexedOrderBook, self).__init__(copy, depth)
+
+# -----------------------------------------------------------------------------
+# the same books backed by sorted dicts, see options['ws']['orderBookBackend']
+
+
+class SortedOrderBook(OrderBook):
+    def __init__(self, snapshot={}, depth=None):
+        copy = Exchange.extend(snapshot, {
+            'asks': order_book_side.SortedAsks(snapshot.get('asks', []), depth),
+            'bids': order_book_side.SortedBids(snapshot.get('bids', []), depth),
+        })
+        super(SortedOrderBook, self).__init__(copy, depth)
+
+
+class SortedCountedOrderBook(OrderBook):
+    def __init__(self, snapshot={}, depth=None):
+        copy = Exchange.extend(snapshot, {
+            'asks': order_book_side.SortedCountedAsks(snapshot.get('asks', []), depth),
+            'bids': order_book_side.SortedCountedBids(snapshot.get('bids', []), depth),
+        })
+        super(SortedCountedOrderBook, self).__init__(copy, depth)
+
+
+class SortedIndexedOrderBook(OrderBook):
+    def __init__(self, snapshot={}, depth=None):
+        copy = Exchange.extend(snapshot, {
+            'asks': order_book_side.SortedIndexedAsks(snapshot.get('asks', []), depth),
+            'bids': order_book_side.SortedIndexedBids(snapshot.get('bids', []), depth),
+        })
+        super(SortedIndexedOrderBook, self).__init__(copy, depth)
@@ -3,6 +3,18 @@
 import sys
 import bisect
 
+try:
+    from sortedcontainers import SortedDict
+except ImportError:
+    SortedDict = None
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from ccxt.base.errors import NotSupported
+
 """Author: Carlo Revelli"""
 """Fast bisect bindings"""
 """https://github.com/python/cpython/blob/master/Modules/_bisectmodule.c"""
@@ -18,6 +30,8 @@ class OrderBookSide(list):
         self._n = sys.maxsize
         # parallel to self
         self._index = []
+        # (prices, sizes) numpy columns, reset on every change, see as_arrays
+        self._arrays = None
         for delta in deltas:
             self.storeArray(list(delta))
 
@@ -28,6 +42,7 @@ class OrderBookSide(list):
         price = delta[0]
         size = delta[1]
         index_price = -price if self.side else price
+        self._arrays = None
         index = bisect.bisect_left(self._index, index_price)
         if size:
             if index < len(self._index) and self._index[index] == index_price:
@@ -44,6 +59,8 @@ class OrderBookSide(list):
 
     def limit(self):
         difference = len(self) - self._depth
+        if difference > 0:
+            self._arrays = None
         for _ in range(difference):
             self.remove_index(self.pop())
             self._index.pop()
@@ -51,6 +68,24 @@ class OrderBookSide(list):
     def remove_index(self, order):
         pass
 
+    def clear(self):
+        self._arrays = None
+        super(OrderBookSide, self).clear()
+
+    def as_arrays(self, depth=None):
+        # contiguous float64 price and size columns, built on first access after a change
+        if numpy is None:
+            raise NotSupported('as_arrays() requires the numpy package, pip install ccxt[numpy]')
+        if self._arrays is None:
+            length = len(self)
+            prices = numpy.fromiter((level[0] for level in self), numpy.float64, length)
+            sizes = numpy.fromiter((level[1] for level in self), numpy.float64, length)
+            self._arrays = (prices, sizes)
+        prices, sizes = self._arrays
+        if depth is not None:
+            return prices[:depth], sizes[:depth]
+        return prices, sizes
+
     def __len__(self):
         length = super(OrderBookSide, self).__len__()
         return min(length, self._n)
@@ -85,6 +120,7 @@ class CountedOrderBookSide(OrderBookSide):
         size = delta[1]
         count = delta[2]
         index_price = -price if self.side else price
+        self._arrays = None
         index = bisect.bisect_left(self._index, index_price)
         if size and count:
             if index < len(self._index) and self._index[index] == index_price:
@@ -117,6 +153,7 @@ class IndexedOrderBookSide(OrderBookSide):
             index_price = None
         size = delta[1]
         order_id = delta[2]
+        self._arrays = None
         if size:
             if order_id in self._hashmap:
                 old_price = self._hashmap[order_id]
@@ -163,6 +200,133 @@ class IndexedOrderBookSide(OrderBookSide):
     def store(self, price, size, order_id):
         self.storeArray([price, size, order_id])
 
+# -----------------------------------------------------------------------------
+# price levels kept in a sorted dict, O(log n) per delta instead of two O(n) list inserts/deletes
+# reads go through the overridden list methods, the underlying list itself is only refreshed by limit(),
+# which is what C-level consumers like json.dumps see
+
+
+class SortedOrderBookSide(OrderBookSide):
+    def __init__(self, deltas=[], depth=None):
+        if SortedDict is None:
+            raise NotSupported('the sorted order book backend requires the sortedcontainers package, pip install ccxt[sorted]')
+        self._levels = SortedDict()
+        self._dirty = False
+        super(SortedOrderBookSide, self).__init__(deltas, depth)
+
+    def storeArray(self, delta):
+        price = delta[0]
+        size = delta[1]
+        index_price = -price if self.side else price
+        self._dirty = True
+        self._arrays = None
+        if size:
+            level = self._levels.get(index_price)
+            if level is None:
+                self._levels[index_price] = delta
+            else:
+                level[1] = size
+        else:
+            self._levels.pop(index_price, None)
+
+    def limit(self):
+        if len(self._levels) > self._depth:
+            self._arrays = None
+        while len(self._levels) > self._depth:
+            self.remove_index(self._levels.popitem()[1])
+        if self._dirty:
+            self._dirty = False
+            list.__setitem__(self, slice(None), map(self._levels.__getitem__, self._levels))
+
+    def clear(self):
+        self._levels.clear()
+        self._dirty = False
+        super(SortedOrderBookSide, self).clear()
+
+    def __len__(self):
+        return min(len(self._levels), self._n)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return self._levels.values()[item]
+        return self._levels.peekitem(item)[1]
+
+    def __iter__(self):
+        return iter(self._levels.values())
+
+    def __reversed__(self):
+        return reversed(self._levels.values())
+
+    def __contains__(self, item):
+        return any(level == item for level in self._levels.values())
+
+
+class SortedCountedOrderBookSide(SortedOrderBookSide):
+    def storeArray(self, delta):
+        price = delta[0]
+        size = delta[1]
+        count = delta[2]
+        index_price = -price if self.side else price
+        self._dirty = True
+        self._arrays = None
+        if size and count:
+            level = self._levels.get(index_price)
+            if level is None:
+                self._levels[index_price] = delta
+            else:
+                level[1] = size
+                level[2] = count
+        else:
+            self._levels.pop(index_price, None)
+
+    def store(self, price, size, count):
+        self.storeArray([price, size, count])
+
+
+class SortedIndexedOrderBookSide(SortedOrderBookSide):
+    # keyed by (price, order id), orders at the same price are sorted by id like in IndexedOrderBookSide
+    def __init__(self, deltas=[], depth=None):
+        self._hashmap = {}
+        super(SortedIndexedOrderBookSide, self).__init__(deltas, depth)
+
+    def storeArray(self, delta):
+        price = delta[0]
+        if price is not None:
+            index_price = -price if self.side else price
+        else:
+            index_price = None
+        size = delta[1]
+        order_id = delta[2]
+        self._dirty = True
+        self._arrays = None
+        if size:
+            if order_id in self._hashmap:
+                old_price = self._hashmap[order_id]
+                index_price = index_price or old_price
+                # in case the price is not defined
+                delta[0] = abs(index_price)
+                if index_price == old_price:
+                    self._levels[(index_price, order_id)] = delta
+                    return
+                del self._levels[(old_price, order_id)]
+            self._hashmap[order_id] = index_price
+            self._levels[(index_price, order_id)] = delta
+        elif order_id in self._hashmap:
+            old_price = self._hashmap.pop(order_id)
+            del self._levels[(old_price, order_id)]
+
+    def clear(self):
+        self._hashmap.clear()
+        super(SortedIndexedOrderBookSide, self).clear()
+
+    def remove_index(self, order):
+        order_id = order[2]
+        if order_id in self._hashmap:
+            del self._hashmap[order_id]
+
+    def store(self, price, size, order_id):
+        self.storeArray([price, size, order_id])
+
 # -----------------------------------------------------------------------------
 # a more elegant syntax is possible here, but native inheritance is portable
 
@@ -172,3 +336,9 @@ class CountedAsks(CountedOrderBookSide): side = False                       # no
 class CountedBids(CountedOrderBookSide): side = True                        # noqa
 class IndexedAsks(IndexedOrderBookSide): side = False                       # noqa
 class IndexedBids(IndexedOrderBookSide): side = True                        # noqa
+class SortedAsks(SortedOrderBookSide): side = False                         # noqa
+class SortedBids(SortedOrderBookSide): side = True                          # noqa
+class SortedCountedAsks(SortedCountedOrderBookSide): side = False           # noqa
+class SortedCountedBids(SortedCountedOrderBookSide): side = True            # noqa
+class SortedIndexedAsks(SortedIndexedOrderBookSide): side = False           # noqa
+class SortedIndexedBids(SortedIndexedOrderBookSide): side = True            # noqa
@@ -1286,6 +1286,11 @@ class binance(Exchange, ImplicitAPI):
             # exchange-specific options
             'options': {
                 'sandboxMode': False,
+                # used with options['adaptiveRateLimit'], see parse_rate_limit_headers
+                'rateLimitHeaders': [
+                    {'used': 'x-sapi-used-ip-weight-1m', 'limit': 12000, 'window': 60000},
+                    {'used': 'x-mbx-used-weight-1m', 'limit': 6000, 'window': 60000},
+                ],
                 'fetchMargins': True,
                 'fetchMarkets': [
                     'spot',  # allows CORS in browsers
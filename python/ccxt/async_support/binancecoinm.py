@@ -34,6 +34,9 @@ class binancecoinm(binance, ImplicitAPI):
             'options': {
                 'fetchMarkets': ['inverse'],
                 'defaultSubType': 'inverse',
+                'rateLimitHeaders': [
+                    {'used': 'x-mbx-used-weight-1m', 'limit': 2400, 'window': 60000},
+                ],
                 'leverageBrackets': None,
             },
         })
@@ -1032,6 +1032,11 @@ class bybit(Exchange, ImplicitAPI):
             'precisionMode': TICK_SIZE,
             'options': {
                 'usePrivateInstrumentsInfo': False,
+                # used with options['adaptiveRateLimit'], the limits are per endpoint
+                'rateLimitHeaders': [
+                    # per endpoint and uid, only applied to the bucket of the api in options['rateLimitGroups']
+                    {'remaining': 'x-bapi-limit-status', 'limit': 'x-bapi-limit', 'reset': 'x-bapi-limit-reset-timestamp', 'window': 1000, 'scope': 'group'},
+                ],
                 'enableDemoTrading': False,
                 'fetchMarkets': ['spot', 'linear', 'inverse', 'option'],
                 'createOrder': {
@@ -32,22 +32,14 @@ from ccxt.base.decimal_to_precision import decimal_to_precision
 from ccxt.base.decimal_to_precision import DECIMAL_PLACES, TICK_SIZE, NO_PADDING, TRUNCATE, ROUND, ROUND_UP, ROUND_DOWN, SIGNIFICANT_DIGITS
 from ccxt.base.decimal_to_precision import number_to_string
 from ccxt.base.precise import Precise
+from ccxt.base.throttler import Throttler, PRIORITIES
+from ccxt.base.markets_catalog import read_only
 from ccxt.base.types import BalanceAccount, Currency, IndexType, OrderSide, OrderType, Trade, OrderRequest, Market, MarketType, Str, Num, Strings, CancellationRequest, Bool
 
 # -----------------------------------------------------------------------------
 
-# rsa jwt signing
-from cryptography.hazmat import backends
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.asymmetric import padding, ed25519
-# from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature
-from cryptography.hazmat.primitives.serialization import load_pem_private_key
-
-# -----------------------------------------------------------------------------
-
-# ecdsa signing
-from ccxt.static_dependencies import ecdsa
-from ccxt.static_dependencies import keccak
+# rsa, ecdsa, eth and starknet signing is imported by the methods that use it, only a few exchanges need it
+# and the ethereum and starknet dependencies take most of the time of import ccxt
 
 # eddsa signing
 try:
@@ -55,18 +47,6 @@ try:
 except ImportError:
     eddsa = None
 
-# eth signing
-from ccxt.static_dependencies.ethereum import abi
-from ccxt.static_dependencies.ethereum import account
-from ccxt.static_dependencies.msgpack import packb
-
-# starknet
-from ccxt.static_dependencies.starknet.ccxt_utils import get_private_key_from_eth_signature
-from ccxt.static_dependencies.starknet.hash.address import compute_address
-from ccxt.static_dependencies.starknet.hash.selector import get_selector_from_name
-from ccxt.static_dependencies.starknet.hash.utils import message_signature, private_to_stark_key
-from ccxt.static_dependencies.starknet.utils.typed_data import TypedData as TypedDataDataclass
-
 # -----------------------------------------------------------------------------
 
 __all__ = [
@@ -79,8 +59,10 @@ import types
 import logging
 import base64
 import binascii
+import bisect
 import calendar
 import collections
+from collections.abc import Mapping
 import datetime
 from email.utils import parsedate
 # import functools
@@ -98,6 +80,7 @@ except ImportError:
 
 import json
 import math
+import os
 import random
 from numbers import Number
 import re
@@ -109,6 +92,7 @@ from ssl import SSLError
 # import sys
 import time
 import uuid
+import weakref
 import zlib
 from decimal import Decimal
 from time import mktime
@@ -119,10 +103,26 @@ from ccxt.base.types import Int
 
 # -----------------------------------------------------------------------------
 
+# the resolved describe() of every exchange class, see Exchange.get_description
+descriptions = {}
+
+# the attributes of every exchange class that are aliased per instance, see Exchange.set_camelcase_aliases
+camelcase_aliases = {}
+
+
+def json_default(obj):
+    # the mappings that stand for dicts, the CompactTrade records of the watch_trades caches for instance
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 class SafeJSONEncoder(json.JSONEncoder):
     def default(self, obj):
         if isinstance(obj, Exception):
             return {"name": obj.__class__.__name__}
+        if isinstance(obj, Mapping):
+            return dict(obj)
         try:
             return super().default(obj)
         except TypeError:
@@ -240,6 +240,17 @@ class Exchange(object):
     token = ''  # reserved for HTTP auth in some cases
     twofa = None
     markets_by_id = None
+    markets_changes = None
+    safe_ids_memo = None
+    safe_ids_memo_limit = 10000  # the unknown ids memoized by safe_market() and safe_currency()
+    markets_owner = None  # the instance whose markets are shared with this one, see attach_markets()
+    markets_attached = None  # the instances that share the markets of this one
+    markets_options = ()  # the options set by fetch_markets() and fetch_currencies(), kept in the markets cache
+    # the only options that the markets cache restores, the ones that fetch_markets() and fetch_currencies() derive from the markets
+    markets_cache_options = (
+        'marketsByAltname', 'tradingPairs', 'crossMarginPairsData', 'isolatedMarginPairsData', 'currencyIdsListForParseMarket',
+        'currenciesByIdForParseMarket', 'networks', 'networksById', 'networkChainIdsByNames', 'networkNamesByChainIds',
+    )
     currencies_by_id = None
 
     precision = None
@@ -399,33 +410,20 @@ class Exchange(object):
         self.origin = self.uuid()
         self.userAgent = default_user_agent()
 
-        settings = self.deep_extend(self.describe(), config)
+        settings = self.get_description()
+        for key in config:
+            settings[key] = self.deep_extend(settings.get(key), config[key])
 
         for key in settings:
-            if hasattr(self, key) and isinstance(getattr(self, key), dict):
+            # settings is a private copy, it is only merged into the attributes that already hold something
+            if hasattr(self, key) and isinstance(getattr(self, key), dict) and getattr(self, key):
                 setattr(self, key, self.deep_extend(getattr(self, key), settings[key]))
             else:
                 setattr(self, key, settings[key])
 
         self.after_construct()
 
-        # convert all properties from underscore notation foo_bar to camelcase notation fooBar
-        cls = type(self)
-        for name in dir(self):
-            if name[0] != '_' and name[-1] != '_' and '_' in name:
-                parts = name.split('_')
-                # fetch_ohlcv → fetchOHLCV (not fetchOhlcv!)
-                exceptions = {'ohlcv': 'OHLCV', 'le': 'LE', 'be': 'BE'}
-                camelcase = parts[0] + ''.join(exceptions.get(i, self.capitalize(i)) for i in parts[1:])
-                attr = getattr(self, name)
-                if isinstance(attr, types.MethodType):
-                    setattr(cls, camelcase, getattr(cls, name))
-                else:
-                    if hasattr(self, camelcase):
-                        if attr is not None:
-                            setattr(self, camelcase, attr)
-                    else:
-                        setattr(self, camelcase, attr)
+        self.set_camelcase_aliases()
 
         if not self.session and self.synchronous:
             self.session = Session()
@@ -445,18 +443,105 @@ class Exchange(object):
     def __str__(self):
         return self.name
 
+    @staticmethod
+    def is_camelcase_alias_source(name):
+        return name[0] != '_' and name[-1] != '_' and '_' in name
+
+    @staticmethod
+    def to_camelcase(name):
+        parts = name.split('_')
+        # fetch_ohlcv → fetchOHLCV (not fetchOhlcv!)
+        exceptions = {'ohlcv': 'OHLCV', 'le': 'LE', 'be': 'BE'}
+        return parts[0] + ''.join(exceptions.get(i, Exchange.capitalize(i)) for i in parts[1:])
+
+    def set_camelcase_aliases(self):
+        # convert all properties from underscore notation foo_bar to camelcase notation fooBar
+        # methods are aliased on the class by its first instance, the other attributes are aliased on every instance
+        cls = type(self)
+        aliases = camelcase_aliases.get(cls)
+        if aliases is None:
+            aliases = {}
+            for name in dir(cls):
+                if Exchange.is_camelcase_alias_source(name):
+                    camelcase = Exchange.to_camelcase(name)
+                    if isinstance(getattr(self, name), types.MethodType):
+                        setattr(cls, camelcase, getattr(cls, name))
+                    else:
+                        aliases[name] = camelcase
+            camelcase_aliases[cls] = aliases
+        names = list(aliases)
+        # attributes that only exist on this instance
+        extra = [name for name in self.__dict__ if name not in aliases and Exchange.is_camelcase_alias_source(name)]
+        if extra:
+            names = sorted(names + extra)
+        for name in names:
+            camelcase = aliases[name] if name in aliases else Exchange.to_camelcase(name)
+            attr = getattr(self, name)
+            if hasattr(self, camelcase):
+                if attr is not None:
+                    setattr(self, camelcase, attr)
+            else:
+                setattr(self, camelcase, attr)
+
+    def get_description(self):
+        # describe() deep-extends the literals of the whole class hierarchy, it is resolved once per class
+        # and every instance gets its own copy, so that changing self.options or self.urls stays per-instance
+        cls = type(self)
+        description = descriptions.get(cls)
+        if description is None:
+            description = Exchange.unbind_description(self.describe())
+            descriptions[cls] = description
+        return self.bind_description(description)
+
+    @staticmethod
+    def unbind_description(value):
+        # the cached description must not hold on to the first instance, i.e. streaming.ping is a bound method
+        if isinstance(value, dict):
+            return {key: Exchange.unbind_description(value[key]) for key in value}
+        if isinstance(value, list):
+            return [Exchange.unbind_description(item) for item in value]
+        if isinstance(value, types.MethodType):
+            return value.__func__
+        return value
+
+    def bind_description(self, value):
+        kind = type(value)
+        if kind is dict:
+            return {key: self.bind_description(value[key]) for key in value}
+        if kind is list:
+            return [self.bind_description(item) for item in value]
+        if kind is types.FunctionType:
+            return value.__get__(self)
+        return value
+
     def init_throttler(self, cost=None):
-        # stub in sync
-        pass
-
-    def throttle(self, cost=None):
-        now = float(self.milliseconds())
-        elapsed = now - self.lastRestRequestTimestamp
-        cost = 1 if cost is None else cost
-        sleep_time = self.rateLimit * cost
-        if elapsed < sleep_time:
-            delay = sleep_time - elapsed
-            time.sleep(delay / 1000.0)
+        self.throttler = Throttler(self.tokenBucket)
+
+    def throttle(self, cost=None, api=None, priority=None):
+        return self.throttler(cost)
+
+    def handle_rate_limit_priority(self, api, method, params={}, config={}):
+        # the throttler serves 'trading' requests first, then 'account', 'marketData' and 'backfill'
+        # a call picks its lane with params['rateLimitPriority'] or the 'priority' of its endpoint config,
+        # options['deriveRateLimitPriority'] = True derives it from the api and the http method otherwise
+        priority = self.safe_string(params, 'rateLimitPriority')
+        if priority is not None:
+            params = self.omit(params, 'rateLimitPriority')
+        else:
+            priority = self.safe_string(config, 'priority')
+        if priority is None:
+            if not self.safe_bool(self.options, 'deriveRateLimitPriority', False):
+                return [None, params]
+            group = api if isinstance(api, str) else '/'.join(api)
+            if 'public' in group.lower():
+                priority = 'marketData'
+            elif method == 'GET':
+                priority = 'account'
+            else:
+                priority = 'trading'
+        elif priority not in PRIORITIES:
+            raise BadRequest(self.id + ' rateLimitPriority must be one of ' + ', '.join(PRIORITIES))
+        return [priority, params]
 
     @staticmethod
     def gzip_deflate(response, text):
@@ -488,6 +573,49 @@ class Exchange(object):
     def on_rest_response(self, code, reason, url, method, response_headers, response_body, request_headers, request_body):
         return response_body.strip()
 
+    def parse_rate_limit_headers(self, headers):
+        # reads the server-side request budget from the response headers described in options['rateLimitHeaders'], i.e.
+        # [{'used': 'x-mbx-used-weight-1m', 'limit': 6000, 'window': 60000}] or
+        # [{'remaining': 'x-bapi-limit-status', 'limit': 'x-bapi-limit', 'reset': 'x-bapi-limit-reset-timestamp', 'window': 1000}]
+        # 'limit' is either a number or a header, 'reset' is a timestamp and 'resetIn' a number of milliseconds,
+        # without either of them the window is assumed to be aligned to the clock (like the per-minute weight windows),
+        # 'scope': 'group' marks the budget of an endpoint rather than of the account, see adapt_rate_limit()
+        specs = self.safe_value(self.options, 'rateLimitHeaders')
+        if not specs or not headers:
+            return None
+        lowercase = {key.lower(): headers[key] for key in headers}
+        for spec in specs:
+            limit = spec.get('limit')
+            if isinstance(limit, str):
+                limit = self.safe_float(lowercase, limit)
+            if not limit:
+                continue
+            if 'used' in spec:
+                used = self.safe_float(lowercase, spec['used'])
+                remaining = None if used is None else limit - used
+            else:
+                remaining = self.safe_float(lowercase, spec.get('remaining'))
+            if remaining is None:
+                continue
+            window = spec.get('window', 60000)
+            now = self.milliseconds()
+            period = None
+            if 'reset' in spec:
+                reset = self.safe_integer(lowercase, spec['reset'])
+                period = None if reset is None else reset - now
+            elif 'resetIn' in spec:
+                period = self.safe_integer(lowercase, spec['resetIn'])
+            if period is None:
+                period = window - now % window
+            return {
+                'remaining': remaining,
+                'limit': limit,
+                'window': window,
+                'period': min(max(period, 1), window),
+                'scope': spec.get('scope'),
+            }
+        return None
+
     def on_json_response(self, response_body):
         if self.quoteJsonNumbers and orjson is None:
             return json.loads(response_body, parse_float=str, parse_int=str)
@@ -912,17 +1040,46 @@ class Exchange(object):
 
     @staticmethod
     def deep_extend(*args):
+        # the first dict is copied, the dicts after it are merged into the copy, which nothing else references
         result = None
         for arg in args:
+            if not isinstance(arg, dict) and isinstance(arg, Mapping):
+                # a CompactTrade merges like the dict it stands for
+                arg = dict(arg)
             if isinstance(arg, dict):
-                if not isinstance(result, dict):
-                    result = {}
-                for key in arg:
-                    result[key] = Exchange.deep_extend(result[key] if key in result else None, arg[key])
+                if isinstance(result, dict):
+                    Exchange.deep_extend_in_place(result, arg)
+                else:
+                    result = Exchange.deep_copy(arg)
             else:
                 result = arg
         return result
 
+    @staticmethod
+    def deep_copy(value):
+        # same as deep_extend(value) for a dict, the nested dicts are copied and everything else is shared
+        result = dict(value)
+        for key, item in value.items():
+            if isinstance(item, dict):
+                result[key] = Exchange.deep_copy(item)
+        return result
+
+    @staticmethod
+    def deep_extend_in_place(target, source):
+        # same as deep_extend(target, source) for a target that is not referenced anywhere else,
+        # source is merged into it instead of copying the target first
+        for key in source:
+            item = source[key]
+            if isinstance(item, dict):
+                existing = target.get(key)
+                if isinstance(existing, dict):
+                    Exchange.deep_extend_in_place(existing, item)
+                else:
+                    target[key] = Exchange.deep_copy(item)
+            else:
+                target[key] = item
+        return target
+
     @staticmethod
     def filter_by(array, key, value=None):
         array = Exchange.to_array(array)
@@ -1106,6 +1263,10 @@ class Exchange(object):
     def microseconds():
         return int(time.time() * 1000000)
 
+    # the formatted seconds of the recent timestamps, a stream of tickers or trades repeats the same few seconds
+    iso8601_seconds = {}
+    iso8601_seconds_limit = 4096
+
     @staticmethod
     def iso8601(timestamp=None):
         if timestamp is None:
@@ -1115,11 +1276,18 @@ class Exchange(object):
         if int(timestamp) < 0:
             return None
 
-        try:
-            utc = datetime.datetime.fromtimestamp(timestamp // 1000, datetime.timezone.utc)
-            return utc.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-6] + "{:03d}".format(int(timestamp) % 1000) + 'Z'
-        except (TypeError, OverflowError, OSError):
-            return None
+        seconds = timestamp // 1000
+        formatted = Exchange.iso8601_seconds.get(seconds)
+        if formatted is None:
+            try:
+                utc = datetime.datetime.fromtimestamp(seconds, datetime.timezone.utc)
+            except (TypeError, OverflowError, OSError):
+                return None
+            formatted = utc.strftime('%Y-%m-%dT%H:%M:%S.')
+            if len(Exchange.iso8601_seconds) >= Exchange.iso8601_seconds_limit:
+                Exchange.iso8601_seconds.clear()
+            Exchange.iso8601_seconds[seconds] = formatted
+        return formatted + "{:03d}".format(int(timestamp) % 1000) + 'Z'
 
     @staticmethod
     def rfc2616(self, timestamp=None):
@@ -1206,6 +1374,7 @@ class Exchange(object):
     @staticmethod
     def hash(request, algorithm='md5', digest='hex'):
         if algorithm == 'keccak':
+            from ccxt.static_dependencies import keccak
             binary = bytes(keccak.SHA3(request))
         else:
             h = hashlib.new(algorithm, request)
@@ -1294,6 +1463,10 @@ class Exchange(object):
 
     @staticmethod
     def rsa(request, secret, alg='sha256'):
+        from cryptography.hazmat import backends
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.asymmetric import padding
+        from cryptography.hazmat.primitives.serialization import load_pem_private_key
         algorithms = {
             "sha256": hashes.SHA256(),
             "sha384": hashes.SHA384(),
@@ -1305,15 +1478,21 @@ class Exchange(object):
 
     @staticmethod
     def eth_abi_encode(types, args):
+        from ccxt.static_dependencies.ethereum import abi
         return abi.encode(types, args)
 
     @staticmethod
     def eth_encode_structured_data(domain, messageTypes, message):
+        from ccxt.static_dependencies.ethereum import account
         encodedData = account.messages.encode_typed_data(domain, messageTypes, message)
         return Exchange.binary_concat(b"\x19\x01", encodedData.header, encodedData.body)
 
     @staticmethod
     def retrieve_stark_account (signature, accountClassHash, accountProxyClassHash):
+        from ccxt.static_dependencies.starknet.ccxt_utils import get_private_key_from_eth_signature
+        from ccxt.static_dependencies.starknet.hash.address import compute_address
+        from ccxt.static_dependencies.starknet.hash.selector import get_selector_from_name
+        from ccxt.static_dependencies.starknet.hash.utils import private_to_stark_key
         privateKey = get_private_key_from_eth_signature(signature)
         publicKey = private_to_stark_key(privateKey)
         calldata = [
@@ -1337,6 +1516,7 @@ class Exchange(object):
 
     @staticmethod
     def starknet_encode_structured_data (domain, messageTypes, messageData, address):
+        from ccxt.static_dependencies.starknet.utils.typed_data import TypedData as TypedDataDataclass
         types = list(messageTypes.keys())
         if len(types) > 1:
             raise NotSupported('starknetEncodeStructuredData only support single type')
@@ -1360,11 +1540,13 @@ class Exchange(object):
     @staticmethod
     def starknet_sign (hash, pri):
         # // TODO: unify to ecdsa
+        from ccxt.static_dependencies.starknet.hash.utils import message_signature
         r, s = message_signature(hash, pri)
         return Exchange.json([hex(r), hex(s)])
 
     @staticmethod
     def packb(o):
+        from ccxt.static_dependencies.msgpack import packb
         return packb(o)
 
     @staticmethod
@@ -1378,6 +1560,7 @@ class Exchange(object):
     @staticmethod
     def ecdsa(request, secret, algorithm='p256', hash=None, fixed_length=False):
         # your welcome - frosty00
+        from ccxt.static_dependencies import ecdsa
         algorithms = {
             'p192': [ecdsa.NIST192p, 'sha256'],
             'p224': [ecdsa.NIST224p, 'sha256'],
@@ -1423,6 +1606,8 @@ class Exchange(object):
 
     @staticmethod
     def eddsa(request, secret, curve='ed25519'):
+        from cryptography.hazmat.primitives.asymmetric import ed25519
+        from cryptography.hazmat.primitives.serialization import load_pem_private_key
         if isinstance(secret, str):
             secret = Exchange.encode(secret)
         private_key = ed25519.Ed25519PrivateKey.from_private_bytes(secret) if len(secret) == 32 else load_pem_private_key(secret, None)
@@ -1439,7 +1624,7 @@ class Exchange(object):
     @staticmethod
     def json(data, params=None):
         if orjson:
-            return orjson.dumps(data).decode('utf-8')
+            return orjson.dumps(data, default=json_default).decode('utf-8')
         return json.dumps(data, separators=(',', ':'), cls=SafeJSONEncoder)
 
     @staticmethod
@@ -1498,16 +1683,322 @@ class Exchange(object):
         return len(parts[1]) if len(parts) > 1 else 0
 
     def load_markets(self, reload=False, params={}):
+        if self.markets_owner is not None:
+            return self.markets_owner.load_markets(reload, params)
         if not reload:
             if self.markets:
                 if not self.markets_by_id:
                     return self.set_markets(self.markets)
                 return self.markets
+            cache = self.read_markets_cache(params)
+            # expired markets are fetched again right away, other threads may be reading the ones a background refresh would replace
+            if cache is not None and not cache['expired']:
+                return self.set_cached_markets(cache)
+        return self.load_markets_from_exchange(params)
+
+    def load_markets_from_exchange(self, params={}):
+        prepared = self.prepare_markets_cache(params)
         currencies = None
         if self.has['fetchCurrencies'] is True:
             currencies = self.fetch_currencies()
         markets = self.fetch_markets(params)
-        return self.set_markets(markets, currencies)
+        self.write_markets_cache(prepared, markets, currencies)
+        return self.set_loaded_markets(markets, currencies)
+
+    def set_cached_markets(self, cache):
+        # the options that fetch_markets() and fetch_currencies() set are restored along with the markets
+        options = {key: value for key, value in cache['options'].items() if key in self.markets_cache_options}
+        self.options.update(options)
+        self.markets_options = tuple(options)
+        return self.set_loaded_markets(cache['markets'], cache['currencies'])
+
+    def set_loaded_markets(self, markets, currencies=None):
+        # options['incrementalMarketsReload'] = True reloads the markets with update_markets() instead of set_markets(),
+        # except for shared markets, whose read-only indexes are replaced as a whole in every attached instance
+        if self.markets and not self.markets_attached and self.safe_bool(self.options, 'incrementalMarketsReload', False):
+            self.update_markets(markets, currencies)
+        else:
+            self.set_markets(markets, currencies)
+        if self.markets_attached:
+            self.share_markets()
+        return self.markets
+
+    def attach_markets(self, exchange):
+        # shares the markets and currencies of another instance of the same exchange, one per account for instance,
+        # instead of loading and keeping a copy of them in each instance, the shared indexes are read-only,
+        # load_markets() of any attached instance loads them through the first one and reloading them updates all
+        if exchange.markets_owner is not None:
+            exchange = exchange.markets_owner
+        if exchange is self:
+            return
+        if exchange.id != self.id or exchange.synchronous != self.synchronous:
+            raise ExchangeError(self.id + ' attach_markets() requires an instance of the same exchange, got ' + exchange.id)
+        if exchange.markets_attached is None:
+            exchange.markets_attached = weakref.WeakSet()
+        exchange.markets_attached.add(self)
+        self.markets_owner = exchange
+        if exchange.markets:
+            exchange.share_markets()
+
+    def share_markets(self):
+        catalog = {}
+        for name in ['markets', 'markets_by_id', 'symbols', 'ids', 'currencies', 'currencies_by_id', 'codes', 'baseCurrencies', 'quoteCurrencies']:
+            catalog[name] = read_only(getattr(self, name, None))
+        for exchange in [self] + list(self.markets_attached):
+            for name, value in catalog.items():
+                setattr(exchange, name, value)
+
+    def set_trading_limits(self, symbols, limits):
+        # the index of the shared markets is read-only, the limits are merged into the shared markets themselves,
+        # so that markets_by_id and every attached instance see them
+        if self.markets_owner is None and self.markets_attached is None:
+            for symbol in symbols:
+                self.markets[symbol] = self.deep_extend(self.markets[symbol], limits[symbol])
+            return
+        for symbol in symbols:
+            market = self.markets[symbol]
+            market.update(self.deep_extend(market, limits[symbol]))
+
+    def get_markets_cache_config(self):
+        # options['marketsCache'] = True or {'path': directory, 'ttl': milliseconds, 'backgroundRefresh': True}
+        # keeps the fetched markets and currencies on disk, so that restarting a process doesn't fetch them again,
+        # the async instances serve expired markets from the cache and refresh them in the background unless
+        # backgroundRefresh is False, the sync ones fetch them again before returning
+        config = self.safe_value(self.options, 'marketsCache')
+        if not config:
+            return None
+        config = config if isinstance(config, dict) else {}
+        return {
+            'path': self.safe_string(config, 'path', Exchange.get_default_cache_path('markets')),
+            'ttl': self.safe_integer(config, 'ttl', 3600000),
+            'backgroundRefresh': self.safe_bool(config, 'backgroundRefresh', True),
+        }
+
+    @staticmethod
+    def get_default_cache_path(name):
+        # a directory of the current user, the shared temporary directory is writable by everyone
+        cache = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        return os.path.join(cache, 'ccxt', name)
+
+    @staticmethod
+    def is_private_path(path):
+        # the markets cache is only read from files and directories of the current user that nobody else can write to
+        if not hasattr(os, 'getuid'):
+            return True
+        stat = os.stat(path)
+        return stat.st_uid == os.getuid() and not (stat.st_mode & 0o022)
+
+    def get_markets_cache_file(self, path, params={}):
+        # the markets depend on the api urls, the sandbox mode, the default type, the types to fetch and the params of
+        # load_markets(), some exchanges return the markets of the account, so the credentials are part of the key too,
+        # the key is taken before fetching, since fetch_markets() and fetch_currencies() change other options
+        key = json.dumps([
+            self.urls.get('api'),
+            self.hostname,
+            self.isSandboxModeEnabled,
+            self.safe_value(self.options, 'defaultType'),
+            self.safe_value(self.options, 'defaultSubType'),
+            self.safe_value(self.options, 'fetchMarkets'),
+            self.apiKey,
+            self.uid,
+            self.walletAddress,
+            params,
+        ], sort_keys=True, default=str)
+        return os.path.join(path, self.id + '-' + hashlib.sha256(Exchange.encode(key)).hexdigest() + '.json')
+
+    def get_options_snapshot(self):
+        return {key: json.dumps(value, default=str, skipkeys=True) for key, value in self.options.items()}
+
+    def prepare_markets_cache(self, params={}):
+        config = self.get_markets_cache_config()
+        if config is None:
+            return None
+        return {
+            'path': config['path'],
+            'file': self.get_markets_cache_file(config['path'], params),
+            'options': self.get_options_snapshot(),
+        }
+
+    def read_markets_cache(self, params={}):
+        config = self.get_markets_cache_config()
+        if config is None:
+            return None
+        try:
+            path = self.get_markets_cache_file(config['path'], params)
+            if not Exchange.is_private_path(config['path']) or not Exchange.is_private_path(path):
+                self.logger.warning('%s ignores the markets cache %s, it is writable by other users', self.id, path)
+                return None
+            with open(path, 'rb') as file:
+                data = file.read()
+            cache = orjson.loads(data) if orjson is not None else json.loads(data)
+            expired = self.milliseconds() - cache['timestamp'] > config['ttl']
+            cache = {
+                'markets': cache['markets'],
+                'currencies': cache['currencies'],
+                'options': cache['options'],
+                'expired': expired,
+            }
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+        if expired and not config['backgroundRefresh']:
+            return None
+        return cache
+
+    def write_markets_cache(self, prepared, markets, currencies):
+        # prepared is the file and the options taken by prepare_markets_cache() before fetching
+        if prepared is None:
+            return
+        path = prepared['file']
+        before = prepared['options']
+        after = self.get_options_snapshot()
+        # the options that were restored from the cache are kept too, a refresh may set them to the same values again
+        keys = [key for key in after if (after[key] != before.get(key) or key in self.markets_options) and key in self.markets_cache_options]
+        self.markets_options = tuple(keys)
+        cache = {
+            'timestamp': self.milliseconds(),
+            'markets': markets,
+            'currencies': currencies,
+            'options': {key: self.options[key] for key in keys},
+        }
+        try:
+            data = orjson.dumps(cache, option=orjson.OPT_NON_STR_KEYS) if orjson is not None else Exchange.encode(json.dumps(cache))
+            os.makedirs(prepared['path'], mode=0o700, exist_ok=True)
+            if not Exchange.is_private_path(prepared['path']):
+                self.logger.warning('%s does not write the markets cache to %s, it is writable by other users', self.id, prepared['path'])
+                return
+            # written aside and renamed, so that other processes never read a partial file
+            temporary = path + '.' + self.uuid()
+            with os.fdopen(os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600), 'wb') as file:
+                file.write(data)
+            os.replace(temporary, path)
+        except (OSError, ValueError, TypeError) as e:
+            self.logger.warning('%s failed to write the markets cache: %s', self.id, e)
+
+    def update_markets(self, markets, currencies=None):
+        # the dicts of the unchanged markets are kept, the changed ones are updated in place, so that the references
+        # held to them stay current, and the delisted ones are marked inactive and removed from the indexes,
+        # returns the symbols that were added, changed and removed, also kept in self.markets_changes
+        if not self.markets or not self.markets_by_id:
+            symbols = set(self.symbols or [])
+            self.set_markets(markets, currencies)
+            self.markets_changes = {
+                'added': [symbol for symbol in self.symbols if symbol not in symbols],
+                'changed': [],
+                'removed': sorted(symbol for symbol in symbols if symbol not in self.markets),
+            }
+            return self.markets_changes
+        structure = self.market_structure()
+        added = []
+        changed = []
+        removed = []
+        # the last market of a symbol wins, as in set_markets()
+        values = {}
+        for value in self.sort_by(self.to_array(markets), 'spot', True, True):
+            if value['symbol'] is not None:
+                values[value['symbol']] = value
+        for symbol, value in values.items():
+            market = self.market_from_structure(structure, value)
+            existing = self.markets.get(symbol)
+            if existing is None:
+                self.markets[symbol] = market
+                self.index_market_value(value)
+                bisect.insort(self.symbols, symbol)
+                added.append(symbol)
+            elif existing != market:
+                previous = self.find_market_value(existing)
+                if previous is None:
+                    self.index_market_value(value)
+                elif previous['id'] != value['id']:
+                    self.unindex_market_value(previous)
+                    previous.clear()
+                    previous.update(value)
+                    self.index_market_value(previous)
+                else:
+                    previous.clear()
+                    previous.update(value)
+                existing.clear()
+                existing.update(market)
+                changed.append(symbol)
+        for symbol in [symbol for symbol in self.markets if symbol not in values]:
+            market = self.markets.pop(symbol)
+            market['active'] = False
+            previous = self.find_market_value(market)
+            if previous is not None:
+                previous['active'] = False
+                self.unindex_market_value(previous)
+            del self.symbols[bisect.bisect_left(self.symbols, symbol)]
+            removed.append(symbol)
+        if currencies is None and (added or changed or removed):
+            currencies = self.derive_currencies([self.markets[symbol] for symbol in values])
+        if currencies is not None:
+            self.update_currencies(currencies)
+        self.markets_changes = {
+            'added': added,
+            'changed': changed,
+            'removed': removed,
+        }
+        return self.markets_changes
+
+    def find_market_value(self, market):
+        # the unparsed market of markets_by_id that a market of self.markets was built from
+        for value in self.markets_by_id.get(market['id'], []):
+            if value['symbol'] == market['symbol']:
+                return value
+        return None
+
+    def index_market_value(self, value):
+        values = self.markets_by_id.get(value['id'])
+        if values is None:
+            self.markets_by_id[value['id']] = [value]
+            bisect.insort(self.ids, value['id'])
+        else:
+            values.append(value)
+            # spot markets first, as in set_markets()
+            values.sort(key=lambda item: item['spot'] if item['spot'] is not None else True, reverse=True)
+
+    def unindex_market_value(self, value):
+        values = self.markets_by_id[value['id']]
+        values[:] = [item for item in values if item is not value]
+        if not values:
+            del self.markets_by_id[value['id']]
+            del self.ids[bisect.bisect_left(self.ids, value['id'])]
+
+    def update_currencies(self, currencies):
+        # merges currencies into self.currencies like set_markets(), the dicts of the existing currencies are kept
+        reindex = False
+        for code, value in currencies.items():
+            existing = self.currencies.get(code)
+            currency = self.deep_extend(existing, value)
+            if existing is None:
+                self.currencies[code] = currency
+                bisect.insort(self.codes, code)
+                reindex = True
+            elif existing != currency:
+                existing.clear()
+                existing.update(currency)
+                reindex = True
+        if reindex:
+            self.currencies_by_id = self.index_by(self.currencies, 'id')
+
+    def get_safe_ids_memo(self, name, id):
+        # the unknown ids parsed by safe_market() and safe_currency(), by name, for as long as the currencies and
+        # the common currency codes are the same, the least recently used ones past safe_ids_memo_limit are dropped
+        memo = self.safe_ids_memo
+        if (memo is None) or (memo[0] is not self.currencies_by_id) or (memo[1] is not self.commonCurrencies) or (memo[2] != self.substituteCommonCurrencyCodes):
+            memo = self.safe_ids_memo = [self.currencies_by_id, self.commonCurrencies, self.substituteCommonCurrencyCodes, collections.OrderedDict()]
+        entries = memo[3]
+        key = (name, id)
+        value = entries.get(key)
+        if value is not None:
+            entries.move_to_end(key)
+        return value
+
+    def set_safe_ids_memo(self, name, id, value):
+        self.get_safe_ids_memo(name, id)
+        entries = self.safe_ids_memo[3]
+        entries[(name, id)] = value
+        if len(entries) > self.safe_ids_memo_limit:
+            entries.popitem(last=False)
 
     def fetch_markets(self, params={}):
         # markets are returned as a list
@@ -1572,6 +2063,8 @@ class Exchange(object):
             raise NotSupported(self.id + ' Eddsa functionality requires python-axolotl-curve25519, install with `pip install python-axolotl-curve25519==0.4.1.post2`: https://github.com/tgalal/python-axolotl-curve25519')
 
     def privateKeyToAddress(self, privateKey):
+        from ccxt.static_dependencies import ecdsa
+        from ccxt.static_dependencies import keccak
         private_key_bytes = base64.b16decode(Exchange.encode(privateKey), True)
         public_key_bytes = ecdsa.SigningKey.from_string(private_key_bytes, curve=ecdsa.SECP256k1).verifying_key.to_string()
         public_key_hash = keccak.SHA3(public_key_bytes)
@@ -2342,6 +2835,19 @@ class Exchange(object):
                 result.append(messageHash)
         return result
 
+    def message_handlers(self):
+        # the routing tables of handleMessage as { table: { event: handler }}, built once per instance
+        return {}
+
+    def get_message_handlers(self, table: str):
+        if self.boundMessageHandlers is None:
+            self.boundMessageHandlers = self.message_handlers()
+        return self.safe_dict(self.boundMessageHandlers, table, {})
+
+    def get_message_handler(self, table: str, event: Str):
+        handlers = self.get_message_handlers(table)
+        return self.safe_value(handlers, event)
+
     def filter_by_limit(self, array: List[object], limit: Int = None, key: IndexType = 'timestamp', fromStart: bool = False):
         if self.value_is_defined(limit):
             arrayLength = len(array)
@@ -3072,8 +3578,11 @@ class Exchange(object):
         return cleanStructure
 
     def set_markets(self, markets, currencies=None):
+        # a single pass over the markets, the market structure, precision, limits and trading fees
+        # are merged once instead of a deepExtend of all of them for every market
         values = []
         self.markets_by_id = {}
+        structure = self.market_structure()
         # handle marketId conflicts
         # we insert spot markets first
         marketValues = self.sort_by(self.to_array(markets), 'spot', True, True)
@@ -3082,77 +3591,98 @@ class Exchange(object):
             if value['id'] in self.markets_by_id:
                 marketsByIdArray = (self.markets_by_id[value['id']])
                 marketsByIdArray.append(value)
-                self.markets_by_id[value['id']] = marketsByIdArray
             else:
                 self.markets_by_id[value['id']] = [value]
-            market = self.deep_extend(self.safe_market_structure(), {
-                'precision': self.precision,
-                'limits': self.limits,
-            }, self.fees['trading'], value)
-            if market['linear']:
-                market['subType'] = 'linear'
-            elif market['inverse']:
-                market['subType'] = 'inverse'
-            else:
-                market['subType'] = None
-            values.append(market)
+            values.append(self.market_from_structure(structure, value))
         self.markets = self.index_by(values, 'symbol')
-        marketsSortedBySymbol = self.keysort(self.markets)
-        marketsSortedById = self.keysort(self.markets_by_id)
-        self.symbols = list(marketsSortedBySymbol.keys())
-        self.ids = list(marketsSortedById.keys())
+        self.symbols = list(self.keysort(self.markets).keys())
+        self.ids = list(self.keysort(self.markets_by_id).keys())
         if currencies is not None:
             # currencies is always None when called in constructor but not when called from loadMarkets
             self.currencies = self.deep_extend(self.currencies, currencies)
         else:
-            baseCurrencies = []
-            quoteCurrencies = []
-            for i in range(0, len(values)):
-                market = values[i]
-                defaultCurrencyPrecision = 8 if (self.precisionMode == DECIMAL_PLACES) else self.parse_number('1e-8')
-                marketPrecision = self.safe_dict(market, 'precision', {})
-                if 'base' in market:
-                    currency = self.safe_currency_structure({
-                        'id': self.safe_string_2(market, 'baseId', 'base'),
-                        'numericId': self.safe_integer(market, 'baseNumericId'),
-                        'code': self.safe_string(market, 'base'),
-                        'precision': self.safe_value_2(marketPrecision, 'base', 'amount', defaultCurrencyPrecision),
-                    })
-                    baseCurrencies.append(currency)
-                if 'quote' in market:
-                    currency = self.safe_currency_structure({
-                        'id': self.safe_string_2(market, 'quoteId', 'quote'),
-                        'numericId': self.safe_integer(market, 'quoteNumericId'),
-                        'code': self.safe_string(market, 'quote'),
-                        'precision': self.safe_value_2(marketPrecision, 'quote', 'price', defaultCurrencyPrecision),
-                    })
-                    quoteCurrencies.append(currency)
-            baseCurrencies = self.sort_by(baseCurrencies, 'code', False, '')
-            quoteCurrencies = self.sort_by(quoteCurrencies, 'code', False, '')
-            self.baseCurrencies = self.index_by(baseCurrencies, 'code')
-            self.quoteCurrencies = self.index_by(quoteCurrencies, 'code')
-            allCurrencies = self.array_concat(baseCurrencies, quoteCurrencies)
-            groupedCurrencies = self.group_by(allCurrencies, 'code')
-            codes = list(groupedCurrencies.keys())
-            resultingCurrencies = []
-            for i in range(0, len(codes)):
-                code = codes[i]
-                groupedCurrenciesCode = self.safe_list(groupedCurrencies, code, [])
-                highestPrecisionCurrency = self.safe_value(groupedCurrenciesCode, 0)
-                for j in range(1, len(groupedCurrenciesCode)):
-                    currentCurrency = groupedCurrenciesCode[j]
-                    if self.precisionMode == TICK_SIZE:
-                        highestPrecisionCurrency = currentCurrency if (currentCurrency['precision'] < highestPrecisionCurrency['precision']) else highestPrecisionCurrency
-                    else:
-                        highestPrecisionCurrency = currentCurrency if (currentCurrency['precision'] > highestPrecisionCurrency['precision']) else highestPrecisionCurrency
-                resultingCurrencies.append(highestPrecisionCurrency)
-            sortedCurrencies = self.sort_by(resultingCurrencies, 'code')
-            self.currencies = self.deep_extend(self.currencies, self.index_by(sortedCurrencies, 'code'))
+            self.currencies = self.deep_extend(self.currencies, self.derive_currencies(values))
         self.currencies_by_id = self.index_by(self.currencies, 'id')
-        currenciesSortedByCode = self.keysort(self.currencies)
-        self.codes = list(currenciesSortedByCode.keys())
+        self.codes = list(self.keysort(self.currencies).keys())
         return self.markets
 
+    def market_structure(self):
+        # the defaults of every market
+        return self.deep_extend(self.safe_market_structure(), {
+            'precision': self.precision,
+            'limits': self.limits,
+        }, self.fees['trading'])
+
+    def market_from_structure(self, structure: dict, value: dict):
+        market = self.deep_extend(structure, value)
+        if market['linear']:
+            market['subType'] = 'linear'
+        elif market['inverse']:
+            market['subType'] = 'inverse'
+        else:
+            market['subType'] = None
+        return market
+
+    def derive_currencies(self, markets: List[dict]):
+        # the currencies of the markets, also sets baseCurrencies and quoteCurrencies
+        defaultCurrencyPrecision = 8 if (self.precisionMode == DECIMAL_PLACES) else self.parse_number('1e-8')
+        # per currency code, the last base and quote currency seen and the ones with the highest precision
+        lastBase: dict = {}
+        lastQuote: dict = {}
+        highestBase: dict = {}
+        highestQuote: dict = {}
+        for i in range(0, len(markets)):
+            market = markets[i]
+            marketPrecision = self.safe_dict(market, 'precision', {})
+            base = self.safe_string(market, 'base')
+            if base is not None:
+                candidate = [self.safe_value_2(marketPrecision, 'base', 'amount', defaultCurrencyPrecision), market, 'base']
+                lastBase[base] = candidate
+                highestBase[base] = self.highest_precision_currency(self.safe_value(highestBase, base), candidate)
+            quote = self.safe_string(market, 'quote')
+            if quote is not None:
+                candidate = [self.safe_value_2(marketPrecision, 'quote', 'price', defaultCurrencyPrecision), market, 'quote']
+                lastQuote[quote] = candidate
+                highestQuote[quote] = self.highest_precision_currency(self.safe_value(highestQuote, quote), candidate)
+        self.baseCurrencies = {}
+        baseCodes = list(self.keysort(lastBase).keys())
+        for i in range(0, len(baseCodes)):
+            code = baseCodes[i]
+            self.baseCurrencies[code] = self.market_currency_structure(lastBase[code])
+        self.quoteCurrencies = {}
+        quoteCodes = list(self.keysort(lastQuote).keys())
+        for i in range(0, len(quoteCodes)):
+            code = quoteCodes[i]
+            self.quoteCurrencies[code] = self.market_currency_structure(lastQuote[code])
+        result: dict = {}
+        codes = list(self.keysort(self.extend(highestBase, highestQuote)).keys())
+        for i in range(0, len(codes)):
+            code = codes[i]
+            # the quote currencies come after the base currencies of the same code
+            highest = self.highest_precision_currency(self.safe_value(highestBase, code), self.safe_value(highestQuote, code))
+            result[code] = self.market_currency_structure(highest)
+        return result
+
+    def highest_precision_currency(self, highest: List[Any], candidate: List[Any]):
+        # candidates are [precision, market, 'base' or 'quote'], the first one wins a tie
+        if highest is None:
+            return candidate
+        if candidate is None:
+            return highest
+        if self.precisionMode == TICK_SIZE:
+            return candidate if (candidate[0] < highest[0]) else highest
+        return candidate if (candidate[0] > highest[0]) else highest
+
+    def market_currency_structure(self, candidate: List[Any]):
+        side = candidate[2]
+        market = candidate[1]
+        return self.safe_currency_structure({
+            'id': self.safe_string_2(market, side + 'Id', side),
+            'numericId': self.safe_integer(market, side + 'NumericId'),
+            'code': self.safe_string(market, side),
+            'precision': candidate[0],
+        })
+
     def get_describe_for_extended_ws_exchange(self, currentRestInstance: Any, parentRestInstance: Any, wsBaseDescribe: dict):
         extendedRestDescribe = self.deep_extend(parentRestInstance.describe(), currentRestInstance.describe())
         superWithRestDescribe = self.deep_extend(extendedRestDescribe, wsBaseDescribe)
@@ -3384,7 +3914,7 @@ class Exchange(object):
         triggerPrice = self.parse_number(self.safe_string_2(order, 'triggerPrice', 'stopPrice'))
         takeProfitPrice = self.parse_number(self.safe_string(order, 'takeProfitPrice'))
         stopLossPrice = self.parse_number(self.safe_string(order, 'stopLossPrice'))
-        return self.extend(order, {
+        return self.retain_info(self.extend(order, {
             'id': self.safe_string(order, 'id'),
             'clientOrderId': self.safe_string(order, 'clientOrderId'),
             'timestamp': timestamp,
@@ -3410,7 +3940,7 @@ class Exchange(object):
             'stopLossPrice': stopLossPrice,
             'status': status,
             'fee': self.safe_value(order, 'fee'),
-        })
+        }))
 
     def parse_orders(self, orders: object, market: Market = None, since: Int = None, limit: Int = None, params={}):
         #
@@ -3501,6 +4031,18 @@ class Exchange(object):
             'cost': self.parse_number(cost),
         }
 
+    def retain_info(self, structure: dict):
+        # options['structureInfo'] = 'drop' doesn't keep the raw exchange responses in the info of the unified
+        # trades, orders, tickers, positions and liquidations, 'keep' is the default
+        retention = self.safe_string(self.options, 'structureInfo', 'keep')
+        if retention == 'keep':
+            return structure
+        if retention != 'drop':
+            raise NotSupported(self.id + ' structureInfo must be "keep" or "drop"')
+        if 'info' in structure:
+            structure['info'] = None
+        return structure
+
     def safe_liquidation(self, liquidation: dict, market: Market = None):
         contracts = self.safe_string(liquidation, 'contracts')
         contractSize = self.safe_string(market, 'contractSize')
@@ -3516,7 +4058,7 @@ class Exchange(object):
         liquidation['price'] = self.parse_number(price)
         liquidation['baseValue'] = self.parse_number(baseValue)
         liquidation['quoteValue'] = self.parse_number(quoteValue)
-        return liquidation
+        return self.retain_info(liquidation)
 
     def safe_trade(self, trade: dict, market: Market = None):
         amount = self.safe_string(trade, 'amount')
@@ -3538,7 +4080,7 @@ class Exchange(object):
         trade['amount'] = self.parse_number(amount)
         trade['price'] = self.parse_number(price)
         trade['cost'] = self.parse_number(cost)
-        return trade
+        return self.retain_info(trade)
 
     def parsed_fee_and_fees(self, container: Any):
         fee = self.safe_dict(container, 'fee')
@@ -3709,7 +4251,7 @@ class Exchange(object):
             open = Precise.string_sub(last, change)
         # timestamp and symbol operations don't belong in safeTicker
         # they should be done in the derived classes
-        return self.extend(ticker, {
+        return self.retain_info(self.extend(ticker, {
             'bid': self.parse_number(self.omit_zero(self.safe_string(ticker, 'bid'))),
             'bidVolume': self.safe_number(ticker, 'bidVolume'),
             'ask': self.parse_number(self.omit_zero(self.safe_string(ticker, 'ask'))),
@@ -3728,7 +4270,7 @@ class Exchange(object):
             'previousClose': self.safe_number(ticker, 'previousClose'),
             'indexPrice': self.safe_number(ticker, 'indexPrice'),
             'markPrice': self.safe_number(ticker, 'markPrice'),
-        })
+        }))
 
     def fetch_borrow_rate(self, code: str, amount: float, params={}):
         raise NotSupported(self.id + ' fetchBorrowRate is deprecated, please use fetchCrossBorrowRate or fetchIsolatedBorrowRate instead')
@@ -4129,9 +4671,7 @@ class Exchange(object):
         if self.has['fetchTradingLimits']:
             if reload or not ('limitsLoaded' in self.options):
                 response = self.fetch_trading_limits(symbols)
-                for i in range(0, len(symbols)):
-                    symbol = symbols[i]
-                    self.markets[symbol] = self.deep_extend(self.markets[symbol], response[symbol])
+                self.set_trading_limits(symbols, response)
                 self.options['limitsLoaded'] = self.milliseconds()
         return self.markets
 
@@ -4156,7 +4696,7 @@ class Exchange(object):
         if contractSize is None and market is not None:
             contractSize = self.safe_number(market, 'contractSize')
             position['contractSize'] = contractSize
-        return position
+        return self.retain_info(position)
 
     def parse_positions(self, positions: List[Any], symbols: List[str] = None, params={}):
         symbols = self.market_symbols(symbols)
@@ -4328,9 +4868,11 @@ class Exchange(object):
         return results
 
     def fetch2(self, path, api: Any = 'public', method='GET', params={}, headers: Any = None, body: Any = None, config={}):
+        priority = None
+        priority, params = self.handle_rate_limit_priority(api, method, params, config)
         if self.enableRateLimit:
             cost = self.calculate_rate_limiter_cost(api, method, path, params, config)
-            self.throttle(cost)
+            self.throttle(cost, api, priority)
         self.lastRestRequestTimestamp = self.milliseconds()
         request = self.sign(path, api, method, params, headers, body)
         self.last_request_headers = request['headers']
@@ -4504,7 +5046,11 @@ class Exchange(object):
             return self.currencies_by_id[currencyId]
         code = currencyId
         if currencyId is not None:
-            code = self.common_currency_code(currencyId.upper())
+            # the codes of unknown ids are memoized, a new currency structure is returned every time
+            code = self.get_safe_ids_memo('currency', currencyId)
+            if code is None:
+                code = self.common_currency_code(currencyId.upper())
+                self.set_safe_ids_memo('currency', currencyId, code)
         return self.safe_currency_structure({
             'id': currencyId,
             'code': code,
@@ -4512,10 +5058,7 @@ class Exchange(object):
         })
 
     def safe_market(self, marketId: Str = None, market: Market = None, delimiter: Str = None, marketType: Str = None):
-        result = self.safe_market_structure({
-            'symbol': marketId,
-            'marketId': marketId,
-        })
+        # a known market id costs a single lookup, the fallback structure is only built when it isn't found
         if marketId is not None:
             if (self.markets_by_id is not None) and (marketId in self.markets_by_id):
                 markets = self.markets_by_id[marketId]
@@ -4533,20 +5076,29 @@ class Exchange(object):
                         if currentMarket[marketType]:
                             return currentMarket
             elif delimiter is not None and delimiter != '':
-                parts = marketId.split(delimiter)
-                partsLength = len(parts)
-                if partsLength == 2:
-                    result['baseId'] = self.safe_string(parts, 0)
-                    result['quoteId'] = self.safe_string(parts, 1)
-                    result['base'] = self.safe_currency_code(result['baseId'])
-                    result['quote'] = self.safe_currency_code(result['quoteId'])
-                    result['symbol'] = result['base'] + '/' + result['quote']
-                    return result
-                else:
-                    return result
+                # the unknown ids are split once, a new market structure is returned every time
+                parsed = self.get_safe_ids_memo('market' + delimiter, marketId)
+                if parsed is None:
+                    parsed = {
+                        'symbol': marketId,
+                        'marketId': marketId,
+                    }
+                    parts = marketId.split(delimiter)
+                    partsLength = len(parts)
+                    if partsLength == 2:
+                        parsed['baseId'] = self.safe_string(parts, 0)
+                        parsed['quoteId'] = self.safe_string(parts, 1)
+                        parsed['base'] = self.safe_currency_code(parsed['baseId'])
+                        parsed['quote'] = self.safe_currency_code(parsed['quoteId'])
+                        parsed['symbol'] = parsed['base'] + '/' + parsed['quote']
+                    self.set_safe_ids_memo('market' + delimiter, marketId, parsed)
+                return self.safe_market_structure(parsed)
         if market is not None:
             return market
-        return result
+        return self.safe_market_structure({
+            'symbol': marketId,
+            'marketId': marketId,
+        })
 
     def check_required_credentials(self, error=True):
         """
@@ -5780,6 +6332,10 @@ class Exchange(object):
         return self.filter_by_symbol_since_limit(sorted, symbol, since, limit)
 
     def safe_symbol(self, marketId: Str, market: Market = None, delimiter: Str = None, marketType: Str = None):
+        if (marketId is not None) and (self.markets_by_id is not None) and (marketId in self.markets_by_id):
+            markets = self.markets_by_id[marketId]
+            if len(markets) == 1:
+                return markets[0]['symbol']
         market = self.safe_market(marketId, market, delimiter, marketType)
         return market['symbol']
 
@@ -0,0 +1,35 @@
+import importlib
+import sys
+from types import ModuleType
+
+
+class ExchangesModule(ModuleType):
+    """a package that imports its exchange modules on first access instead of at import time"""
+
+    def __getattr__(self, name):
+        # only called for attributes that aren't set yet
+        if name in self.exchanges:
+            importlib.import_module(self.__name__ + '.' + name)
+            return self.__dict__[name]
+        raise AttributeError("module '" + self.__name__ + "' has no attribute '" + name + "'")
+
+    def __setattr__(self, name, value):
+        # importing ccxt.<id> binds the submodule on the package, directly or as a dependency of
+        # another exchange, the package exposes the exchange class under that name instead
+        if isinstance(value, ModuleType) and name in self.exchanges and value.__name__ == self.__name__ + '.' + name:
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(self.exchanges))
+
+
+def lazy_load_exchanges(module_name):
+    # called at the end of the package __init__, once its exchanges list is defined
+    module = sys.modules[module_name]
+    module.__class__ = ExchangesModule
+    # exchange modules imported before the switch, by another ccxt package for instance
+    for id in module.exchanges:
+        submodule = sys.modules.get(module_name + '.' + id)
+        if submodule is not None:
+            setattr(module, id, submodule)
@@ -0,0 +1,61 @@
+import copy
+
+
+class ReadOnlyDict(dict):
+    """a dict of a markets catalog shared by several exchange instances, that none of them can modify"""
+
+    __slots__ = ()
+
+    def read_only(self, *args, **kwargs):
+        raise TypeError("'" + type(self).__name__ + "' object is read-only, the markets are shared with other instances")
+
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = read_only
+
+    # copies are regular dicts that can be modified
+
+    def copy(self):
+        return dict(self)
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(dict(self), memo)
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+
+class ReadOnlyList(list):
+    """a list of a markets catalog shared by several exchange instances, that none of them can modify"""
+
+    __slots__ = ()
+
+    def read_only(self, *args, **kwargs):
+        raise TypeError("'" + type(self).__name__ + "' object is read-only, the markets are shared with other instances")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = append = clear = extend = insert = pop = remove = reverse = sort = read_only
+
+    def copy(self):
+        return list(self)
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(list(self), memo)
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+
+def read_only(value):
+    # a read-only copy of an index of the markets catalog, the markets and currencies it references are shared as they are,
+    # the exchanges complete them lazily, the networks of a currency for instance, and every attached instance sees that
+    if isinstance(value, (ReadOnlyDict, ReadOnlyList)):
+        return value
+    if isinstance(value, dict):
+        return ReadOnlyDict((key, ReadOnlyList(item) if type(item) is list else item) for key, item in value.items())
+    if isinstance(value, list):
+        return ReadOnlyList(value)
+    return value
@@ -0,0 +1,51 @@
+import threading
+from time import sleep, time
+
+
+# lanes served from first to last by the async throttler, all of them share the same token bucket
+PRIORITIES = ('trading', 'account', 'marketData', 'backfill')
+
+class Throttler:
+    """thread-safe token bucket for the synchronous Exchange, same config as ccxt.async_support.base.throttler.Throttler"""
+
+    def __init__(self, config):
+        self.config = {
+            'refillRate': 1.0,
+            'delay': 0.001,
+            'cost': 1.0,
+            'tokens': 0,
+            'maxCapacity': 2000,
+            'capacity': 1.0,
+        }
+        self.config.update(config)
+        self.lock = threading.Lock()
+        self.last_timestamp = time() * 1000
+        self.waiting = 0
+
+    def reserve(self, cost=None):
+        # takes the tokens right away and returns the number of seconds to wait before the call may proceed,
+        # the bucket goes negative for the calls that are still waiting, so that concurrent threads line up
+        cost = self.config['cost'] if cost is None else cost
+        with self.lock:
+            now = time() * 1000
+            elapsed = now - self.last_timestamp
+            self.last_timestamp = now
+            self.config['tokens'] = min(self.config['tokens'] + elapsed * self.config['refillRate'], self.config['capacity'])
+            if self.config['tokens'] >= 0:
+                self.config['tokens'] -= cost
+                return 0
+            if self.waiting > self.config['maxCapacity']:
+                raise RuntimeError('throttle queue is over maxCapacity (' + str(int(self.config['maxCapacity'])) + '), see https://github.com/ccxt/ccxt/issues/11645#issuecomment-1195695526')
+            delay = -self.config['tokens'] / self.config['refillRate']
+            self.config['tokens'] -= cost
+            self.waiting += 1
+            return delay / 1000
+
+    def __call__(self, cost=None):
+        delay = self.reserve(cost)
+        if delay > 0:
+            try:
+                sleep(delay)
+            finally:
+                with self.lock:
+                    self.waiting -= 1
@@ -656,6 +656,10 @@ class kucoin(Exchange, ImplicitAPI):
             },
             'options': {
                 'hf': None,  # would be auto set to `true/false` after first load
+                # used with options['adaptiveRateLimit'], see parse_rate_limit_headers
+                'rateLimitHeaders': [
+                    {'remaining': 'gw-ratelimit-remaining', 'limit': 'gw-ratelimit-limit', 'resetIn': 'gw-ratelimit-reset', 'window': 30000},
+                ],
                 'version': 'v1',
                 'symbolSeparator': '-',
                 'fetchMyTradesMethod': 'private_get_fills',
@@ -3562,11 +3562,13 @@ class binance(ccxt.async_support.binance):
         positions = await self.fetch_positions(None, params)
         self.positions[type] = ArrayCacheBySymbolBySide()
         cache = self.positions[type]
+        openPositions = []
         for i in range(0, len(positions)):
             position = positions[i]
             contracts = self.safe_number(position, 'contracts', 0)
             if contracts > 0:
-                cache.append(position)
+                openPositions.append(position)
+        cache.appendMany(openPositions)
         # don't remove the future from the .futures cache
         future = client.futures[messageHash]
         future.resolve(cache)
@@ -3619,7 +3621,7 @@ class binance(ccxt.async_support.binance):
             position['timestamp'] = timestamp
             position['datetime'] = self.iso8601(timestamp)
             newPositions.append(position)
-            cache.append(position)
+        cache.appendMany(newPositions)
         messageHashes = self.find_message_hashes(client, accountType + ':positions::')
         for i in range(0, len(messageHashes)):
             messageHash = messageHashes[i]
@@ -3994,6 +3996,37 @@ class binance(ccxt.async_support.binance):
         if (codeString is not None) and (codeString[0] == '5'):
             client.reset(message)
 
+    def message_handlers(self):
+        return {
+            'events': {
+                'depthUpdate': self.handle_order_book,
+                'trade': self.handle_trade,
+                'aggTrade': self.handle_trade,
+                'kline': self.handle_ohlcv,
+                'markPrice_kline': self.handle_ohlcv,
+                'indexPrice_kline': self.handle_ohlcv,
+                '1hTicker@arr': self.handle_tickers,
+                '4hTicker@arr': self.handle_tickers,
+                '1dTicker@arr': self.handle_tickers,
+                '24hrTicker@arr': self.handle_tickers,
+                '24hrMiniTicker@arr': self.handle_tickers,
+                '1hTicker': self.handle_tickers,
+                '4hTicker': self.handle_tickers,
+                '1dTicker': self.handle_tickers,
+                '24hrTicker': self.handle_tickers,
+                '24hrMiniTicker': self.handle_tickers,
+                'markPriceUpdate': self.handle_tickers,
+                'markPriceUpdate@arr': self.handle_tickers,
+                'bookTicker': self.handle_bids_asks,  # there is no "bookTicker@arr" endpoint
+                'outboundAccountPosition': self.handle_balance,
+                'balanceUpdate': self.handle_balance,
+                'ACCOUNT_UPDATE': self.handle_acount_update,
+                'executionReport': self.handle_order_update,
+                'ORDER_TRADE_UPDATE': self.handle_order_update,
+                'forceOrder': self.handle_liquidation,
+            },
+        }
+
     def handle_message(self, client: Client, message):
         # handle WebSocketAPI
         status = self.safe_string(message, 'status')
@@ -4008,38 +4041,11 @@ class binance(ccxt.async_support.binance):
             method(client, message)
             return
         # handle other APIs
-        methods: dict = {
-            'depthUpdate': self.handle_order_book,
-            'trade': self.handle_trade,
-            'aggTrade': self.handle_trade,
-            'kline': self.handle_ohlcv,
-            'markPrice_kline': self.handle_ohlcv,
-            'indexPrice_kline': self.handle_ohlcv,
-            '1hTicker@arr': self.handle_tickers,
-            '4hTicker@arr': self.handle_tickers,
-            '1dTicker@arr': self.handle_tickers,
-            '24hrTicker@arr': self.handle_tickers,
-            '24hrMiniTicker@arr': self.handle_tickers,
-            '1hTicker': self.handle_tickers,
-            '4hTicker': self.handle_tickers,
-            '1dTicker': self.handle_tickers,
-            '24hrTicker': self.handle_tickers,
-            '24hrMiniTicker': self.handle_tickers,
-            'markPriceUpdate': self.handle_tickers,
-            'markPriceUpdate@arr': self.handle_tickers,
-            'bookTicker': self.handle_bids_asks,  # there is no "bookTicker@arr" endpoint
-            'outboundAccountPosition': self.handle_balance,
-            'balanceUpdate': self.handle_balance,
-            'ACCOUNT_UPDATE': self.handle_acount_update,
-            'executionReport': self.handle_order_update,
-            'ORDER_TRADE_UPDATE': self.handle_order_update,
-            'forceOrder': self.handle_liquidation,
-        }
         event = self.safe_string(message, 'e')
         if isinstance(message, list):
             data = message[0]
             event = self.safe_string(data, 'e') + '@arr'
-        method = self.safe_value(methods, event)
+        method = self.get_message_handler('events', event)
         if method is None:
             requestId = self.safe_string(message, 'id')
             if requestId is not None:
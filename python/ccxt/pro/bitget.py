@@ -1792,6 +1792,24 @@ class bitget(ccxt.async_support.bitget):
                 client.reject(e)
             return True
 
+    def message_handlers(self):
+        return {
+            'channels': {
+                'ticker': self.handle_ticker,
+                'trade': self.handle_trades,
+                'fill': self.handle_my_trades,
+                'orders': self.handle_order,
+                'ordersAlgo': self.handle_order,
+                'orders-algo': self.handle_order,
+                'orders-crossed': self.handle_order,
+                'orders-isolated': self.handle_order,
+                'account': self.handle_balance,
+                'positions': self.handle_positions,
+                'account-isolated': self.handle_balance,
+                'account-crossed': self.handle_balance,
+            },
+        }
+
     def handle_message(self, client: Client, message):
         #
         #   {
@@ -1857,23 +1875,9 @@ class bitget(ccxt.async_support.bitget):
         if event == 'unsubscribe':
             self.handle_un_subscription_status(client, message)
             return
-        methods: dict = {
-            'ticker': self.handle_ticker,
-            'trade': self.handle_trades,
-            'fill': self.handle_my_trades,
-            'orders': self.handle_order,
-            'ordersAlgo': self.handle_order,
-            'orders-algo': self.handle_order,
-            'orders-crossed': self.handle_order,
-            'orders-isolated': self.handle_order,
-            'account': self.handle_balance,
-            'positions': self.handle_positions,
-            'account-isolated': self.handle_balance,
-            'account-crossed': self.handle_balance,
-        }
         arg = self.safe_value(message, 'arg', {})
         topic = self.safe_value(arg, 'channel', '')
-        method = self.safe_value(methods, topic)
+        method = self.get_message_handler('channels', topic)
         if method is not None:
             method(client, message)
         if topic.find('candle') >= 0:
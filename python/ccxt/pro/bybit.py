@@ -2282,6 +2282,33 @@ class bybit(ccxt.async_support.bybit):
                 client.reject(error, messageHash)
             return True
 
+    def message_handlers(self):
+        return {
+            'topics': {
+                'orderbook': self.handle_order_book,
+                'kline': self.handle_ohlcv,
+                'order': self.handle_order,
+                'stopOrder': self.handle_order,
+                'ticker': self.handle_ticker,
+                'trade': self.handle_trades,
+                'publicTrade': self.handle_trades,
+                'depth': self.handle_order_book,
+                'wallet': self.handle_balance,
+                'outboundAccountInfo': self.handle_balance,
+                'execution': self.handle_my_trades,
+                'ticketInfo': self.handle_my_trades,
+                'user.openapi.perp.trade': self.handle_my_trades,
+                'position': self.handle_positions,
+                'liquidation': self.handle_liquidation,
+                'pong': self.handle_pong,
+                'order.create': self.handle_order_ws,
+                'order.amend': self.handle_order_ws,
+                'order.cancel': self.handle_order_ws,
+                'auth': self.handle_authenticate,
+                'unsubscribe': self.handle_un_subscribe,
+            },
+        }
+
     def handle_message(self, client: Client, message):
         if self.handle_error_message(client, message):
             return
@@ -2301,29 +2328,7 @@ class bybit(ccxt.async_support.bybit):
             self.handle_subscription_status(client, message)
             return
         topic = self.safe_string_2(message, 'topic', 'op', '')
-        methods: dict = {
-            'orderbook': self.handle_order_book,
-            'kline': self.handle_ohlcv,
-            'order': self.handle_order,
-            'stopOrder': self.handle_order,
-            'ticker': self.handle_ticker,
-            'trade': self.handle_trades,
-            'publicTrade': self.handle_trades,
-            'depth': self.handle_order_book,
-            'wallet': self.handle_balance,
-            'outboundAccountInfo': self.handle_balance,
-            'execution': self.handle_my_trades,
-            'ticketInfo': self.handle_my_trades,
-            'user.openapi.perp.trade': self.handle_my_trades,
-            'position': self.handle_positions,
-            'liquidation': self.handle_liquidation,
-            'pong': self.handle_pong,
-            'order.create': self.handle_order_ws,
-            'order.amend': self.handle_order_ws,
-            'order.cancel': self.handle_order_ws,
-            'auth': self.handle_authenticate,
-            'unsubscribe': self.handle_un_subscribe,
-        }
+        methods = self.get_message_handlers('topics')
         exacMethod = self.safe_value(methods, topic)
         if exacMethod is not None:
             exacMethod(client, message)
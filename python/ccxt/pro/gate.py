@@ -1634,6 +1634,22 @@ class gate(ccxt.async_support.gate):
                 for i in range(0, len(keys)):
                     del self.trades[keys[i]]
 
+    def message_handlers(self):
+        return {
+            'channels': {
+                'usertrades': self.handle_my_trades,
+                'candlesticks': self.handle_ohlcv,
+                'orders': self.handle_order,
+                'positions': self.handle_positions,
+                'tickers': self.handle_ticker,
+                'book_ticker': self.handle_bid_ask,
+                'trades': self.handle_trades,
+                'order_book_update': self.handle_order_book,
+                'balances': self.handle_balance,
+                'liquidates': self.handle_liquidation,
+            },
+        }
+
     def handle_message(self, client: Client, message):
         #
         # subscribe
@@ -1736,19 +1752,7 @@ class gate(ccxt.async_support.gate):
         channel = self.safe_string(message, 'channel', '')
         channelParts = channel.split('.')
         channelType = self.safe_value(channelParts, 1)
-        v4Methods: dict = {
-            'usertrades': self.handle_my_trades,
-            'candlesticks': self.handle_ohlcv,
-            'orders': self.handle_order,
-            'positions': self.handle_positions,
-            'tickers': self.handle_ticker,
-            'book_ticker': self.handle_bid_ask,
-            'trades': self.handle_trades,
-            'order_book_update': self.handle_order_book,
-            'balances': self.handle_balance,
-            'liquidates': self.handle_liquidation,
-        }
-        method = self.safe_value(v4Methods, channelType)
+        method = self.get_message_handler('channels', channelType)
         if method is not None:
             method(client, message)
         requestId = self.safe_string(message, 'request_id')
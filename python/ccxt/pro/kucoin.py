@@ -1290,20 +1290,7 @@ class kucoin(ccxt.async_support.kucoin):
             self.handle_ticker(client, message)
             return
         subject = self.safe_string(message, 'subject')
-        methods: dict = {
-            'level1': self.handle_bid_ask,
-            'level2': self.handle_order_book,
-            'trade.l2update': self.handle_order_book,
-            'trade.ticker': self.handle_ticker,
-            'trade.snapshot': self.handle_ticker,
-            'trade.l3match': self.handle_trade,
-            'trade.candles.update': self.handle_ohlcv,
-            'account.balance': self.handle_balance,
-            'orderChange': self.handle_order,
-            'stopOrder': self.handle_order,
-            '/spot/tradeFills': self.handle_my_trade,
-        }
-        method = self.safe_value(methods, subject)
+        method = self.get_message_handler('subjects', subject)
         if method is not None:
             method(client, message)
 
@@ -1338,16 +1325,33 @@ class kucoin(ccxt.async_support.kucoin):
             self.options['urls'][type] = None
         self.handle_errors(None, None, client.url, None, None, data, message, None, None)
 
+    def message_handlers(self):
+        return {
+            'types': {
+                # 'heartbeat': self.handleHeartbeat,
+                'welcome': self.handle_system_status,
+                'ack': self.handle_subscription_status,
+                'message': self.handle_subject,
+                'pong': self.handle_pong,
+                'error': self.handle_error_message,
+            },
+            'subjects': {
+                'level1': self.handle_bid_ask,
+                'level2': self.handle_order_book,
+                'trade.l2update': self.handle_order_book,
+                'trade.ticker': self.handle_ticker,
+                'trade.snapshot': self.handle_ticker,
+                'trade.l3match': self.handle_trade,
+                'trade.candles.update': self.handle_ohlcv,
+                'account.balance': self.handle_balance,
+                'orderChange': self.handle_order,
+                'stopOrder': self.handle_order,
+                '/spot/tradeFills': self.handle_my_trade,
+            },
+        }
+
     def handle_message(self, client: Client, message):
         type = self.safe_string(message, 'type')
-        methods: dict = {
-            # 'heartbeat': self.handleHeartbeat,
-            'welcome': self.handle_system_status,
-            'ack': self.handle_subscription_status,
-            'message': self.handle_subject,
-            'pong': self.handle_pong,
-            'error': self.handle_error_message,
-        }
-        method = self.safe_value(methods, type)
+        method = self.get_message_handler('types', type)
         if method is not None:
             method(client, message)
@@ -2174,6 +2174,44 @@ class okx(ccxt.async_support.okx):
             return False
         return message
 
+    def message_handlers(self):
+        return {
+            'events': {
+                # 'info': self.handleSystemStatus,
+                # 'book': 'handleOrderBook',
+                'login': self.handle_authenticate,
+                'subscribe': self.handle_subscription_status,
+                'unsubscribe': self.handle_unsubscription,
+                'order': self.handle_place_orders,
+                'batch-orders': self.handle_place_orders,
+                'amend-order': self.handle_place_orders,
+                'batch-amend-orders': self.handle_place_orders,
+                'cancel-order': self.handle_place_orders,
+                'mass-cancel': self.handle_cancel_all_orders,
+            },
+            'channels': {
+                'bbo-tbt': self.handle_order_book,  # newly added channel that sends tick-by-tick Level 1 data, all API users can subscribe, public depth channel, verification not required
+                'books': self.handle_order_book,  # all API users can subscribe, public depth channel, verification not required
+                'books5': self.handle_order_book,  # all API users can subscribe, public depth channel, verification not required, data feeds will be delivered every 100ms(vs. every 200ms now)
+                'books50-l2-tbt': self.handle_order_book,  # only users who're VIP4 and above can subscribe, identity verification required before subscription
+                'books-l2-tbt': self.handle_order_book,  # only users who're VIP5 and above can subscribe, identity verification required before subscription
+                'tickers': self.handle_ticker,
+                'mark-price': self.handle_ticker,
+                'positions': self.handle_positions,
+                'index-tickers': self.handle_ticker,
+                'sprd-tickers': self.handle_ticker,
+                'block-tickers': self.handle_ticker,
+                'trades': self.handle_trades,
+                'account': self.handle_balance,
+                'funding-rate': self.handle_funding_rate,
+                # 'margin_account': self.handleBalance,
+                'orders': self.handle_orders,
+                'orders-algo': self.handle_orders,
+                'liquidation-orders': self.handle_liquidation,
+                'balance_and_position': self.handle_balance_and_position,
+            },
+        }
+
     def handle_message(self, client: Client, message):
         if not self.handle_error_message(client, message):
             return
@@ -2223,47 +2261,13 @@ class okx(ccxt.async_support.okx):
         # if table is None:
         event = self.safe_string_2(message, 'event', 'op')
         if event is not None:
-            methods: dict = {
-                # 'info': self.handleSystemStatus,
-                # 'book': 'handleOrderBook',
-                'login': self.handle_authenticate,
-                'subscribe': self.handle_subscription_status,
-                'unsubscribe': self.handle_unsubscription,
-                'order': self.handle_place_orders,
-                'batch-orders': self.handle_place_orders,
-                'amend-order': self.handle_place_orders,
-                'batch-amend-orders': self.handle_place_orders,
-                'cancel-order': self.handle_place_orders,
-                'mass-cancel': self.handle_cancel_all_orders,
-            }
-            method = self.safe_value(methods, event)
+            method = self.get_message_handler('events', event)
             if method is not None:
                 method(client, message)
         else:
             arg = self.safe_value(message, 'arg', {})
             channel = self.safe_string(arg, 'channel')
-            methods: dict = {
-                'bbo-tbt': self.handle_order_book,  # newly added channel that sends tick-by-tick Level 1 data, all API users can subscribe, public depth channel, verification not required
-                'books': self.handle_order_book,  # all API users can subscribe, public depth channel, verification not required
-                'books5': self.handle_order_book,  # all API users can subscribe, public depth channel, verification not required, data feeds will be delivered every 100ms(vs. every 200ms now)
-                'books50-l2-tbt': self.handle_order_book,  # only users who're VIP4 and above can subscribe, identity verification required before subscription
-                'books-l2-tbt': self.handle_order_book,  # only users who're VIP5 and above can subscribe, identity verification required before subscription
-                'tickers': self.handle_ticker,
-                'mark-price': self.handle_ticker,
-                'positions': self.handle_positions,
-                'index-tickers': self.handle_ticker,
-                'sprd-tickers': self.handle_ticker,
-                'block-tickers': self.handle_ticker,
-                'trades': self.handle_trades,
-                'account': self.handle_balance,
-                'funding-rate': self.handle_funding_rate,
-                # 'margin_account': self.handle_balance,
-                'orders': self.handle_orders,
-                'orders-algo': self.handle_orders,
-                'liquidation-orders': self.handle_liquidation,
-                'balance_and_position': self.handle_balance_and_position,
-            }
-            method = self.safe_value(methods, channel)
+            method = self.get_message_handler('channels', channel)
             if method is None:
                 if channel.find('candle') == 0:
                     self.handle_ohlcv(client, message)
@@ -0,0 +1,83 @@
+import asyncio
+import gzip
+import os
+import sys
+import zlib
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from aiohttp import WSMessage, WSMsgType  # noqa E402
+from ccxt.async_support.base.ws import aiohttp_client  # noqa E402
+from ccxt.async_support.base.ws.aiohttp_client import AiohttpClient  # noqa E402
+from ccxt.async_support.base.ws.functions import gunzip, gunzip_bytes, inflate, is_json_encoded_bytes  # noqa E402
+
+
+def deflate_raw(data):
+    compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+def create_client(received, gunzip=False, inflate=False):
+    def on_message(client, message):
+        received.append(message)
+
+    client = AiohttpClient('wss://example.com', on_message, None, None, None, {})
+    client.gunzip = gunzip
+    client.inflate = inflate
+    return client
+
+
+def test_binary_functions():
+    print("test_binary_functions")
+    payload = b'{"ch":"market.btcusdt.ticker","tick":{"close":1.5}}'
+    compressed = gzip.compress(payload)
+    for data in [compressed, bytearray(compressed), memoryview(compressed)]:
+        assert gunzip_bytes(data) == payload
+        assert gunzip(data) == payload.decode()
+    assert inflate(deflate_raw(payload)) == payload
+    for data in [payload, bytearray(payload), memoryview(payload), b'[1,2]']:
+        assert is_json_encoded_bytes(data)
+    for data in [b'pong', b'{', bytearray(b''), memoryview(b'ping')]:
+        assert not is_json_encoded_bytes(data)
+
+
+async def test_binary_frames():
+    print("test_binary_frames")
+    payload = b'{"ch":"market.btcusdt.ticker","tick":{"close":1.5}}'
+    expected = {'ch': 'market.btcusdt.ticker', 'tick': {'close': 1.5}}
+    orjson = aiohttp_client.orjson
+    # with orjson when it is installed, and with the json module of the standard library
+    for json_module in [orjson, None]:
+        aiohttp_client.orjson = json_module
+        try:
+            received = []
+            # gzip, raw deflate and plain frames, of every binary type
+            for client, frame in [
+                (create_client(received, gunzip=True), gzip.compress(payload)),
+                (create_client(received, inflate=True), deflate_raw(payload)),
+                (create_client(received), payload),
+            ]:
+                for data in [frame, bytearray(frame), memoryview(frame)]:
+                    client.handle_message(WSMessage(WSMsgType.BINARY, data, None))
+            assert received == [expected] * 9
+            # the frames that aren't json are decoded to str and passed through
+            received = []
+            create_client(received, gunzip=True).handle_message(WSMessage(WSMsgType.BINARY, gzip.compress(b'pong'), None))
+            client = create_client(received)
+            for data in [b'ping', bytearray(b'ping'), memoryview(b'ping')]:
+                client.handle_message(WSMessage(WSMsgType.BINARY, data, None))
+            client.handle_message(WSMessage(WSMsgType.TEXT, 'ping', None))
+            client.handle_message(WSMessage(WSMsgType.TEXT, payload.decode(), None))
+            assert received == ['pong', 'ping', 'ping', 'ping', 'ping', expected]
+        finally:
+            aiohttp_client.orjson = orjson
+
+
+async def test_ws_binary_frames():
+    test_binary_functions()
+    await test_binary_frames()
+
+
+if __name__ == '__main__':
+    asyncio.run(test_ws_binary_frames())
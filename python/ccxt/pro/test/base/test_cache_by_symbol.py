@@ -0,0 +1,169 @@
+import os
+import random
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide  # noqa: F402
+
+
+class ListCache:
+    # the reference: a list of the items in the order of their last update, the oldest one evicted first
+    def __init__(self, max_size, key):
+        self.max_size = max_size
+        self.key = key
+        self.items = []
+
+    def append(self, item):
+        for i, previous in enumerate(self.items):
+            if self.key(previous) == self.key(item):
+                previous.update(item)
+                del self.items[i]
+                self.items.append(previous)
+                return
+        self.items.append(item)
+        if self.max_size is not None and len(self.items) > self.max_size:
+            del self.items[0]
+
+
+def by_id(item):
+    return (item['symbol'], item['id'])
+
+
+def by_side(item):
+    return (item['symbol'], item['side'])
+
+
+def test_cache_by_symbol_by_id_matches_list():
+    print("test_cache_by_symbol_by_id_matches_list")
+    rng = random.Random(42)
+    for max_size in [None, 1, 10, 100]:
+        cache = ArrayCacheBySymbolById(max_size)
+        expected = ListCache(max_size, by_id)
+        for i in range(3000):
+            symbol = rng.choice(['BTC/USDT', 'ETH/USDT', 'LTC/USDT'])
+            order = {'symbol': symbol, 'id': str(rng.randint(0, 150)), 'status': rng.choice(['open', 'closed']), 'filled': i}
+            cache.append(dict(order))
+            expected.append(dict(order))
+            if i % 7 == 0:
+                # reads in between updates
+                assert len(cache) == len(expected.items)
+                assert cache[-1] == expected.items[-1]
+        assert list(cache) == expected.items
+        assert list(reversed(cache)) == list(reversed(expected.items))
+        assert cache[1:5] == expected.items[1:5]
+        assert [cache[i] for i in range(len(cache))] == expected.items
+        # the hashmap references the items of the cache
+        assert sum(len(orders) for orders in cache.hashmap.values()) == len(cache)
+        for order in cache:
+            assert cache.hashmap[order['symbol']][order['id']] is order
+
+
+def test_cache_by_symbol_by_side_matches_list():
+    print("test_cache_by_symbol_by_side_matches_list")
+    rng = random.Random(7)
+    symbols = ['BTC/USDT:USDT', 'ETH/USDT:USDT', 'SOL/USDT:USDT', 'XRP/USDT:USDT']
+    for max_size in [None, 1, 5]:
+        cache = ArrayCacheBySymbolBySide(max_size)
+        expected = ListCache(max_size, by_side)
+        for i in range(1000):
+            position = {'symbol': rng.choice(symbols), 'side': rng.choice(['long', 'short']), 'contracts': i}
+            if i % 3 == 0:
+                # a snapshot of several positions
+                burst = [dict(position, symbol=symbol) for symbol in rng.sample(symbols, 3)]
+                cache.append_many([dict(p) for p in burst])
+                for p in burst:
+                    expected.append(dict(p))
+            else:
+                cache.append(dict(position))
+                expected.append(dict(position))
+            if i % 7 == 0:
+                assert len(cache) == len(expected.items)
+                assert cache[-1] == expected.items[-1]
+        assert list(cache) == expected.items
+        assert sum(len(positions) for positions in cache.hashmap.values()) == len(cache)
+        for position in cache:
+            assert cache.hashmap[position['symbol']][position['side']] is position
+
+
+def test_cache_by_symbol_by_side_limit():
+    print("test_cache_by_symbol_by_side_limit")
+    cache = ArrayCacheBySymbolBySide()
+    cache.append_many([
+        {'symbol': 'BTC/USDT:USDT', 'side': 'long', 'contracts': 1},
+        {'symbol': 'BTC/USDT:USDT', 'side': 'short', 'contracts': 2},
+        {'symbol': 'ETH/USDT:USDT', 'side': 'long', 'contracts': 3},
+    ])
+    # the sides of a symbol are counted once per watch
+    assert cache.getLimit('BTC/USDT:USDT', None) == 2
+    assert cache.getLimit(None, None) == 3
+    cache.append({'symbol': 'BTC/USDT:USDT', 'side': 'long', 'contracts': 4})
+    cache.append({'symbol': 'BTC/USDT:USDT', 'side': 'long', 'contracts': 5})
+    assert cache.getLimit('BTC/USDT:USDT', None) == 1
+    assert cache.getLimit(None, 10) == 1
+    assert [position['contracts'] for position in cache] == [2, 3, 5]
+    assert cache[-1] is cache.hashmap['BTC/USDT:USDT']['long']
+
+
+def test_cache_by_symbol_append_many():
+    print("test_cache_by_symbol_append_many")
+    rng = random.Random(11)
+    symbols = ['BTC/USDT:USDT', 'ETH/USDT:USDT', 'SOL/USDT:USDT']
+    for cache_class in [ArrayCache, ArrayCacheBySymbolBySide]:
+        for max_size in [None, 2]:
+            batched = cache_class(max_size)
+            expected = cache_class(max_size)
+            for i in range(300):
+                burst = [{'symbol': rng.choice(symbols), 'side': rng.choice(['long', 'short']), 'contracts': i} for j in range(rng.randrange(4))]
+                # camelCase, as called by the transpiled handlers
+                batched.appendMany([dict(p) for p in burst])
+                for p in burst:
+                    expected.append(dict(p))
+                assert list(batched) == list(expected)
+                if i % 5 == 0:
+                    symbol = rng.choice(symbols + [None])
+                    assert batched.getLimit(symbol, None) == expected.getLimit(symbol, None)
+
+
+def test_cache_by_symbol_by_id_mutations():
+    print("test_cache_by_symbol_by_id_mutations")
+    cache = ArrayCacheBySymbolById(3)
+    for i in range(3):
+        cache.append({'symbol': 'BTC/USDT', 'id': str(i), 'status': 'open'})
+    # the same order id of another symbol is another order
+    cache.append({'symbol': 'ETH/USDT', 'id': '1', 'status': 'open'})
+    assert [order['id'] for order in cache] == ['1', '2', '1']
+    assert '0' not in cache.hashmap['BTC/USDT']
+    cache.append({'symbol': 'BTC/USDT', 'id': '1', 'status': 'closed'})
+    assert [(order['symbol'], order['id']) for order in cache] == [('BTC/USDT', '2'), ('ETH/USDT', '1'), ('BTC/USDT', '1')]
+    assert cache.hashmap['BTC/USDT']['1']['status'] == 'closed'
+    # replaced in place, as krakenfutures does for cancellations
+    canceled = dict(cache[0], status='canceled')
+    cache[0] = canceled
+    assert cache[0] is canceled
+    assert cache.hashmap['BTC/USDT']['2'] is canceled
+    cache.append({'symbol': 'BTC/USDT', 'id': '2', 'filled': 1})
+    assert cache[-1] is canceled
+    assert canceled['filled'] == 1
+    assert cache.pop(0)['symbol'] == 'ETH/USDT'
+    assert '1' not in cache.hashmap['ETH/USDT']
+    del cache[0]
+    assert len(cache) == 1
+    cache.clear()
+    assert len(cache) == 0
+    assert list(cache) == []
+    cache.append({'symbol': 'BTC/USDT', 'id': '2', 'status': 'open'})
+    assert cache == [{'symbol': 'BTC/USDT', 'id': '2', 'status': 'open'}]
+
+
+def test_ws_cache_by_symbol():
+    test_cache_by_symbol_by_id_matches_list()
+    test_cache_by_symbol_by_id_mutations()
+    test_cache_by_symbol_by_side_matches_list()
+    test_cache_by_symbol_by_side_limit()
+    test_cache_by_symbol_append_many()
+
+
+if __name__ == '__main__':
+    test_ws_cache_by_symbol()
@@ -0,0 +1,165 @@
+import asyncio
+import copy
+import json
+import os
+import pickle
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+import ccxt.pro  # noqa E402
+from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheBySymbolById, CompactTrade, CompactTradesArrayCache, CompactTradeCaches  # noqa: F402
+
+
+def create_trade(timestamp, id, **extra):
+    trade = {
+        'info': {'t': id},
+        'timestamp': timestamp,
+        'datetime': ccxt.Exchange.iso8601(timestamp),
+        'symbol': 'BTC/USDT',
+        'id': id,
+        'order': None,
+        'type': None,
+        'side': 'buy',
+        'takerOrMaker': 'taker',
+        'price': 100.0,
+        'amount': 0.5,
+        'cost': 50.0,
+        'fee': None,
+        'fees': [],
+    }
+    trade.update(extra)
+    return trade
+
+
+def test_compact_trade_mapping():
+    print("test_compact_trade_mapping")
+    trade = create_trade(1579482900123, '1')
+    compact = CompactTrade(trade)
+    assert compact == trade
+    assert list(compact) == list(trade)
+    assert list(compact.items()) == list(trade.items())
+    assert len(compact) == len(trade)
+    assert compact['datetime'] == '2020-01-20T01:15:00.123Z'
+    assert compact.get('unknown') is None
+    assert 'fees' in compact and 'unknown' not in compact
+    assert ccxt.Exchange.safe_string(compact, 'price') == '100.0'
+    # the datetime follows the timestamp
+    compact['timestamp'] = 1579482960000
+    assert compact['datetime'] == '2020-01-20T01:16:00.000Z'
+    compact['datetime'] = 'set'
+    assert compact['datetime'] == 'set'
+    # other keys than the unified ones
+    extended = CompactTrade(create_trade(1579482900123, '2', isBuyerMaker=True))
+    assert extended['isBuyerMaker'] is True
+    assert list(extended)[-1] == 'isBuyerMaker'
+    del extended['order']
+    assert 'order' not in extended
+    assert len(extended) == 14
+    # a datetime without a timestamp is kept as it is
+    partial = CompactTrade({'datetime': '2020-01-20T01:15:00.123Z', 'price': 1.0})
+    assert partial == {'datetime': '2020-01-20T01:15:00.123Z', 'price': 1.0}
+    assert CompactTrade(trade, False)['info'] is None
+    assert pickle.loads(pickle.dumps(compact)) == compact
+    assert copy.deepcopy(extended) == extended
+    assert dict(extended) == copy.copy(extended)
+
+
+def test_compact_trades_cache():
+    print("test_compact_trades_cache")
+    cache = ArrayCache(3)
+    cache.append(create_trade(1579482900000, '0'))
+    caches = CompactTradeCaches({}, False)
+    caches['BTC/USDT'] = cache
+    assert type(cache) is CompactTradesArrayCache
+    for i in range(1, 5):
+        cache.append(create_trade(1579482900000 + i, str(i)))
+    assert [trade['id'] for trade in cache] == ['2', '3', '4']
+    assert all(type(trade) is CompactTrade and trade['info'] is None for trade in cache)
+    assert cache.getLimit('BTC/USDT', None) == 5
+    # the caches are converted at any depth
+    caches['ETH/USDT'] = {'1m': ArrayCache(1)}
+    assert type(caches['ETH/USDT']) is CompactTradeCaches
+
+
+async def test_compact_trades_option():
+    print("test_compact_trades_option")
+    exchange = ccxt.pro.binance({'options': {'ws': {'compactTrades': True}}})
+    assert isinstance(exchange.trades, CompactTradeCaches)
+    client = exchange.client('wss://stream.binance.com:9443/ws')
+    for i in range(3):
+        exchange.handle_trade(client, {
+            'e': 'trade', 'E': 1579482900000 + i, 's': 'BTCUSDT', 't': 100 + i, 'p': '10000.5', 'q': '0.1',
+            'b': 88, 'a': 50, 'T': 1579482900000 + i, 'm': True, 'M': True,
+        })
+    stored = exchange.trades['BTCUSDT']
+    assert type(stored) is CompactTradesArrayCache
+    assert [trade['id'] for trade in stored] == ['100', '101', '102']
+    assert stored[0]['datetime'] == '2020-01-20T01:15:00.000Z'
+    assert stored[0]['info']['t'] == 100
+    assert exchange.filter_by_since_limit(stored, 1579482900001, None, 'timestamp', True) == stored[1:]
+    await exchange.close()
+    assert type(ccxt.pro.binance().trades) is dict
+
+
+async def test_compact_trades_assigned():
+    print("test_compact_trades_assigned")
+    # cex replaces self.trades with the ArrayCache of the symbol it watches
+    exchange = ccxt.pro.cex({'options': {'ws': {'compactTrades': True, 'compactTradesInfo': False}}})
+    exchange.set_markets([exchange.safe_market_structure({'id': 'BTC-USD', 'symbol': 'BTC/USD', 'base': 'BTC', 'quote': 'USD', 'type': 'spot', 'spot': True})])
+    exchange.options['currentWatchTradeSymbol'] = 'BTC/USD'
+    client = exchange.client('wss://ws.cex.io/ws')
+    exchange.handle_trades_snapshot(client, {'e': 'history', 'data': ['sell:1710255658251:42530:71300:14892621']})
+    exchange.handle_trade(client, {'e': 'history-update', 'data': [['buy', '1710255706095', '444444', '71222.2', '14892622']]})
+    assert type(exchange.trades) is CompactTradesArrayCache
+    assert [trade['id'] for trade in exchange.trades] == ['14892621', '14892622']
+    assert all(type(trade) is CompactTrade and trade['info'] is None for trade in exchange.trades)
+    exchange.trades = {}
+    assert type(exchange.trades) is CompactTradeCaches
+    # the trades of an ArrayCacheBySymbolById are updated in place and stay dicts, as idex stores them
+    by_id = ArrayCacheBySymbolById(10)
+    exchange.trades = by_id
+    assert exchange.trades is by_id
+    await exchange.close()
+
+
+async def test_compact_trades_as_dicts():
+    print("test_compact_trades_as_dicts")
+    # the watch_trades results are CompactTrade records, which are mappings and not dicts
+    exchange = ccxt.pro.binance({'options': {'ws': {'compactTrades': True}}})
+    client = exchange.client('wss://stream.binance.com:9443/ws')
+    for i in range(2):
+        exchange.handle_trade(client, {
+            'e': 'trade', 'E': 1579482900000 + i, 's': 'BTCUSDT', 't': 100 + i, 'p': '10000.5', 'q': '0.1',
+            'b': 88, 'a': 50, 'T': 1579482900000 + i, 'm': True, 'M': True,
+        })
+    stored = exchange.trades['BTCUSDT']
+    # as watch_trades() returns them, the new updates of the cache
+    trades = exchange.filter_by_since_limit(stored, None, stored.getLimit('BTCUSDT', None), 'timestamp', True)
+    assert len(trades) == 2
+    dicts = [dict(trade) for trade in trades]
+    assert all(type(trade) is CompactTrade for trade in trades)
+    assert json.loads(exchange.json(trades)) == json.loads(exchange.json(dicts))
+    assert json.dumps(trades, default=dict) == json.dumps(dicts)
+    # extend() and deep_extend() merge them as the dicts they stand for
+    assert exchange.extend(trades[0], {'price': 1.0}) == exchange.extend(dicts[0], {'price': 1.0})
+    assert exchange.extend({'price': 1.0}, trades[0]) == exchange.extend({'price': 1.0}, dicts[0])
+    extended = exchange.deep_extend(trades[0], {'info': {'x': 1}})
+    assert extended == exchange.deep_extend(dicts[0], {'info': {'x': 1}})
+    assert type(extended) is dict and extended['info']['t'] == 100 and extended['info']['x'] == 1
+    assert exchange.deep_extend({'info': {'x': 1}}, trades[0]) == exchange.deep_extend({'info': {'x': 1}}, dicts[0])
+    assert trades[0]['info'] == {'e': 'trade', 'E': 1579482900000, 's': 'BTCUSDT', 't': 100, 'p': '10000.5', 'q': '0.1', 'b': 88, 'a': 50, 'T': 1579482900000, 'm': True, 'M': True}
+    await exchange.close()
+
+
+async def test_ws_compact_trades():
+    test_compact_trade_mapping()
+    test_compact_trades_cache()
+    await test_compact_trades_option()
+    await test_compact_trades_assigned()
+    await test_compact_trades_as_dicts()
+
+
+if __name__ == '__main__':
+    asyncio.run(test_ws_compact_trades())
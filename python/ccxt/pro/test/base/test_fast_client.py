@@ -0,0 +1,65 @@
+import asyncio
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from aiohttp import WSMessage, WSMsgType  # noqa E402
+from ccxt.async_support.base.ws.fast_client import FastClient  # noqa E402
+
+
+def create_client(batch_messages):
+    def on_message(client, message):
+        client.resolve(message['value'], message['hash'])
+
+    return FastClient('wss://example.com', on_message, None, None, None, {'batchMessages': batch_messages})
+
+
+def feed(client, messages):
+    for hash, value in messages:
+        client.stack.append(WSMessage(WSMsgType.TEXT, '{"hash":"' + hash + '","value":' + str(value) + '}', None))
+
+
+async def test_batch_resolves_latest_result():
+    print("test_batch_resolves_latest_result")
+    client = create_client(True)
+    ticker = client.future('ticker')
+    trades = client.future('trades')
+    feed(client, [('ticker', 1), ('trades', 10), ('ticker', 2), ('ticker', 3)])
+    resolved = []
+    original = client.resolve
+
+    def counting_resolve(result, message_hash):
+        if not client.batching:
+            resolved.append(message_hash)
+        return original(result, message_hash)
+
+    client.resolve = counting_resolve
+    client.drain_stack()
+    assert not client.stack
+    assert ticker.result() == 3
+    assert trades.result() == 10
+    assert resolved == ['ticker', 'trades'], resolved
+    assert client.pending_resolves == {}
+
+
+async def test_batch_keeps_message_queue():
+    print("test_batch_keeps_message_queue")
+    client = create_client(True)
+    client.useMessageQueue = True
+    client.message_queue = {}
+    feed(client, [('ticker', 1), ('ticker', 2)])
+    client.drain_stack()
+    # nobody was waiting, every message stays queued in order
+    assert client.future('ticker').result() == 1
+    assert client.future('ticker').result() == 2
+
+
+async def test_ws_fast_client():
+    await test_batch_resolves_latest_result()
+    await test_batch_keeps_message_queue()
+
+
+if __name__ == '__main__':
+    asyncio.run(test_ws_fast_client())
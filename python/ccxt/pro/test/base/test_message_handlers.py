@@ -0,0 +1,39 @@
+import asyncio
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+import ccxt.pro  # noqa E402
+
+
+async def test_message_handlers_are_bound_once():
+    print("test_message_handlers_are_bound_once")
+    for id in ['binance', 'bybit', 'okx', 'gate', 'kucoin', 'bitget']:
+        exchange = getattr(ccxt.pro, id)()
+        for table, routes in exchange.message_handlers().items():
+            handlers = exchange.get_message_handlers(table)
+            assert handlers is exchange.get_message_handlers(table)
+            assert handlers == routes, id + ' ' + table
+        await exchange.close()
+    exchange = ccxt.pro.binance()
+    assert exchange.get_message_handler('events', 'depthUpdate') == exchange.handle_order_book
+    assert exchange.get_message_handler('events', 'unknown') is None
+    assert exchange.get_message_handler('events', None) is None
+    assert exchange.get_message_handlers('unknown') == {}
+    # instances don't share their bound handlers
+    assert ccxt.pro.binance().get_message_handlers('events') is not exchange.get_message_handlers('events')
+    await exchange.close()
+    # the exchanges without routing tables
+    exchange = ccxt.pro.kraken()
+    assert exchange.get_message_handler('events', 'trade') is None
+    await exchange.close()
+
+
+async def test_ws_message_handlers():
+    await test_message_handlers_are_bound_once()
+
+
+if __name__ == '__main__':
+    asyncio.run(test_ws_message_handlers())
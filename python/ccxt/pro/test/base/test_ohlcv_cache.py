@@ -0,0 +1,114 @@
+import asyncio
+import os
+import random
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+import ccxt.pro  # noqa E402
+from ccxt.async_support.base.ws.cache import ArrayCacheByTimestamp, ColumnarArrayCacheByTimestamp, ColumnarCaches  # noqa: F402
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def test_ohlcv_cache_matches_list():
+    print("test_ohlcv_cache_matches_list")
+    rng = random.Random(3)
+    for max_size in [None, 1, 10, 100]:
+        cache = ColumnarArrayCacheByTimestamp(max_size)
+        expected = ArrayCacheByTimestamp(max_size)
+        timestamp = 1700000000000
+        for i in range(2000):
+            choice = rng.random()
+            if choice < 0.6:
+                # an update of the last candle
+                candle_timestamp = timestamp
+            elif choice < 0.9:
+                timestamp += 60000
+                candle_timestamp = timestamp
+            else:
+                # a late update of an older candle, or of one evicted already
+                candle_timestamp = timestamp - 60000 * rng.randint(1, 20)
+            close = float(rng.randint(1, 1000))
+            volume = None if i % 50 == 0 else float(i)
+            candle = [candle_timestamp, 1.5, close + 1, close - 1, close, volume]
+            cache.append(list(candle))
+            expected.append(list(candle))
+            if i % 7 == 0:
+                assert len(cache) == len(expected)
+                assert cache[-1] == expected[-1]
+                assert cache.getLimit('BTC/USDT', None) == expected.getLimit('BTC/USDT', None)
+        assert list(cache) == list(expected)
+        assert list(reversed(cache)) == list(reversed(expected))
+        assert cache[2:5] == expected[2:5]
+        assert cache[-3:] == expected[-3:]
+        assert cache.getLimit(None, 2) == expected.getLimit(None, 2)
+        assert cache == list(expected)
+        assert all(type(candle[0]) is int for candle in cache)
+
+
+def test_ohlcv_cache_columns():
+    print("test_ohlcv_cache_columns")
+    cache = ColumnarArrayCacheByTimestamp(3)
+    for i in range(5):
+        cache.append([i * 60000, 1.0, 2.0, 0.5, float(i), 10.0])
+    columns = cache.columns()
+    assert list(columns['timestamp']) == [120000.0, 180000.0, 240000.0]
+    assert list(columns['close']) == [2.0, 3.0, 4.0]
+    # an upsert of the last candle is seen by the views
+    cache.append([240000, 1.0, 2.0, 0.5, 4.5, 11.0])
+    assert columns['close'][-1] == 4.5
+    assert columns['volume'][-1] == 11.0
+    # the views don't prevent the cache from growing
+    for i in range(5, 100):
+        cache.append([i * 60000, 1.0, 2.0, 0.5, float(i), 10.0])
+    assert cache.columns()['close'].tolist() == [97.0, 98.0, 99.0]
+    if numpy is not None:
+        arrays = cache.as_arrays()
+        assert arrays['close'].dtype == numpy.float64
+        assert arrays['close'].tolist() == [97.0, 98.0, 99.0]
+    assert cache.pop(0) == [97 * 60000, 1.0, 2.0, 0.5, 97.0, 10.0]
+    del cache[-1]
+    assert cache == [[98 * 60000, 1.0, 2.0, 0.5, 98.0, 10.0]]
+    cache.clear()
+    assert len(cache) == 0
+    cache.append([0, 1.0, 2.0, 0.5, 1.0, 1.0])
+    assert cache == [[0, 1.0, 2.0, 0.5, 1.0, 1.0]]
+
+
+async def test_ohlcv_cache_option():
+    print("test_ohlcv_cache_option")
+    exchange = ccxt.pro.binance({'options': {'ws': {'ohlcvCache': 'columnar'}}})
+    assert isinstance(exchange.ohlcvs, ColumnarCaches)
+    client = exchange.client('wss://stream.binance.com:9443/stream')
+    for timestamp, close in [(1579482900000, '0.019135'), (1579482900000, '0.019140'), (1579482960000, '0.019150')]:
+        exchange.handle_ohlcv(client, {
+            'e': 'kline',
+            'E': timestamp + 21215,
+            's': 'ETHBTC',
+            'k': {'t': timestamp, 's': 'ETHBTC', 'i': '1m', 'o': '0.019132', 'c': close, 'h': '0.019160', 'l': '0.019132', 'v': '5.084'},
+        })
+    stored = exchange.ohlcvs['ETHBTC']['1m']
+    assert type(stored) is ColumnarArrayCacheByTimestamp
+    assert stored.max_size == 1000
+    assert stored == [
+        [1579482900000, 0.019132, 0.01916, 0.019132, 0.01914, 5.084],
+        [1579482960000, 0.019132, 0.01916, 0.019132, 0.01915, 5.084],
+    ]
+    assert exchange.filter_by_since_limit(stored, 1579482960000, None, 0, True) == [stored[-1]]
+    await exchange.close()
+    assert type(ccxt.pro.binance().ohlcvs) is dict
+
+
+async def test_ws_ohlcv_cache():
+    test_ohlcv_cache_matches_list()
+    test_ohlcv_cache_columns()
+    await test_ohlcv_cache_option()
+
+
+if __name__ == '__main__':
+    asyncio.run(test_ws_ohlcv_cache())
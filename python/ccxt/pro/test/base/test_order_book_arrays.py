@@ -0,0 +1,77 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from ccxt.async_support.base.ws.order_book import OrderBook, IndexedOrderBook, SortedOrderBook  # noqa: F402
+from ccxt.async_support.base.ws.order_book_side import numpy, SortedDict  # noqa: F402
+
+
+def test_order_book_arrays():
+    print("test_order_book_arrays")
+    for book_class in [OrderBook, SortedOrderBook]:
+        orderbook = book_class({
+            'bids': [[10, 1], [9.5, 2], [9, 3]],
+            'asks': [[11, 4], [12, 5]],
+        })
+        arrays = orderbook.as_arrays()
+        bid_prices, bid_sizes = arrays['bids']
+        assert bid_prices.dtype == numpy.float64
+        assert bid_prices.flags['C_CONTIGUOUS']
+        assert bid_prices.tolist() == [10, 9.5, 9]
+        assert bid_sizes.tolist() == [1, 2, 3]
+        assert arrays['asks'][0].tolist() == [11, 12]
+        # cached until the book changes
+        assert orderbook.as_arrays()['bids'][0] is bid_prices
+        ask_prices, ask_sizes = orderbook.as_arrays(1)['asks']
+        assert ask_prices.tolist() == [11] and ask_sizes.tolist() == [4]
+        orderbook['bids'].store(9.75, 7)
+        orderbook['bids'].store(10, 0)
+        bid_prices, bid_sizes = orderbook.as_arrays()['bids']
+        assert bid_prices.tolist() == [9.75, 9.5, 9]
+        assert bid_sizes.tolist() == [7, 2, 3]
+        orderbook.reset({'asks': [[13, 1]]})
+        assert orderbook.as_arrays()['bids'][0].tolist() == []
+        assert orderbook.as_arrays()['asks'][0].tolist() == [13]
+
+
+def test_order_book_arrays_limit():
+    print("test_order_book_arrays_limit")
+    # sortedcontainers is optional as well
+    book_classes = [OrderBook] if SortedDict is None else [OrderBook, SortedOrderBook]
+    for book_class in book_classes:
+        orderbook = book_class({}, 2)
+        for price in [3, 2, 1]:
+            orderbook['bids'].store(price, 1)
+        assert orderbook.as_arrays()['bids'][0].tolist() == [3, 2, 1]
+        # the levels past the depth are dropped by limit(), the arrays follow
+        orderbook.limit()
+        assert orderbook.as_arrays()['bids'][0].tolist() == [3, 2]
+        orderbook['bids'].store(4, 1)
+        orderbook.limit()
+        assert orderbook.as_arrays()['bids'][0].tolist() == [4, 3]
+
+
+def test_indexed_order_book_arrays():
+    print("test_indexed_order_book_arrays")
+    orderbook = IndexedOrderBook({
+        'bids': [[10, 1, 'a'], [10, 2, 'b'], [9, 3, 'c']],
+        'asks': [],
+    })
+    bid_prices, bid_sizes = orderbook.as_arrays()['bids']
+    assert bid_prices.tolist() == [10, 10, 9]
+    assert bid_sizes.tolist() == [1, 2, 3]
+
+
+def test_ws_order_book_arrays():
+    if numpy is None:
+        # numpy is an optional dependency
+        return
+    test_order_book_arrays()
+    test_order_book_arrays_limit()
+    test_indexed_order_book_arrays()
+
+
+if __name__ == '__main__':
+    test_ws_order_book_arrays()
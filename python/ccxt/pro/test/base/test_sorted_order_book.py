@@ -0,0 +1,63 @@
+import json
+import os
+import random
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from ccxt.async_support.base.ws.order_book import OrderBook, IndexedOrderBook, CountedOrderBook, SortedOrderBook, SortedIndexedOrderBook, SortedCountedOrderBook  # noqa: F402
+from ccxt.async_support.base.ws.order_book_side import SortedDict  # noqa: F402
+from ccxt.pro.test.base import test_order_book  # noqa: F402
+
+
+def test_sorted_order_book_shared_suite():
+    print("test_sorted_order_book_shared_suite")
+    # run the generated order book tests against the sorted backend
+    originals = (test_order_book.OrderBook, test_order_book.IndexedOrderBook, test_order_book.CountedOrderBook)
+    test_order_book.OrderBook = SortedOrderBook
+    test_order_book.IndexedOrderBook = SortedIndexedOrderBook
+    test_order_book.CountedOrderBook = SortedCountedOrderBook
+    try:
+        test_order_book.test_ws_order_book()
+    finally:
+        test_order_book.OrderBook, test_order_book.IndexedOrderBook, test_order_book.CountedOrderBook = originals
+
+
+def test_sorted_order_book_matches_list_backend():
+    print("test_sorted_order_book_matches_list_backend")
+    rng = random.Random(42)
+    for book_class, sorted_class, width in [(OrderBook, SortedOrderBook, 2), (CountedOrderBook, SortedCountedOrderBook, 3), (IndexedOrderBook, SortedIndexedOrderBook, 3)]:
+        expected = book_class({}, 50)
+        actual = sorted_class({}, 50)
+        for _ in range(5000):
+            side = rng.choice(['bids', 'asks'])
+            price = rng.randint(1, 300) / 4
+            size = rng.choice([0, rng.randint(1, 10)])
+            delta = [price, size]
+            if width == 3:
+                delta.append(rng.randint(0, 3) if book_class is CountedOrderBook else rng.randint(0, 500))
+            expected[side].storeArray(list(delta))
+            actual[side].storeArray(list(delta))
+        for side in ['bids', 'asks']:
+            assert len(actual[side]) == len(expected[side])
+            assert actual[side][0] == expected[side][0]
+            assert actual[side][-1] == expected[side][-1]
+            assert actual[side][3:10] == expected[side][3:10]
+        expected.limit()
+        actual.limit()
+        assert actual == expected
+        # the underlying list is refreshed by limit(), so serializers see the same book
+        assert json.dumps(actual) == json.dumps(expected)
+
+
+def test_ws_sorted_order_book():
+    if SortedDict is None:
+        # sortedcontainers is an optional dependency
+        return
+    test_sorted_order_book_shared_suite()
+    test_sorted_order_book_matches_list_backend()
+
+
+if __name__ == '__main__':
+    test_ws_sorted_order_book()
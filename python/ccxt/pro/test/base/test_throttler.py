@@ -0,0 +1,190 @@
+import asyncio
+import os
+import sys
+from time import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from aiohttp import web  # noqa E402
+import ccxt.async_support  # noqa E402
+from ccxt.async_support.base.throttler import Throttler  # noqa E402
+
+
+async def test_throttler_rate():
+    print("test_throttler_rate")
+    # one token every 10 ms, the first call is released immediately
+    throttler = Throttler({'refillRate': 1 / 10, 'capacity': 1})
+    start = time()
+    await asyncio.gather(*[throttler(1) for _ in range(11)])
+    elapsed = (time() - start) * 1000
+    assert elapsed >= 95, f"Expected at least 100 ms to release 11 calls, got {elapsed:.1f} ms"
+    assert elapsed < 400, f"Throttler is too slow, took {elapsed:.1f} ms"
+
+
+async def test_throttler_sleeps_instead_of_polling():
+    print("test_throttler_sleeps_instead_of_polling")
+    throttler = Throttler({'refillRate': 1 / 50, 'capacity': 1})
+    sleeps = []
+    original = throttler.sleep
+
+    async def counting_sleep(seconds):
+        sleeps.append(seconds)
+        await original(seconds)
+
+    throttler.sleep = counting_sleep
+    await asyncio.gather(*[throttler(1) for _ in range(3)])
+    # a 1 ms poll would have woken up ~100 times, allow one extra wake-up per call for timer jitter
+    assert len(sleeps) <= 4, f"Expected one sleep per throttled call, got {len(sleeps)}"
+
+
+async def test_throttler_max_capacity():
+    print("test_throttler_max_capacity")
+    throttler = Throttler({'refillRate': 1 / 1000, 'maxCapacity': 2})
+    futures = [throttler(1) for _ in range(3)]
+    try:
+        throttler(1)
+        assert False, "Expected the queue to overflow"
+    except RuntimeError as e:
+        assert 'maxCapacity' in str(e)
+    for future in futures:
+        future.cancel()
+    throttler.running = False
+    throttler.notify()
+
+
+async def test_throttler_priorities():
+    print("test_throttler_priorities")
+    throttler = Throttler({'refillRate': 1 / 5, 'capacity': 1})
+    released = []
+
+    async def call(name, priority):
+        await throttler(1, priority)
+        released.append(name)
+
+    tasks = [asyncio.ensure_future(call('backfill' + str(i), 'backfill')) for i in range(5)]
+    tasks += [asyncio.ensure_future(call('market' + str(i), None)) for i in range(3)]
+    await asyncio.sleep(0)
+    tasks.append(asyncio.ensure_future(call('cancel', 'trading')))
+    await asyncio.gather(*tasks)
+    # only the call released right away gets ahead of the cancel, backfill waits for everything else
+    assert released.index('cancel') == 1, released
+    assert released[5:] == ['backfill1', 'backfill2', 'backfill3', 'backfill4'], released
+    exchange = ccxt.async_support.binance({'options': {'deriveRateLimitPriority': True}})
+    assert exchange.handle_rate_limit_priority('public', 'GET', {'limit': 5}) == ['marketData', {'limit': 5}]
+    assert exchange.handle_rate_limit_priority('private', 'DELETE', {}) == ['trading', {}]
+    assert exchange.handle_rate_limit_priority('sapi', 'GET', {}) == ['account', {}]
+    assert exchange.handle_rate_limit_priority('public', 'GET', {'rateLimitPriority': 'backfill'}) == ['backfill', {}]
+    await exchange.close()
+
+
+async def test_throttler_shared_buckets():
+    print("test_throttler_shared_buckets")
+    options = {
+        'sharedRateLimit': 'test-account',
+        'rateLimitGroups': {
+            'sapi': {'refillRate': 1 / 100},
+            'fapiPrivate': {},
+            'fapiPublic': 'fapiPrivate',
+        },
+    }
+    spot = ccxt.async_support.binance({'options': options})
+    futures = ccxt.async_support.binanceusdm({'options': options})
+    private = ccxt.async_support.binance({'apiKey': 'key', 'options': {'sharedRateLimit': True}})
+    isolated = ccxt.async_support.binance({'apiKey': 'key'})
+    assert spot.throttler is futures.throttler
+    assert spot.throttlers['sapi'] is futures.throttlers['sapi']
+    assert spot.throttlers['sapi'] is not spot.throttler
+    assert spot.throttlers['sapi'].config['refillRate'] == 1 / 100
+    assert spot.throttlers['fapiPublic'] is spot.throttlers['fapiPrivate']
+    assert private.throttler is not spot.throttler
+    assert isolated.throttler is not private.throttler
+    await spot.throttle(1, 'sapi')
+    assert spot.throttlers['sapi'].config['tokens'] == -1
+    assert spot.throttler.config['tokens'] == 0
+    for exchange in [spot, futures, private, isolated]:
+        await exchange.close()
+
+
+async def test_throttler_adapts_to_rate_limit_headers():
+    print("test_throttler_adapts_to_rate_limit_headers")
+    used_weight = {'value': 5990}
+
+    async def ping(request):
+        return web.json_response({}, headers={'X-MBX-USED-WEIGHT-1M': str(used_weight['value'])})
+
+    app = web.Application()
+    app.router.add_get('/api/v3/ping', ping)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    exchange = ccxt.async_support.binance({'options': {'adaptiveRateLimit': True}})
+    exchange.urls['api']['public'] = 'http://127.0.0.1:' + str(port) + '/api/v3'
+    throttler = exchange.throttler
+    try:
+        # 10 weight left for the rest of the minute, slow down
+        await exchange.public_get_ping()
+        assert throttler.config['refillRate'] < throttler.refill_rate
+        # plenty of headroom, speed up to at most twice the configured rate
+        used_weight['value'] = 10
+        await exchange.public_get_ping()
+        assert throttler.config['refillRate'] > throttler.refill_rate
+        assert throttler.config['refillRate'] <= throttler.refill_rate * 2
+        # exhausted, hold the queue
+        used_weight['value'] = 6000
+        await exchange.public_get_ping()
+        assert throttler.config['tokens'] < 0
+        assert throttler.config['refillRate'] == throttler.refill_rate
+    finally:
+        await exchange.close()
+        await runner.cleanup()
+
+
+async def test_throttler_adapts_group_to_endpoint_headers():
+    print("test_throttler_adapts_group_to_endpoint_headers")
+
+    async def server_time(request):
+        return web.json_response({'retCode': 0, 'result': {}}, headers={
+            'X-Bapi-Limit-Status': '1',
+            'X-Bapi-Limit': '10',
+            'X-Bapi-Limit-Reset-Timestamp': str(int(time() * 1000) + 500),
+        })
+
+    app = web.Application()
+    app.router.add_get('/v5/market/time', server_time)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    plain = ccxt.async_support.bybit({'options': {'adaptiveRateLimit': True}})
+    grouped = ccxt.async_support.bybit({'options': {'adaptiveRateLimit': True, 'rateLimitGroups': {'public': {}}}})
+    try:
+        for exchange in [plain, grouped]:
+            exchange.urls['api']['public'] = 'http://127.0.0.1:' + str(port)
+            await exchange.public_get_v5_market_time()
+        # bybit sends the budget of the endpoint, it never slows down the bucket of the whole exchange
+        assert plain.throttler.config['refillRate'] == plain.throttler.refill_rate
+        assert grouped.throttler.config['refillRate'] == grouped.throttler.refill_rate
+        group = grouped.throttlers['public']
+        assert group.config['refillRate'] < group.refill_rate
+    finally:
+        await plain.close()
+        await grouped.close()
+        await runner.cleanup()
+
+
+async def test_ws_throttler():
+    await test_throttler_rate()
+    await test_throttler_sleeps_instead_of_polling()
+    await test_throttler_max_capacity()
+    await test_throttler_priorities()
+    await test_throttler_shared_buckets()
+    await test_throttler_adapts_to_rate_limit_headers()
+    await test_throttler_adapts_group_to_endpoint_headers()
+
+
+if __name__ == '__main__':
+    asyncio.run(test_ws_throttler())
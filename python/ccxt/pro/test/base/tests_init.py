@@ -8,13 +8,31 @@ from asyncio import run
 
 from ccxt.pro.test.base.test_order_book import test_ws_order_book  # noqa: F401
 from ccxt.pro.test.base.test_cache import test_ws_cache  # noqa: F401
+from ccxt.pro.test.base.test_cache_by_symbol import test_ws_cache_by_symbol  # noqa: F401
+from ccxt.pro.test.base.test_ohlcv_cache import test_ws_ohlcv_cache  # noqa: F401
+from ccxt.pro.test.base.test_compact_trades import test_ws_compact_trades  # noqa: F401
 # todo : from ccxt.pro.test.base.test_close import test_ws_close  # noqa: F401
 from ccxt.pro.test.base.test_future import test_ws_future  # noqa: F401
+from ccxt.pro.test.base.test_throttler import test_ws_throttler  # noqa: F401
+from ccxt.pro.test.base.test_fast_client import test_ws_fast_client  # noqa: F401
+from ccxt.pro.test.base.test_binary_frames import test_ws_binary_frames  # noqa: F401
+from ccxt.pro.test.base.test_sorted_order_book import test_ws_sorted_order_book  # noqa: F401
+from ccxt.pro.test.base.test_order_book_arrays import test_ws_order_book_arrays  # noqa: F401
+from ccxt.pro.test.base.test_message_handlers import test_ws_message_handlers  # noqa: F401
 from ccxt.pro.test.base.test_abnormal_close import test_abnormal_close  # noqa: F401
 
 def test_base_init_ws():
     test_ws_order_book()
+    test_ws_sorted_order_book()
+    test_ws_order_book_arrays()
     test_ws_cache()
+    test_ws_cache_by_symbol()
+    run(test_ws_ohlcv_cache())
+    run(test_ws_compact_trades())
     # todo : run(test_ws_close())
     run(test_ws_future())
+    run(test_ws_throttler())
+    run(test_ws_fast_client())
+    run(test_ws_binary_frames())
+    run(test_ws_message_handlers())
     # run(test_abnormal_close()) stays in infinite loop in travis
@@ -0,0 +1,60 @@
+import asyncio
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+import ccxt  # noqa E402
+import ccxt.pro  # noqa E402
+
+
+async def test_description_is_per_instance():
+    print("test_description_is_per_instance")
+    first = ccxt.binance()
+    second = ccxt.binance({'options': {'defaultType': 'future'}})
+    assert first.options['defaultType'] == 'spot'
+    assert second.options['defaultType'] == 'future'
+    first.options['broker']['spot'] = 'changed'
+    first.urls['api']['public'] = 'http://127.0.0.1'
+    first.countries.append('XX')
+    third = ccxt.binance()
+    for exchange in [second, third]:
+        assert exchange.options['broker']['spot'] != 'changed'
+        assert exchange.urls['api']['public'] != 'http://127.0.0.1'
+        assert 'XX' not in exchange.countries
+    assert first.describe() == third.describe()
+    # bound methods in the description belong to the instance they were copied for
+    okx = ccxt.pro.okx()
+    other = ccxt.pro.okx()
+    assert okx.streaming['ping'].__self__ is okx
+    assert other.streaming['ping'].__self__ is other
+    await okx.close()
+    await other.close()
+
+
+async def test_camelcase_aliases():
+    print("test_camelcase_aliases")
+    exchange = ccxt.kraken({'some_option': 1})
+    assert ccxt.kraken.fetchOHLCV is ccxt.kraken.fetch_ohlcv
+    assert exchange.fetchOrderBook == exchange.fetch_order_book
+    assert exchange.someOption == 1
+    other = ccxt.kraken({'rate_limit': 7})
+    assert other.rateLimit == 7
+    assert not hasattr(other, 'someOption')
+    # a subclass gets its own aliases on its first instance
+    class custom(ccxt.kraken):
+        def fetch_ticker(self, symbol, params={}):
+            return symbol
+
+    assert custom().fetchTicker('BTC/USD') == 'BTC/USD'
+    assert ccxt.kraken.fetchTicker is ccxt.kraken.fetch_ticker
+
+
+def test_exchange_init():
+    asyncio.run(test_description_is_per_instance())
+    asyncio.run(test_camelcase_aliases())
+
+
+if __name__ == '__main__':
+    test_exchange_init()
@@ -0,0 +1,36 @@
+import os
+import subprocess
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# runs in a fresh interpreter, the test runner has most of the exchanges imported already
+script = '''
+import sys
+import ccxt
+import ccxt.pro
+assert not [name for name in sys.modules if name.startswith('ccxt.') and name.rsplit('.', 1)[-1] in ccxt.exchanges]
+from ccxt.binanceusdm import binanceusdm
+# ccxt.binance was imported as a dependency of binanceusdm, the package still exposes the class
+assert ccxt.binance is sys.modules['ccxt.binance'].binance
+assert ccxt.binanceusdm is binanceusdm
+from ccxt.pro import okx
+assert issubclass(okx, ccxt.async_support.okx)
+assert 'ccxt.kraken' not in sys.modules
+assert 'kraken' in dir(ccxt)
+try:
+    ccxt.unknown
+    assert False
+except AttributeError:
+    pass
+'''
+
+
+def test_lazy_exchanges():
+    print("test_lazy_exchanges")
+    subprocess.run([sys.executable, '-c', script], cwd=root, check=True)
+
+
+if __name__ == '__main__':
+    test_lazy_exchanges()
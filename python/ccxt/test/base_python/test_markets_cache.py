@@ -0,0 +1,220 @@
+import asyncio
+import json
+import os
+import sys
+import tempfile
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+import ccxt  # noqa E402
+import ccxt.async_support  # noqa E402
+
+
+def create_markets(exchange, count):
+    markets = []
+    for i in range(count):
+        base = 'C' + str(i)
+        markets.append(exchange.safe_market_structure({
+            'id': base + 'USDT',
+            'symbol': base + '/USDT',
+            'base': base,
+            'quote': 'USDT',
+            'baseId': base,
+            'quoteId': 'USDT',
+            'type': 'spot',
+            'spot': True,
+            'active': True,
+            'precision': {'amount': 0.001, 'price': 0.01},
+            'info': {'symbol': base + 'USDT', 'filters': [{'minQty': '0.001'}]},
+        }))
+    return markets
+
+
+def create_exchange(exchange_class, path, config, calls):
+    exchange = exchange_class({'options': {'marketsCache': exchange_class.extend({'path': path}, config)}})
+    markets = create_markets(exchange, 3 + len(calls))
+    currencies = {'USDT': exchange.safe_currency_structure({'id': 'USDT', 'code': 'USDT', 'precision': 0.01})}
+
+    def fetch_markets(params={}):
+        calls.append('markets')
+        return markets
+
+    def fetch_currencies(params={}):
+        return currencies
+
+    async def fetch_markets_async(params={}):
+        return fetch_markets(params)
+
+    async def fetch_currencies_async(params={}):
+        return currencies
+
+    asynchronous = not exchange.synchronous
+    exchange.fetch_markets = fetch_markets_async if asynchronous else fetch_markets
+    exchange.fetch_currencies = fetch_currencies_async if asynchronous else fetch_currencies
+    return exchange
+
+
+async def test_markets_cache_async():
+    print("test_markets_cache_async")
+    with tempfile.TemporaryDirectory() as path:
+        calls = []
+        exchange = create_exchange(ccxt.async_support.binance, path, {}, calls)
+        await exchange.load_markets()
+        assert calls == ['markets']
+        await exchange.close()
+        # warm start, nothing is fetched
+        warm = create_exchange(ccxt.async_support.binance, path, {}, calls)
+        await warm.load_markets()
+        assert calls == ['markets']
+        assert warm.symbols == exchange.symbols
+        assert warm.markets['C0/USDT'] == exchange.markets['C0/USDT']
+        assert warm.currencies == exchange.currencies
+        await warm.close()
+        # a different configuration has its own cache
+        futures = create_exchange(ccxt.async_support.binance, path, {}, calls)
+        futures.options['defaultType'] = 'future'
+        await futures.load_markets()
+        assert calls == ['markets', 'markets']
+        await futures.close()
+        # expired, the cached markets are served right away and refreshed in the background
+        expired = create_exchange(ccxt.async_support.binance, path, {'ttl': -1}, calls)
+        markets = await expired.load_markets()
+        assert len(markets) == 3
+        await expired.markets_refreshing
+        assert calls == ['markets', 'markets', 'markets']
+        assert len(expired.symbols) == 5
+        await expired.close()
+        # expired without background refresh, fetched before returning
+        blocking = create_exchange(ccxt.async_support.binance, path, {'ttl': -1, 'backgroundRefresh': False}, calls)
+        await blocking.load_markets()
+        assert len(blocking.symbols) == 6
+        assert blocking.markets_refreshing is None
+        await blocking.close()
+
+
+def test_markets_cache_sync():
+    print("test_markets_cache_sync")
+    with tempfile.TemporaryDirectory() as path:
+        calls = []
+        exchange = create_exchange(ccxt.binance, path, {}, calls)
+        exchange.load_markets()
+        warm = create_exchange(ccxt.binance, path, {}, calls)
+        warm.load_markets()
+        assert calls == ['markets']
+        assert warm.markets == exchange.markets
+        assert warm.markets_by_id.keys() == exchange.markets_by_id.keys()
+        # expired, fetched again before returning, there is no background refresh
+        expired = create_exchange(ccxt.binance, path, {'ttl': -1}, calls)
+        expired.load_markets()
+        assert calls == ['markets', 'markets']
+        assert len(expired.symbols) == 4
+        # the markets of an account have their own cache
+        account = create_exchange(ccxt.binance, path, {}, calls)
+        account.apiKey = 'key'
+        account.load_markets()
+        assert calls == ['markets', 'markets', 'markets']
+        # no cache configured, nothing written
+        plain = ccxt.binance()
+        assert plain.read_markets_cache() is None
+        # the default directory belongs to the current user
+        config = ccxt.binance({'options': {'marketsCache': True}}).get_markets_cache_config()
+        assert not config['path'].startswith(tempfile.gettempdir())
+
+
+def test_markets_cache_permissions():
+    print("test_markets_cache_permissions")
+    if not hasattr(os, 'getuid'):
+        return
+    with tempfile.TemporaryDirectory() as path:
+        calls = []
+        directory = os.path.join(path, 'markets')
+        exchange = create_exchange(ccxt.binance, directory, {}, calls)
+        exchange.load_markets()
+        assert os.stat(directory).st_mode & 0o777 == 0o700
+        file = exchange.get_markets_cache_file(directory)
+        assert os.stat(file).st_mode & 0o777 == 0o600
+        # a directory that other users can write to is neither read nor written
+        os.chmod(directory, 0o777)
+        shared = create_exchange(ccxt.binance, directory, {}, calls)
+        shared.load_markets()
+        assert calls == ['markets', 'markets']
+        assert shared.read_markets_cache() is None
+        os.chmod(directory, 0o700)
+        os.chmod(file, 0o666)
+        assert shared.read_markets_cache() is None
+
+
+def create_kraken(path, requests):
+    exchange = ccxt.kraken({'options': {'marketsCache': {'path': path}}})
+    responses = {
+        'Assets': {'error': [], 'result': {
+            'XXBT': {'aclass': 'currency', 'altname': 'XBT', 'decimals': 10, 'display_decimals': 5, 'status': 'enabled'},
+            'ZUSD': {'aclass': 'currency', 'altname': 'USD', 'decimals': 4, 'display_decimals': 2, 'status': 'enabled'},
+        }},
+        'AssetPairs': {'error': [], 'result': {
+            'XXBTZUSD': {
+                'altname': 'XBTUSD', 'wsname': 'XBT/USD', 'base': 'XXBT', 'quote': 'ZUSD', 'pair_decimals': 1, 'lot_decimals': 8,
+                'fees': [[0, 0.26]], 'fees_maker': [[0, 0.16]], 'leverage_buy': [2, 3], 'ordermin': '0.0001', 'costmin': '0.5', 'status': 'online',
+            },
+        }},
+    }
+
+    # only the http requests are stubbed, the markets are parsed by the fetch_markets() of the exchange
+    def fetch(url, method='GET', headers=None, body=None):
+        endpoint = url.split('?')[0].split('/')[-1]
+        requests.append(endpoint)
+        return responses[endpoint]
+
+    exchange.fetch = fetch
+    return exchange
+
+
+def test_markets_cache_fetch_markets():
+    print("test_markets_cache_fetch_markets")
+    with tempfile.TemporaryDirectory() as path:
+        requests = []
+        exchange = create_kraken(path, requests)
+        config = exchange.get_markets_cache_config()
+        file = exchange.get_markets_cache_file(config['path'])
+        exchange.load_markets()
+        assert requests == ['Assets', 'AssetPairs']
+        # kraken.fetch_markets() sets options['marketsByAltname'], the file doesn't depend on it
+        assert 'XBTUSD' in exchange.options['marketsByAltname']
+        assert exchange.get_markets_cache_file(config['path']) == file
+        assert os.listdir(path) == [os.path.basename(file)]
+        # the option is restored along with the markets
+        warm = create_kraken(path, requests)
+        warm.load_markets()
+        assert requests == ['Assets', 'AssetPairs']
+        assert warm.markets['BTC/USD']['id'] == 'XXBTZUSD'
+        assert warm.options['marketsByAltname']['XBTUSD']['symbol'] == 'BTC/USD'
+        # a refresh that sets the same options keeps them in the cache
+        warm.load_markets_from_exchange()
+        assert requests == ['Assets', 'AssetPairs'] * 2
+        cold = create_kraken(path, requests)
+        cold.load_markets()
+        assert cold.options['marketsByAltname']['XBTUSD']['id'] == 'XXBTZUSD'
+        # the options that fetch_markets() does not derive from the markets are never restored
+        data = json.load(open(file))
+        data['options']['hostname'] = 'example.com'
+        json.dump(data, open(file, 'w'))
+        tampered = create_kraken(path, requests)
+        tampered.load_markets()
+        assert 'hostname' not in tampered.options
+        assert 'marketsByAltname' in tampered.options
+        # another api, another file
+        sandbox = create_kraken(path, requests)
+        sandbox.urls['api']['public'] = 'https://api.example.com'
+        assert sandbox.get_markets_cache_file(config['path']) != file
+
+
+def test_markets_cache():
+    asyncio.run(test_markets_cache_async())
+    test_markets_cache_sync()
+    test_markets_cache_permissions()
+    test_markets_cache_fetch_markets()
+
+
+if __name__ == '__main__':
+    test_markets_cache()
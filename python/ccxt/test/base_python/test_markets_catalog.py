@@ -0,0 +1,173 @@
+import asyncio
+import copy
+import json
+import os
+import pickle
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+import ccxt  # noqa E402
+import ccxt.async_support  # noqa E402
+import ccxt.pro  # noqa E402
+from ccxt.base.errors import ExchangeError  # noqa E402
+
+
+def create_markets(exchange, bases):
+    return [exchange.safe_market_structure({
+        'id': base + 'USDT',
+        'symbol': base + '/USDT',
+        'base': base,
+        'quote': 'USDT',
+        'baseId': base,
+        'quoteId': 'USDT',
+        'type': 'spot',
+        'spot': True,
+        'active': True,
+        'precision': {'amount': 0.001, 'price': 0.01},
+        'info': {'symbol': base + 'USDT', 'filters': [{'minQty': '0.001'}]},
+    }) for base in bases]
+
+
+def create_exchange(exchange_class, bases, calls):
+    exchange = exchange_class()
+
+    def fetch_markets(params={}):
+        calls.append('markets')
+        return create_markets(exchange, bases)
+
+    async def fetch_markets_async(params={}):
+        await asyncio.sleep(0.01)
+        return fetch_markets(params)
+
+    exchange.fetch_markets = fetch_markets if exchange.synchronous else fetch_markets_async
+    return exchange
+
+
+def assert_read_only(action):
+    try:
+        action()
+    except TypeError:
+        return
+    assert False, 'shared markets were modified'
+
+
+def test_markets_catalog_read_only(exchange):
+    market = exchange.markets['BTC/USDT']
+    assert_read_only(lambda: exchange.markets.update({'ETH/USDT': market}))
+    assert_read_only(lambda: exchange.markets.pop('BTC/USDT'))
+    assert_read_only(lambda: exchange.symbols.sort())
+    assert_read_only(lambda: exchange.markets_by_id['BTCUSDT'].append(market))
+    assert_read_only(lambda: exchange.currencies.__setitem__('XBT', exchange.currencies['BTC']))
+    # copies are regular mutable objects
+    markets = copy.deepcopy(exchange.markets)
+    markets['XBT/USDT'] = markets['BTC/USDT']
+    assert type(pickle.loads(pickle.dumps(exchange.markets))) is dict
+    assert json.loads(json.dumps(exchange.markets_by_id))['BTCUSDT'][0]['symbol'] == 'BTC/USDT'
+    # the indexes reference the same shared objects
+    assert exchange.currencies_by_id['BTC'] is exchange.currencies['BTC']
+
+
+async def test_markets_catalog_async():
+    print("test_markets_catalog_async")
+    calls = []
+    bases = ['BTC', 'ETH']
+    owner = create_exchange(ccxt.async_support.binance, bases, calls)
+    accounts = [create_exchange(ccxt.async_support.binance, bases, calls) for i in range(3)]
+    accounts.append(create_exchange(ccxt.pro.binance, bases, calls))
+    for account in accounts:
+        account.attach_markets(owner)
+    await asyncio.gather(*[account.load_markets() for account in accounts])
+    assert calls == ['markets']
+    for account in accounts:
+        assert account.markets is owner.markets
+        assert account.markets_by_id is owner.markets_by_id
+        assert account.symbols is owner.symbols
+        assert account.currencies is owner.currencies
+    test_markets_catalog_read_only(accounts[0])
+    # one reload updates every attached instance
+    bases.append('LTC')
+    await accounts[1].load_markets(True)
+    assert calls == ['markets', 'markets']
+    for account in [owner] + accounts:
+        assert account.symbols == ['BTC/USDT', 'ETH/USDT', 'LTC/USDT']
+        assert 'LTC' in account.currencies
+    test_markets_catalog_read_only(owner)
+    await asyncio.gather(*[exchange.close() for exchange in [owner] + accounts])
+
+
+def test_markets_catalog_sync():
+    print("test_markets_catalog_sync")
+    calls = []
+    bases = ['BTC', 'ETH']
+    owner = create_exchange(ccxt.binance, bases, calls)
+    owner.load_markets()
+    # attached after the markets were loaded, through another attached instance
+    first = create_exchange(ccxt.binance, bases, calls)
+    first.attach_markets(owner)
+    second = create_exchange(ccxt.binance, bases, calls)
+    second.attach_markets(first)
+    assert second.markets_owner is owner
+    assert second.load_markets() is owner.markets
+    assert first.markets is owner.markets
+    assert calls == ['markets']
+    test_markets_catalog_read_only(second)
+    # the trading limits loaded by an attached instance are shared again by the owner
+    second.has = second.extend(second.has, {'fetchTradingLimits': True})
+    second.fetch_trading_limits = lambda symbols=None, params={}: {symbol: {'limits': {'amount': {'min': 0.5}}} for symbol in symbols}
+    markets = second.load_trading_limits(['ETH/USDT'])
+    assert markets is owner.markets and first.markets is owner.markets
+    assert owner.markets['ETH/USDT']['limits']['amount']['min'] == 0.5
+    assert owner.markets['BTC/USDT']['limits']['amount']['min'] is None
+    assert 'limitsLoaded' in second.options
+    test_markets_catalog_read_only(first)
+    # other instances are not affected
+    assert not ccxt.binance().markets
+    try:
+        ccxt.okx().attach_markets(owner)
+        assert False, 'attached the markets of another exchange'
+    except ExchangeError:
+        pass
+
+
+def test_markets_catalog_lazy_currencies():
+    print("test_markets_catalog_lazy_currencies")
+    # coinbaseinternational loads the networks of a currency on demand into the currency structure itself
+    owner = ccxt.coinbaseinternational()
+    owner.set_markets(create_markets(owner, ['BTC']), {
+        'USDC': owner.extend(owner.safe_currency_structure({'id': 'USDC', 'code': 'USDC', 'precision': 0.000001}), {'networks': None}),
+    })
+    account = ccxt.coinbaseinternational()
+    account.attach_markets(owner)
+    requests = []
+
+    def fetch(url, method='GET', headers=None, body=None):
+        requests.append(url)
+        return [{
+            'asset_name': 'USDC',
+            'network_arn_id': 'networks/ethereum-mainnet/assets/9bc140b4-69c3-5fc9-bd0d-b041bcf40039',
+            'min_withdrawal_amt': '1',
+            'max_withdrawal_amt': '100000000',
+            'network_name': 'ethereum',
+            'display_name': 'Ethereum',
+        }]
+
+    account.fetch = fetch
+    assert account.load_currency_networks('USDC') is True
+    assert len(requests) == 1
+    # the networks are shared with the owner, which doesn't request them again
+    assert 'ETH' in owner.currencies['USDC']['networks']
+    assert owner.currencies_by_id['USDC'] is owner.currencies['USDC']
+    assert owner.load_currency_networks('USDC') is False
+    assert len(requests) == 1
+
+
+def test_markets_catalog():
+    asyncio.run(test_markets_catalog_async())
+    test_markets_catalog_sync()
+    test_markets_catalog_lazy_currencies()
+
+
+if __name__ == '__main__':
+    test_markets_catalog()
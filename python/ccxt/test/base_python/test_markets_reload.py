@@ -0,0 +1,140 @@
+import asyncio
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+import ccxt  # noqa E402
+import ccxt.async_support  # noqa E402
+
+
+def create_market(exchange, base, quote='USDT', spot=True, precision=0.01):
+    return exchange.safe_market_structure({
+        'id': base + quote,
+        'symbol': base + '/' + quote if spot else base + '/' + quote + ':' + quote,
+        'base': base,
+        'quote': quote,
+        'settle': None if spot else quote,
+        'baseId': base,
+        'quoteId': quote,
+        'type': 'spot' if spot else 'swap',
+        'spot': spot,
+        'swap': not spot,
+        'linear': None if spot else True,
+        'active': True,
+        'precision': {'amount': 0.001, 'price': precision},
+        'info': {'symbol': base + quote},
+    })
+
+
+def create_exchange(exchange_class, markets, incremental=True):
+    exchange = exchange_class({'options': {'incrementalMarketsReload': incremental}})
+
+    def fetch_markets(params={}):
+        return [exchange.extend(market) for market in markets]
+
+    async def fetch_markets_async(params={}):
+        return fetch_markets(params)
+
+    exchange.fetch_markets = fetch_markets if exchange.synchronous else fetch_markets_async
+    return exchange
+
+
+def assert_same_indexes(exchange, expected):
+    assert exchange.markets == expected.markets
+    assert exchange.symbols == expected.symbols
+    assert exchange.ids == expected.ids
+    assert exchange.markets_by_id == expected.markets_by_id
+    assert exchange.currencies == expected.currencies
+    assert exchange.codes == expected.codes
+    assert exchange.currencies_by_id == expected.currencies_by_id
+
+
+def test_markets_reload_sync():
+    print("test_markets_reload_sync")
+    exchange = ccxt.binance()
+    markets = [create_market(exchange, base) for base in ['BTC', 'ETH', 'LTC', 'XRP']]
+    markets.append(create_market(exchange, 'BTC', spot=False))
+    exchange = create_exchange(ccxt.binance, markets)
+    # the incremental reload ends up with the same indexes as a full reload
+    expected = create_exchange(ccxt.binance, markets, False)
+    exchange.load_markets()
+    expected.load_markets()
+    unchanged = exchange.markets['BTC/USDT']
+    unchanged_value = exchange.markets_by_id['BTCUSDT'][0]
+    changed = exchange.markets['ETH/USDT']
+    delisted = exchange.markets['LTC/USDT']
+    swap = exchange.markets['BTC/USDT:USDT']
+    markets[1] = create_market(exchange, 'ETH', precision=0.001)
+    del markets[2]
+    markets.append(create_market(exchange, 'ADA'))
+    markets.append(create_market(exchange, 'ADA', 'BTC'))
+    exchange.load_markets(True)
+    expected.load_markets(True)
+    assert exchange.markets_changes == {
+        'added': ['ADA/USDT', 'ADA/BTC'],
+        'changed': ['ETH/USDT'],
+        'removed': ['LTC/USDT'],
+    }
+    # the references held to the markets stay current
+    assert exchange.markets['BTC/USDT'] is unchanged
+    assert exchange.markets_by_id['BTCUSDT'][0] is unchanged_value
+    assert exchange.markets['BTC/USDT:USDT'] is swap
+    assert exchange.markets['ETH/USDT'] is changed
+    assert changed['precision']['price'] == 0.001
+    assert exchange.currencies['ETH']['precision'] == 0.001
+    assert delisted['active'] is False
+    assert 'LTC/USDT' not in exchange.markets
+    assert 'LTCUSDT' not in exchange.markets_by_id
+    assert_same_indexes(exchange, expected)
+    # nothing changed
+    exchange.load_markets(True)
+    assert exchange.markets_changes == {'added': [], 'changed': [], 'removed': []}
+    assert exchange.markets['ETH/USDT'] is changed
+    # a market that moves to another id
+    moved = create_market(exchange, 'XRP')
+    moved['id'] = 'XRP-USDT'
+    markets[2] = moved
+    exchange.load_markets(True)
+    expected.load_markets(True)
+    assert exchange.markets_changes['changed'] == ['XRP/USDT']
+    assert 'XRPUSDT' not in exchange.markets_by_id
+    assert_same_indexes(exchange, expected)
+
+
+def test_markets_reload_disabled():
+    print("test_markets_reload_disabled")
+    exchange = ccxt.binance()
+    markets = [create_market(exchange, base) for base in ['BTC', 'ETH']]
+    exchange = create_exchange(ccxt.binance, markets, False)
+    exchange.load_markets()
+    market = exchange.markets['BTC/USDT']
+    exchange.load_markets(True)
+    assert exchange.markets['BTC/USDT'] is not market
+    assert exchange.markets_changes is None
+
+
+async def test_markets_reload_async():
+    print("test_markets_reload_async")
+    exchange = ccxt.binance()
+    markets = [create_market(exchange, base) for base in ['BTC', 'ETH']]
+    exchange = create_exchange(ccxt.async_support.binance, markets)
+    await exchange.load_markets()
+    market = exchange.markets['BTC/USDT']
+    del markets[1]
+    await exchange.load_markets(True)
+    assert exchange.markets['BTC/USDT'] is market
+    assert exchange.markets_changes == {'added': [], 'changed': [], 'removed': ['ETH/USDT']}
+    assert exchange.symbols == ['BTC/USDT']
+    await exchange.close()
+
+
+def test_markets_reload():
+    test_markets_reload_sync()
+    test_markets_reload_disabled()
+    asyncio.run(test_markets_reload_async())
+
+
+if __name__ == '__main__':
+    test_markets_reload()
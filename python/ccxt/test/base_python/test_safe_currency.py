@@ -0,0 +1,84 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+import ccxt  # noqa E402
+
+
+def create_markets(exchange, bases):
+    return [exchange.safe_market_structure({
+        'id': base + 'USDT',
+        'symbol': base + '/USDT',
+        'base': base,
+        'quote': 'USDT',
+        'baseId': base.lower(),
+        'quoteId': 'usdt',
+        'type': 'spot',
+        'spot': True,
+    }) for base in bases]
+
+
+def test_safe_currency_memo():
+    print("test_safe_currency_memo")
+    exchange = ccxt.binance()
+    exchange.set_markets(create_markets(exchange, ['BTC', 'ETH']))
+    assert exchange.safe_currency('btc') is exchange.currencies['BTC']
+    assert exchange.safe_currency_code('eth') == 'ETH'
+    assert exchange.safe_currency_code(None) is None
+    assert exchange.safe_currency(None, exchange.currencies['BTC']) is exchange.currencies['BTC']
+    # unknown currencies
+    unknown = exchange.safe_currency('ltc')
+    assert unknown['id'] == 'ltc'
+    assert unknown['code'] == 'LTC'
+    assert exchange.safe_currency_code('bchsv') == 'BSV'
+    assert exchange.get_safe_ids_memo('currency', 'ltc') == 'LTC'
+    assert dict(exchange.safe_ids_memo[3]) == {('currency', 'ltc'): 'LTC', ('currency', 'bchsv'): 'BSV'}
+    # a new currency every time, changing one doesn't change the next
+    unknown['code'] = 'XRP'
+    unknown['precision'] = 0.01
+    assert exchange.safe_currency('ltc') is not unknown
+    assert exchange.safe_currency('ltc')['code'] == 'LTC'
+    assert exchange.safe_currency('ltc')['precision'] is None
+    # unknown ids, bounded, the least recently used one is dropped
+    exchange.safe_ids_memo_limit = 2
+    assert exchange.safe_currency_code('bchsv') == 'BSV'
+    exchange.safe_currency('xrp')
+    assert list(exchange.safe_ids_memo[3]) == [('currency', 'bchsv'), ('currency', 'xrp')]
+    exchange.safe_currency('bchsv')
+    exchange.safe_currency('ada')
+    assert list(exchange.safe_ids_memo[3]) == [('currency', 'bchsv'), ('currency', 'ada')]
+
+
+def test_safe_currency_reset():
+    print("test_safe_currency_reset")
+    exchange = ccxt.binance()
+    exchange.set_markets(create_markets(exchange, ['BTC']))
+    unknown = exchange.safe_currency('ltc')
+    assert exchange.safe_currency_code('foo') == 'FOO'
+    # the common currency codes change
+    exchange.commonCurrencies = exchange.extend(exchange.commonCurrencies, {'FOO': 'BAR'})
+    assert exchange.safe_currency_code('foo') == 'BAR'
+    exchange.substituteCommonCurrencyCodes = False
+    assert exchange.safe_currency_code('bchsv') == 'BCHSV'
+    exchange.substituteCommonCurrencyCodes = True
+    # the currencies are loaded
+    exchange.set_markets(create_markets(exchange, ['BTC', 'LTC']))
+    assert exchange.safe_currency('ltc') is not unknown
+    assert exchange.safe_currency('ltc') is exchange.currencies['LTC']
+    exchange.update_markets(create_markets(exchange, ['BTC', 'LTC', 'XRP']))
+    assert exchange.safe_currency('xrp') is exchange.currencies['XRP']
+    # overrides of safe_currency go through the memo as well
+    kraken = ccxt.kraken()
+    assert kraken.safe_currency_code('XXBT') == 'BTC'
+    assert kraken.safe_currency('XXBT') == kraken.safe_currency('XBT')
+
+
+def test_safe_currency():
+    test_safe_currency_memo()
+    test_safe_currency_reset()
+
+
+if __name__ == '__main__':
+    test_safe_currency()
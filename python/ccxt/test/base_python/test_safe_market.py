@@ -0,0 +1,88 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+import ccxt  # noqa E402
+from ccxt.base.errors import ArgumentsRequired  # noqa E402
+
+
+def create_markets(exchange):
+    spot = exchange.safe_market_structure({'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'type': 'spot', 'spot': True, 'swap': False})
+    swap = exchange.safe_market_structure({'id': 'BTCUSDT', 'symbol': 'BTC/USDT:USDT', 'base': 'BTC', 'quote': 'USDT', 'settle': 'USDT', 'type': 'swap', 'spot': False, 'swap': True, 'linear': True})
+    eth = exchange.safe_market_structure({'id': 'ETHUSDT', 'symbol': 'ETH/USDT', 'base': 'ETH', 'quote': 'USDT', 'type': 'spot', 'spot': True, 'swap': False})
+    return [spot, swap, eth]
+
+
+def test_safe_market_lookup():
+    print("test_safe_market_lookup")
+    exchange = ccxt.binance()
+    exchange.set_markets(create_markets(exchange))
+    eth = exchange.safe_market('ETHUSDT')
+    assert eth is exchange.markets_by_id['ETHUSDT'][0]
+    assert exchange.safe_symbol('ETHUSDT') == 'ETH/USDT'
+    # disambiguation by type, resolved once
+    swap = exchange.safe_market('BTCUSDT', None, None, 'swap')
+    assert swap['symbol'] == 'BTC/USDT:USDT'
+    assert exchange.safe_market('BTCUSDT', None, None, 'swap') is swap
+    assert exchange.safe_symbol('BTCUSDT', None, None, 'spot') == 'BTC/USDT'
+    assert exchange.safe_symbol('BTCUSDT', exchange.markets['BTC/USDT:USDT']) == 'BTC/USDT:USDT'
+    try:
+        exchange.safe_market('BTCUSDT')
+        assert False, 'an ambiguous market id was resolved'
+    except ArgumentsRequired:
+        pass
+    # unknown ids
+    assert exchange.safe_symbol('LTC-BTC', None, '-') == 'LTC/BTC'
+    split = exchange.safe_market('LTC-BTC', None, '-')
+    assert split['base'] == 'LTC' and split['quoteId'] == 'BTC'
+    # parsed once, a new market every time
+    split['symbol'] = 'BTC/LTC'
+    split['precision']['amount'] = 1
+    assert exchange.safe_market('LTC-BTC', None, '-') is not split
+    assert exchange.safe_market('LTC-BTC', None, '-')['symbol'] == 'LTC/BTC'
+    assert exchange.safe_market('LTC-BTC', None, '-')['precision']['amount'] is None
+    assert exchange.safe_market('LTC-BTC', None, '_')['symbol'] == 'LTC-BTC'
+    assert exchange.safe_market('LTCBTC', eth) is eth
+    unknown = exchange.safe_market('LTCBTC')
+    assert unknown['symbol'] == 'LTCBTC'
+    assert unknown['marketId'] == 'LTCBTC'
+    assert unknown['precision']['amount'] is None
+    assert exchange.safe_market('LTCBTC') is not unknown
+    assert exchange.safe_symbol(None) is None
+
+
+def test_safe_market_reset():
+    print("test_safe_market_reset")
+    exchange = ccxt.binance()
+    markets = create_markets(exchange)
+    exchange.set_markets(markets[:2])
+    assert exchange.safe_symbol('ETH-USDT', None, '-') == 'ETH/USDT'
+    swap = exchange.safe_market('BTCUSDT', None, None, 'swap')
+    # the resolved markets are dropped with the markets
+    exchange.set_markets(create_markets(exchange))
+    assert exchange.safe_market('BTCUSDT', None, None, 'swap') is not swap
+    assert exchange.safe_market('BTCUSDT', None, None, 'swap') is exchange.markets_by_id['BTCUSDT'][1]
+    # the split ids follow the currencies
+    assert exchange.safe_symbol('WBTC-USDT', None, '-') == 'WBTC/USDT'
+    exchange.set_markets(markets, {'BTC': {'id': 'WBTC', 'code': 'BTC'}})
+    assert exchange.safe_symbol('WBTC-USDT', None, '-') == 'BTC/USDT'
+    # and the common currency codes
+    assert exchange.safe_symbol('XRP-USDT', None, '-') == 'XRP/USDT'
+    exchange.commonCurrencies = exchange.extend(exchange.commonCurrencies, {'XRP': 'RIPPLE'})
+    assert exchange.safe_symbol('XRP-USDT', None, '-') == 'RIPPLE/USDT'
+    # unknown ids, bounded
+    exchange.safe_ids_memo_limit = 2
+    for base in ['A', 'B', 'C']:
+        assert exchange.safe_symbol(base + '-USDT', None, '-') == base + '/USDT'
+    assert len(exchange.safe_ids_memo[3]) == 2
+
+
+def test_safe_market():
+    test_safe_market_lookup()
+    test_safe_market_reset()
+
+
+if __name__ == '__main__':
+    test_safe_market()
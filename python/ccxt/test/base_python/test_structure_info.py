@@ -0,0 +1,75 @@
+import datetime
+import os
+import random
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+import ccxt  # noqa E402
+from ccxt.base.errors import NotSupported  # noqa E402
+
+
+def iso8601(timestamp):
+    # the formatting of every call, as the memo of the seconds must return it
+    utc = datetime.datetime.fromtimestamp(timestamp // 1000, datetime.timezone.utc)
+    return utc.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-6] + "{:03d}".format(timestamp % 1000) + 'Z'
+
+
+def test_iso8601_seconds():
+    print("test_iso8601_seconds")
+    rng = random.Random(5)
+    limit = ccxt.Exchange.iso8601_seconds_limit
+    ccxt.Exchange.iso8601_seconds_limit = 100
+    try:
+        for timestamp in [0, 1, 999, 1000, 1579482900123] + [rng.randint(0, 4102444800000) for _ in range(1000)]:
+            assert ccxt.Exchange.iso8601(timestamp) == iso8601(timestamp)
+            assert ccxt.Exchange.iso8601(timestamp) == iso8601(timestamp)
+        assert len(ccxt.Exchange.iso8601_seconds) <= 100
+    finally:
+        ccxt.Exchange.iso8601_seconds_limit = limit
+    assert ccxt.Exchange.iso8601(None) is None
+    assert ccxt.Exchange.iso8601(-1) is None
+    # only integers are formatted, as before the memo and as in the other languages
+    assert ccxt.Exchange.iso8601('1579482900123') is None
+    assert ccxt.Exchange.iso8601('0') is None
+    assert ccxt.Exchange.iso8601(1579482900123.0) is None
+    assert ccxt.Exchange.iso8601(1579482900123.5) is None
+
+
+def test_structure_info_retention():
+    print("test_structure_info_retention")
+    info = {'symbol': 'BTCUSDT', 'lastPrice': '10000.5'}
+    exchange = ccxt.binance()
+    assert exchange.safe_ticker({'info': info, 'last': '10000.5'})['info'] is info
+    exchange = ccxt.binance({'options': {'structureInfo': 'drop'}})
+    ticker = exchange.safe_ticker({'info': info, 'symbol': 'BTC/USDT', 'last': '10000.5'})
+    assert ticker['info'] is None
+    assert ticker['last'] == 10000.5
+    assert exchange.safe_trade({'info': info, 'price': '1', 'amount': '2'})['info'] is None
+    assert exchange.safe_liquidation({'info': info, 'price': '1'})['info'] is None
+    assert exchange.safe_position({'info': info, 'symbol': None})['info'] is None
+    # the fills of a binance order
+    trades = [{'price': '1', 'qty': '2', 'commission': '0', 'commissionAsset': 'BNB', 'tradeId': 5}]
+    order = exchange.safe_order({'info': info, 'id': '1', 'symbol': 'BTC/USDT', 'side': 'buy', 'type': 'limit', 'status': 'closed', 'trades': trades})
+    assert order['info'] is None
+    assert order['trades'][0]['info'] is None
+    # the parsers of the exchanges
+    trade = exchange.parse_trade({'a': 26129, 'p': '0.01633102', 'q': '4.70443515', 'T': 1579482900123, 'm': True})
+    assert 'info' in trade and trade['info'] is None
+    assert trade['datetime'] == '2020-01-20T01:15:00.123Z'
+    exchange.options['structureInfo'] = 'weakref'
+    try:
+        exchange.safe_ticker({'info': info})
+        assert False
+    except NotSupported:
+        pass
+
+
+def test_structure_info():
+    test_iso8601_seconds()
+    test_structure_info_retention()
+
+
+if __name__ == '__main__':
+    test_structure_info()
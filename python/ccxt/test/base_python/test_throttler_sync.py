@@ -0,0 +1,49 @@
+import concurrent.futures
+import os
+import sys
+from time import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+import ccxt  # noqa E402
+from ccxt.base.throttler import Throttler  # noqa E402
+
+
+def test_throttler_threads():
+    print("test_throttler_threads")
+    # bursts of 5, then one call every 10 ms
+    throttler = Throttler({'refillRate': 1 / 10, 'capacity': 5, 'tokens': 5})
+    start = time()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
+        released = list(executor.map(lambda _: throttler(1) or time() - start, range(26)))
+    elapsed = max(released) * 1000
+    assert elapsed >= 195, f"Expected at least 200 ms to release 26 calls, got {elapsed:.1f} ms"
+    assert elapsed < 600, f"Throttler is too slow, took {elapsed:.1f} ms"
+    assert sum(1 for seconds in released if seconds < 0.005) >= 5, "Expected the burst capacity to be used"
+    assert throttler.waiting == 0
+
+
+def test_throttler_priority_param():
+    print("test_throttler_priority_param")
+    # the sync throttler has a single lane, the priority must not reach the exchange either way
+    exchange = ccxt.binance({'enableRateLimit': False})
+    signed = []
+    exchange.sign = lambda path, api='public', method='GET', params={}, headers=None, body=None: signed.append(params) or {'url': 'https://example.com', 'method': method, 'headers': headers, 'body': body}
+    exchange.fetch = lambda url, method='GET', headers=None, body=None: {}
+    exchange.fetch2('ticker/price', 'public', 'GET', {'symbol': 'BTCUSDT', 'rateLimitPriority': 'trading'})
+    assert signed == [{'symbol': 'BTCUSDT'}]
+    try:
+        exchange.fetch2('ticker/price', 'public', 'GET', {'rateLimitPriority': 'urgent'})
+        assert False, 'Expected an unknown rateLimitPriority to be rejected'
+    except ccxt.BadRequest:
+        pass
+
+
+def test_throttler_sync():
+    test_throttler_threads()
+    test_throttler_priority_param()
+
+
+if __name__ == '__main__':
+    test_throttler_sync()
@@ -0,0 +1,29 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# the base tests of the python implementation alone, written by hand, the shared ones are transpiled into ../base/
+
+from ccxt.test.base_python.test_throttler_sync import test_throttler_sync  # noqa E402
+from ccxt.test.base_python.test_lazy_exchanges import test_lazy_exchanges  # noqa E402
+from ccxt.test.base_python.test_exchange_init import test_exchange_init  # noqa E402
+from ccxt.test.base_python.test_markets_cache import test_markets_cache  # noqa E402
+from ccxt.test.base_python.test_markets_reload import test_markets_reload  # noqa E402
+from ccxt.test.base_python.test_markets_catalog import test_markets_catalog  # noqa E402
+from ccxt.test.base_python.test_safe_market import test_safe_market  # noqa E402
+from ccxt.test.base_python.test_safe_currency import test_safe_currency  # noqa E402
+from ccxt.test.base_python.test_structure_info import test_structure_info  # noqa E402
+
+
+def test_base_python_init():
+    test_throttler_sync()
+    test_lazy_exchanges()
+    test_exchange_init()
+    test_markets_cache()
+    test_markets_reload()
+    test_markets_catalog()
+    test_safe_market()
+    test_safe_currency()
+    test_structure_info()
@@ -99,6 +99,12 @@ setup(
         'type': [
             'mypy==1.6.1',
         ],
+        'sorted': [
+            'sortedcontainers>=2.4.0',
+        ],
+        'numpy': [
+            'numpy>=1.21.0',
+        ],
     },
     project_urls=project_urls,
 )
@@ -20,6 +20,7 @@ const {
     , unCamelCase
     , precisionFromString
     , Throttler
+    , PRIORITIES
     , capitalize
     , now
     , decimalToPrecision
@@ -331,6 +332,7 @@ export default class Exchange {
     rateLimit: Num = undefined; // milliseconds
     tokenBucket = undefined
     throttler = undefined
+    throttlers: Dict = {}
     enableRateLimit: boolean = undefined;
 
     httpExceptions = undefined
@@ -365,6 +367,8 @@ export default class Exchange {
     quoteCurrencies = undefined
     currencies_by_id = undefined
     codes = undefined
+    safeIdsMemo: Dict = undefined
+    safeIdsMemoLimit: number = 10000 // the unknown ids memoized by safeMarket () and safeCurrency ()
 
     reloadingMarkets: boolean = undefined
     marketsLoading: Promise<Dictionary<any>> = undefined
@@ -398,6 +402,7 @@ export default class Exchange {
     clients: Dictionary<WsClient> = {}
     newUpdates: boolean = true
     streaming = {}
+    boundMessageHandlers: Dict = undefined
 
     alias: boolean = false;
 
@@ -650,12 +655,68 @@ export default class Exchange {
         return result
     }
 
-    throttle (cost = undefined) {
-        return this.throttler.throttle (cost)
+    throttle (cost = undefined, api = undefined, priority = undefined) {
+        let throttler = this.throttler;
+        if (api !== undefined) {
+            const group = (typeof api === 'string') ? api : api.join ('/');
+            if (group in this.throttlers) {
+                throttler = this.throttlers[group];
+            }
+        }
+        return throttler.throttle (cost, priority)
+    }
+
+    handleRateLimitPriority (api, method, params = {}, config = {}) {
+        // the throttler serves 'trading' requests first, then 'account', 'marketData' and 'backfill'
+        // a call picks its lane with params['rateLimitPriority'] or the 'priority' of its endpoint config,
+        // options['deriveRateLimitPriority'] = true derives it from the api and the http method otherwise
+        let priority = this.safeString (params, 'rateLimitPriority');
+        if (priority !== undefined) {
+            params = this.omit (params, 'rateLimitPriority');
+        } else {
+            priority = this.safeString (config, 'priority');
+        }
+        if (priority === undefined) {
+            if (!this.safeBool (this.options, 'deriveRateLimitPriority', false)) {
+                return [ undefined, params ];
+            }
+            const group = (typeof api === 'string') ? api : api.join ('/');
+            if (group.toLowerCase ().indexOf ('public') >= 0) {
+                priority = 'marketData';
+            } else if (method === 'GET') {
+                priority = 'account';
+            } else {
+                priority = 'trading';
+            }
+        } else if (PRIORITIES.indexOf (priority) < 0) {
+            throw new BadRequest (this.id + ' rateLimitPriority must be one of ' + PRIORITIES.join (', '));
+        }
+        return [ priority, params ];
     }
 
     initThrottler () {
+        // options['rateLimitGroups'] = { 'sapi': {...}, 'fapiPrivate': {...}, 'fapiPublic': 'fapiPrivate' } gives an api
+        // its own bucket (extending this.tokenBucket) or points it at the bucket of another group
         this.throttler = new Throttler (this.tokenBucket);
+        this.throttlers = {};
+        const groups = this.safeDict (this.options, 'rateLimitGroups', {});
+        const keys = Object.keys (groups);
+        for (let i = 0; i < keys.length; i++) {
+            const group = keys[i];
+            if (typeof groups[group] === 'object') {
+                this.throttlers[group] = new Throttler (this.extend (this.tokenBucket, groups[group]));
+            }
+        }
+        for (let i = 0; i < keys.length; i++) {
+            const group = keys[i];
+            const alias = groups[group];
+            if (typeof alias === 'string') {
+                if (!(alias in this.throttlers)) {
+                    throw new ExchangeError (this.id + ' rateLimitGroups["' + group + '"] refers to an unknown group "' + alias + '"');
+                }
+                this.throttlers[group] = this.throttlers[alias];
+            }
+        }
     }
 
     defineRestApiEndpoint (methodName, uppercaseMethod, lowercaseMethod, camelcaseMethod, path, paths, config = {}) {
@@ -1545,6 +1606,45 @@ export default class Exchange {
         return Buffer.from (x).toString ('hex');
     }
 
+    setTradingLimits (symbols: string[], limits: Dict) {
+        for (let i = 0; i < symbols.length; i++) {
+            const symbol = symbols[i];
+            this.markets[symbol] = this.deepExtend (this.markets[symbol], limits[symbol]);
+        }
+    }
+
+    getSafeIdsMemo (name: string, id: string) {
+        // the unknown ids parsed by safeMarket () and safeCurrency (), by name, for as long as the currencies
+        // and the common currency codes are the same, the least recently used ones past safeIdsMemoLimit are dropped
+        const memo = this.safeIdsMemo;
+        if ((memo === undefined) || (memo['currenciesById'] !== this.currencies_by_id) || (memo['commonCurrencies'] !== this.commonCurrencies) || (memo['substituteCommonCurrencyCodes'] !== this.substituteCommonCurrencyCodes)) {
+            this.safeIdsMemo = {
+                'currenciesById': this.currencies_by_id,
+                'commonCurrencies': this.commonCurrencies,
+                'substituteCommonCurrencyCodes': this.substituteCommonCurrencyCodes,
+                'entries': new Map (),
+            };
+        }
+        const entries = this.safeIdsMemo['entries'];
+        const key = name + '\n' + id;
+        const value = entries.get (key);
+        if (value !== undefined) {
+            // a Map iterates in insertion order, reinserting marks the entry as the most recently used
+            entries.delete (key);
+            entries.set (key, value);
+        }
+        return value;
+    }
+
+    setSafeIdsMemo (name: string, id: string, value: any) {
+        this.getSafeIdsMemo (name, id);
+        const entries = this.safeIdsMemo['entries'];
+        entries.set (name + '\n' + id, value);
+        if (entries.size > this.safeIdsMemoLimit) {
+            entries.delete (entries.keys ().next ().value);
+        }
+    }
+
     randNumber(size: number) {
         let number = '';
         for (let i = 0; i < size; i++) {
@@ -2218,6 +2318,23 @@ export default class Exchange {
         return result;
     }
 
+    messageHandlers (): Dict {
+        // the routing tables of handleMessage as { table: { event: handler }}, built once per instance
+        return {};
+    }
+
+    getMessageHandlers (table: string): Dict {
+        if (this.boundMessageHandlers === undefined) {
+            this.boundMessageHandlers = this.messageHandlers ();
+        }
+        return this.safeDict (this.boundMessageHandlers, table, {});
+    }
+
+    getMessageHandler (table: string, event: Str) {
+        const handlers = this.getMessageHandlers (table);
+        return this.safeValue (handlers, event);
+    }
+
     filterByLimit (array: object[], limit: Int = undefined, key: IndexType = 'timestamp', fromStart: boolean = false): any {
         if (this.valueIsDefined (limit)) {
             const arrayLength = array.length;
@@ -3125,8 +3242,11 @@ export default class Exchange {
     }
 
     setMarkets (markets, currencies = undefined) {
+        // a single pass over the markets, the market structure, precision, limits and trading fees
+        // are merged once instead of a deepExtend of all of them for every market
         const values = [];
         this.markets_by_id = {};
+        const structure = this.marketStructure ();
         // handle marketId conflicts
         // we insert spot markets first
         const marketValues = this.sortBy (this.toArray (markets), 'spot', true, true);
@@ -3135,88 +3255,117 @@ export default class Exchange {
             if (value['id'] in this.markets_by_id) {
                 const marketsByIdArray = (this.markets_by_id[value['id']] as any);
                 marketsByIdArray.push (value);
-                this.markets_by_id[value['id']] = marketsByIdArray;
             } else {
                 this.markets_by_id[value['id']] = [ value ] as any;
             }
-            const market = this.deepExtend (this.safeMarketStructure (), {
-                'precision': this.precision,
-                'limits': this.limits,
-            }, this.fees['trading'], value);
-            if (market['linear']) {
-                market['subType'] = 'linear';
-            } else if (market['inverse']) {
-                market['subType'] = 'inverse';
-            } else {
-                market['subType'] = undefined;
-            }
-            values.push (market);
+            values.push (this.marketFromStructure (structure, value));
         }
         this.markets = this.indexBy (values, 'symbol') as any;
-        const marketsSortedBySymbol = this.keysort (this.markets);
-        const marketsSortedById = this.keysort (this.markets_by_id);
-        this.symbols = Object.keys (marketsSortedBySymbol);
-        this.ids = Object.keys (marketsSortedById);
+        this.symbols = Object.keys (this.keysort (this.markets));
+        this.ids = Object.keys (this.keysort (this.markets_by_id));
         if (currencies !== undefined) {
             // currencies is always undefined when called in constructor but not when called from loadMarkets
             this.currencies = this.deepExtend (this.currencies, currencies);
         } else {
-            let baseCurrencies = [];
-            let quoteCurrencies = [];
-            for (let i = 0; i < values.length; i++) {
-                const market = values[i];
-                const defaultCurrencyPrecision = (this.precisionMode === DECIMAL_PLACES) ? 8 : this.parseNumber ('1e-8');
-                const marketPrecision = this.safeDict (market, 'precision', {});
-                if ('base' in market) {
-                    const currency = this.safeCurrencyStructure ({
-                        'id': this.safeString2 (market, 'baseId', 'base'),
-                        'numericId': this.safeInteger (market, 'baseNumericId'),
-                        'code': this.safeString (market, 'base'),
-                        'precision': this.safeValue2 (marketPrecision, 'base', 'amount', defaultCurrencyPrecision),
-                    });
-                    baseCurrencies.push (currency);
-                }
-                if ('quote' in market) {
-                    const currency = this.safeCurrencyStructure ({
-                        'id': this.safeString2 (market, 'quoteId', 'quote'),
-                        'numericId': this.safeInteger (market, 'quoteNumericId'),
-                        'code': this.safeString (market, 'quote'),
-                        'precision': this.safeValue2 (marketPrecision, 'quote', 'price', defaultCurrencyPrecision),
-                    });
-                    quoteCurrencies.push (currency);
-                }
-            }
-            baseCurrencies = this.sortBy (baseCurrencies, 'code', false, '');
-            quoteCurrencies = this.sortBy (quoteCurrencies, 'code', false, '');
-            this.baseCurrencies = this.indexBy (baseCurrencies, 'code');
-            this.quoteCurrencies = this.indexBy (quoteCurrencies, 'code');
-            const allCurrencies = this.arrayConcat (baseCurrencies, quoteCurrencies);
-            const groupedCurrencies = this.groupBy (allCurrencies, 'code');
-            const codes = Object.keys (groupedCurrencies);
-            const resultingCurrencies = [];
-            for (let i = 0; i < codes.length; i++) {
-                const code = codes[i];
-                const groupedCurrenciesCode = this.safeList (groupedCurrencies, code, []);
-                let highestPrecisionCurrency = this.safeValue (groupedCurrenciesCode, 0);
-                for (let j = 1; j < groupedCurrenciesCode.length; j++) {
-                    const currentCurrency = groupedCurrenciesCode[j];
-                    if (this.precisionMode === TICK_SIZE) {
-                        highestPrecisionCurrency = (currentCurrency['precision'] < highestPrecisionCurrency['precision']) ? currentCurrency : highestPrecisionCurrency;
-                    } else {
-                        highestPrecisionCurrency = (currentCurrency['precision'] > highestPrecisionCurrency['precision']) ? currentCurrency : highestPrecisionCurrency;
-                    }
-                }
-                resultingCurrencies.push (highestPrecisionCurrency);
-            }
-            const sortedCurrencies = this.sortBy (resultingCurrencies, 'code');
-            this.currencies = this.deepExtend (this.currencies, this.indexBy (sortedCurrencies, 'code'));
+            this.currencies = this.deepExtend (this.currencies, this.deriveCurrencies (values));
         }
         this.currencies_by_id = this.indexBy (this.currencies, 'id');
-        const currenciesSortedByCode = this.keysort (this.currencies);
-        this.codes = Object.keys (currenciesSortedByCode);
+        this.codes = Object.keys (this.keysort (this.currencies));
         return this.markets;
     }
 
+    marketStructure (): Dict {
+        // the defaults of every market
+        return this.deepExtend (this.safeMarketStructure (), {
+            'precision': this.precision,
+            'limits': this.limits,
+        }, this.fees['trading']);
+    }
+
+    marketFromStructure (structure: Dict, value: Dict): Dict {
+        const market = this.deepExtend (structure, value);
+        if (market['linear']) {
+            market['subType'] = 'linear';
+        } else if (market['inverse']) {
+            market['subType'] = 'inverse';
+        } else {
+            market['subType'] = undefined;
+        }
+        return market;
+    }
+
+    deriveCurrencies (markets: Dict[]): Dict {
+        // the currencies of the markets, also sets baseCurrencies and quoteCurrencies
+        const defaultCurrencyPrecision = (this.precisionMode === DECIMAL_PLACES) ? 8 : this.parseNumber ('1e-8');
+        // per currency code, the last base and quote currency seen and the ones with the highest precision
+        const lastBase: Dict = {};
+        const lastQuote: Dict = {};
+        const highestBase: Dict = {};
+        const highestQuote: Dict = {};
+        for (let i = 0; i < markets.length; i++) {
+            const market = markets[i];
+            const marketPrecision = this.safeDict (market, 'precision', {});
+            const base = this.safeString (market, 'base');
+            if (base !== undefined) {
+                const candidate = [ this.safeValue2 (marketPrecision, 'base', 'amount', defaultCurrencyPrecision), market, 'base' ];
+                lastBase[base] = candidate;
+                highestBase[base] = this.highestPrecisionCurrency (this.safeValue (highestBase, base), candidate);
+            }
+            const quote = this.safeString (market, 'quote');
+            if (quote !== undefined) {
+                const candidate = [ this.safeValue2 (marketPrecision, 'quote', 'price', defaultCurrencyPrecision), market, 'quote' ];
+                lastQuote[quote] = candidate;
+                highestQuote[quote] = this.highestPrecisionCurrency (this.safeValue (highestQuote, quote), candidate);
+            }
+        }
+        this.baseCurrencies = {};
+        const baseCodes = Object.keys (this.keysort (lastBase));
+        for (let i = 0; i < baseCodes.length; i++) {
+            const code = baseCodes[i];
+            this.baseCurrencies[code] = this.marketCurrencyStructure (lastBase[code]);
+        }
+        this.quoteCurrencies = {};
+        const quoteCodes = Object.keys (this.keysort (lastQuote));
+        for (let i = 0; i < quoteCodes.length; i++) {
+            const code = quoteCodes[i];
+            this.quoteCurrencies[code] = this.marketCurrencyStructure (lastQuote[code]);
+        }
+        const result: Dict = {};
+        const codes = Object.keys (this.keysort (this.extend (highestBase, highestQuote)));
+        for (let i = 0; i < codes.length; i++) {
+            const code = codes[i];
+            // the quote currencies come after the base currencies of the same code
+            const highest = this.highestPrecisionCurrency (this.safeValue (highestBase, code), this.safeValue (highestQuote, code));
+            result[code] = this.marketCurrencyStructure (highest);
+        }
+        return result;
+    }
+
+    highestPrecisionCurrency (highest: any[], candidate: any[]) {
+        // candidates are [ precision, market, 'base' or 'quote' ], the first one wins a tie
+        if (highest === undefined) {
+            return candidate;
+        }
+        if (candidate === undefined) {
+            return highest;
+        }
+        if (this.precisionMode === TICK_SIZE) {
+            return (candidate[0] < highest[0]) ? candidate : highest;
+        }
+        return (candidate[0] > highest[0]) ? candidate : highest;
+    }
+
+    marketCurrencyStructure (candidate: any[]): CurrencyInterface {
+        const side = candidate[2];
+        const market = candidate[1];
+        return this.safeCurrencyStructure ({
+            'id': this.safeString2 (market, side + 'Id', side),
+            'numericId': this.safeInteger (market, side + 'NumericId'),
+            'code': this.safeString (market, side),
+            'precision': candidate[0],
+        });
+    }
+
     getDescribeForExtendedWsExchange (currentRestInstance: any, parentRestInstance: any, wsBaseDescribe: Dictionary<any>) {
         const extendedRestDescribe = this.deepExtend (parentRestInstance.describe (), currentRestInstance.describe ());
         const superWithRestDescribe = this.deepExtend (extendedRestDescribe, wsBaseDescribe);
@@ -3503,7 +3652,7 @@ export default class Exchange {
         const triggerPrice = this.parseNumber (this.safeString2 (order, 'triggerPrice', 'stopPrice'));
         const takeProfitPrice = this.parseNumber (this.safeString (order, 'takeProfitPrice'));
         const stopLossPrice = this.parseNumber (this.safeString (order, 'stopLossPrice'));
-        return this.extend (order, {
+        return this.retainInfo (this.extend (order, {
             'id': this.safeString (order, 'id'),
             'clientOrderId': this.safeString (order, 'clientOrderId'),
             'timestamp': timestamp,
@@ -3529,7 +3678,7 @@ export default class Exchange {
             'stopLossPrice': stopLossPrice,
             'status': status,
             'fee': this.safeValue (order, 'fee'),
-        });
+        }));
     }
 
     parseOrders (orders: object, market: Market = undefined, since: Int = undefined, limit: Int = undefined, params = {}): Order[] {
@@ -3632,6 +3781,22 @@ export default class Exchange {
         };
     }
 
+    retainInfo (structure: Dict): any {
+        // options['structureInfo'] = 'drop' doesn't keep the raw exchange responses in the info of the unified
+        // trades, orders, tickers, positions and liquidations, 'keep' is the default
+        const retention = this.safeString (this.options, 'structureInfo', 'keep');
+        if (retention === 'keep') {
+            return structure;
+        }
+        if (retention !== 'drop') {
+            throw new NotSupported (this.id + ' structureInfo must be "keep" or "drop"');
+        }
+        if ('info' in structure) {
+            structure['info'] = undefined;
+        }
+        return structure;
+    }
+
     safeLiquidation (liquidation: Dict, market: Market = undefined): Liquidation {
         const contracts = this.safeString (liquidation, 'contracts');
         const contractSize = this.safeString (market, 'contractSize');
@@ -3649,7 +3814,7 @@ export default class Exchange {
         liquidation['price'] = this.parseNumber (price);
         liquidation['baseValue'] = this.parseNumber (baseValue);
         liquidation['quoteValue'] = this.parseNumber (quoteValue);
-        return liquidation as Liquidation;
+        return this.retainInfo (liquidation) as Liquidation;
     }
 
     safeTrade (trade: Dict, market: Market = undefined): Trade {
@@ -3675,7 +3840,7 @@ export default class Exchange {
         trade['amount'] = this.parseNumber (amount);
         trade['price'] = this.parseNumber (price);
         trade['cost'] = this.parseNumber (cost);
-        return trade as Trade;
+        return this.retainInfo (trade) as Trade;
     }
 
     parsedFeeAndFees (container:any) {
@@ -3881,7 +4046,7 @@ export default class Exchange {
         }
         // timestamp and symbol operations don't belong in safeTicker
         // they should be done in the derived classes
-        return this.extend (ticker, {
+        return this.retainInfo (this.extend (ticker, {
             'bid': this.parseNumber (this.omitZero (this.safeString (ticker, 'bid'))),
             'bidVolume': this.safeNumber (ticker, 'bidVolume'),
             'ask': this.parseNumber (this.omitZero (this.safeString (ticker, 'ask'))),
@@ -3900,7 +4065,7 @@ export default class Exchange {
             'previousClose': this.safeNumber (ticker, 'previousClose'),
             'indexPrice': this.safeNumber (ticker, 'indexPrice'),
             'markPrice': this.safeNumber (ticker, 'markPrice'),
-        });
+        }));
     }
 
     async fetchBorrowRate (code: string, amount: number, params = {}): Promise<{}> {
@@ -4405,10 +4570,7 @@ export default class Exchange {
         if (this.has['fetchTradingLimits']) {
             if (reload || !('limitsLoaded' in this.options)) {
                 const response = await this.fetchTradingLimits (symbols);
-                for (let i = 0; i < symbols.length; i++) {
-                    const symbol = symbols[i];
-                    this.markets[symbol] = this.deepExtend (this.markets[symbol], response[symbol]);
-                }
+                this.setTradingLimits (symbols, response);
                 this.options['limitsLoaded'] = this.milliseconds ();
             }
         }
@@ -4439,7 +4601,7 @@ export default class Exchange {
             contractSize = this.safeNumber (market, 'contractSize');
             position['contractSize'] = contractSize;
         }
-        return position as Position;
+        return this.retainInfo (position) as Position;
     }
 
     parsePositions (positions: any[], symbols: string[] = undefined, params = {}): Position[] {
@@ -4661,9 +4823,11 @@ export default class Exchange {
     }
 
     async fetch2 (path, api: any = 'public', method = 'GET', params = {}, headers: any = undefined, body: any = undefined, config = {}) {
+        let priority = undefined;
+        [ priority, params ] = this.handleRateLimitPriority (api, method, params, config);
         if (this.enableRateLimit) {
             const cost = this.calculateRateLimiterCost (api, method, path, params, config);
-            await this.throttle (cost);
+            await this.throttle (cost, api, priority);
         }
         this.lastRestRequestTimestamp = this.milliseconds ();
         const request = this.sign (path, api, method, params, headers, body);
@@ -4883,7 +5047,12 @@ export default class Exchange {
         }
         let code = currencyId;
         if (currencyId !== undefined) {
-            code = this.commonCurrencyCode (currencyId.toUpperCase ());
+            // the codes of unknown ids are memoized, a new currency structure is returned every time
+            code = this.getSafeIdsMemo ('currency', currencyId);
+            if (code === undefined) {
+                code = this.commonCurrencyCode (currencyId.toUpperCase ());
+                this.setSafeIdsMemo ('currency', currencyId, code);
+            }
         }
         return this.safeCurrencyStructure ({
             'id': currencyId,
@@ -4893,10 +5062,7 @@ export default class Exchange {
     }
 
     safeMarket (marketId: Str = undefined, market: Market = undefined, delimiter: Str = undefined, marketType: Str = undefined): MarketInterface {
-        const result = this.safeMarketStructure ({
-            'symbol': marketId,
-            'marketId': marketId,
-        });
+        // a known market id costs a single lookup, the fallback structure is only built when it isn't found
         if (marketId !== undefined) {
             if ((this.markets_by_id !== undefined) && (marketId in this.markets_by_id)) {
                 const markets = this.markets_by_id[marketId];
@@ -4919,24 +5085,34 @@ export default class Exchange {
                     }
                 }
             } else if (delimiter !== undefined && delimiter !== '') {
-                const parts = marketId.split (delimiter);
-                const partsLength = parts.length;
-                if (partsLength === 2) {
-                    result['baseId'] = this.safeString (parts, 0);
-                    result['quoteId'] = this.safeString (parts, 1);
-                    result['base'] = this.safeCurrencyCode (result['baseId']);
-                    result['quote'] = this.safeCurrencyCode (result['quoteId']);
-                    result['symbol'] = result['base'] + '/' + result['quote'];
-                    return result;
-                } else {
-                    return result;
+                // the unknown ids are split once, a new market structure is returned every time
+                let parsed = this.getSafeIdsMemo ('market' + delimiter, marketId);
+                if (parsed === undefined) {
+                    parsed = {
+                        'symbol': marketId,
+                        'marketId': marketId,
+                    };
+                    const parts = marketId.split (delimiter);
+                    const partsLength = parts.length;
+                    if (partsLength === 2) {
+                        parsed['baseId'] = this.safeString (parts, 0);
+                        parsed['quoteId'] = this.safeString (parts, 1);
+                        parsed['base'] = this.safeCurrencyCode (parsed['baseId']);
+                        parsed['quote'] = this.safeCurrencyCode (parsed['quoteId']);
+                        parsed['symbol'] = parsed['base'] + '/' + parsed['quote'];
+                    }
+                    this.setSafeIdsMemo ('market' + delimiter, marketId, parsed);
                 }
+                return this.safeMarketStructure (parsed);
             }
         }
         if (market !== undefined) {
             return market;
         }
-        return result;
+        return this.safeMarketStructure ({
+            'symbol': marketId,
+            'marketId': marketId,
+        });
     }
 
     checkRequiredCredentials (error = true) {
@@ -6513,6 +6689,12 @@ export default class Exchange {
     }
 
     safeSymbol (marketId: Str, market: Market = undefined, delimiter: Str = undefined, marketType: Str = undefined): string {
+        if ((marketId !== undefined) && (this.markets_by_id !== undefined) && (marketId in this.markets_by_id)) {
+            const markets = this.markets_by_id[marketId];
+            if (markets.length === 1) {
+                return markets[0]['symbol'];
+            }
+        }
         market = this.safeMarket (marketId, market, delimiter, marketType);
         return market['symbol'];
     }
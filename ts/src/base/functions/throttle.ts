@@ -5,6 +5,10 @@
 import { now, sleep } from './time.js';
 /*  ------------------------------------------------------------------------ */
 
+// lanes served from first to last, all of them share the same token bucket
+const PRIORITIES = [ 'trading', 'account', 'marketData', 'backfill' ];
+const DEFAULT_PRIORITY = 'marketData';
+
 class Throttler {
     constructor (config) {
         this.config = {
@@ -16,21 +20,35 @@ class Throttler {
             'cost': 1.0,
         };
         Object.assign (this.config, config);
-        this.queue = [];
+        this.queues = PRIORITIES.map (() => []);
         this.running = false;
     }
 
+    get length () {
+        return this.queues.reduce ((total, queue) => total + queue.length, 0);
+    }
+
+    head () {
+        for (let i = 0; i < this.queues.length; i++) {
+            if (this.queues[i].length > 0) {
+                return this.queues[i];
+            }
+        }
+        return undefined;
+    }
+
     async loop () {
         let lastTimestamp = now ();
         while (this.running) {
-            const { resolver, cost } = this.queue[0];
+            const queue = this.head ();
+            const { resolver, cost } = queue[0];
             if (this.config['tokens'] >= 0) {
                 this.config['tokens'] -= cost;
                 resolver ();
-                this.queue.shift ();
+                queue.shift ();
                 // contextswitch
                 await Promise.resolve ();
-                if (this.queue.length === 0) {
+                if (this.head () === undefined) {
                     this.running = false;
                 }
             } else {
@@ -44,16 +62,17 @@ class Throttler {
         }
     }
 
-    throttle (cost = undefined) {
+    throttle (cost = undefined, priority = undefined) {
         let resolver;
         const promise = new Promise ((resolve, reject) => {
             resolver = resolve;
         });
-        if (this.queue.length > this.config['maxCapacity']) {
+        if (this.length > this.config['maxCapacity']) {
             throw new Error ('throttle queue is over maxCapacity (' + this.config['maxCapacity'].toString () + '), see https://github.com/ccxt/ccxt/issues/11645#issuecomment-1195695526');
         }
         cost = (cost === undefined) ? this.config['cost'] : cost;
-        this.queue.push ({ resolver, cost });
+        const lane = PRIORITIES.indexOf ((priority === undefined) ? DEFAULT_PRIORITY : priority);
+        this.queues[lane].push ({ resolver, cost });
         if (!this.running) {
             this.running = true;
             this.loop ();
@@ -64,6 +83,7 @@ class Throttler {
 
 export {
     Throttler,
+    PRIORITIES,
 };
 
 // ----------------------------------------
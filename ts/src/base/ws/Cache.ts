@@ -102,6 +102,13 @@ class ArrayCache extends BaseCache implements CustomArray {
         this.newUpdatesBySymbol[item.symbol] = (this.newUpdatesBySymbol[item.symbol] || 0) + 1
         this.allNewUpdates = (this.allNewUpdates || 0) + 1
     }
+
+    appendMany (items) {
+        // a snapshot or a burst of updates
+        for (let i = 0; i < items.length; i++) {
+            this.append (items[i])
+        }
+    }
 }
 
 class ArrayCacheByTimestamp extends BaseCache {
@@ -1264,6 +1264,11 @@ export default class binance extends Exchange {
             // exchange-specific options
             'options': {
                 'sandboxMode': false,
+                // used with options['adaptiveRateLimit'], see parse_rate_limit_headers
+                'rateLimitHeaders': [
+                    { 'used': 'x-sapi-used-ip-weight-1m', 'limit': 12000, 'window': 60000 },
+                    { 'used': 'x-mbx-used-weight-1m', 'limit': 6000, 'window': 60000 },
+                ],
                 'fetchMargins': true,
                 'fetchMarkets': [
                     'spot', // allows CORS in browsers
@@ -30,6 +30,9 @@ export default class binancecoinm extends binance {
             'options': {
                 'fetchMarkets': [ 'inverse' ],
                 'defaultSubType': 'inverse',
+                'rateLimitHeaders': [
+                    { 'used': 'x-mbx-used-weight-1m', 'limit': 2400, 'window': 60000 },
+                ],
                 'leverageBrackets': undefined,
             },
         });
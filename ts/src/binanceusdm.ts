@@ -31,6 +31,9 @@ export default class binanceusdm extends binance {
             'options': {
                 'fetchMarkets': [ 'linear' ],
                 'defaultSubType': 'linear',
+                'rateLimitHeaders': [
+                    { 'used': 'x-mbx-used-weight-1m', 'limit': 2400, 'window': 60000 },
+                ],
                 // https://www.binance.com/en/support/faq/360033162192
                 // tier amount, maintenance margin, initial margin
                 'leverageBrackets': undefined,
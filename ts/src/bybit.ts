@@ -1016,6 +1016,11 @@ export default class bybit extends Exchange {
             'precisionMode': TICK_SIZE,
             'options': {
                 'usePrivateInstrumentsInfo': false,
+                // used with options['adaptiveRateLimit'], the limits are per endpoint
+                'rateLimitHeaders': [
+                    // per endpoint and uid, only applied to the bucket of the api in options['rateLimitGroups']
+                    { 'remaining': 'x-bapi-limit-status', 'limit': 'x-bapi-limit', 'reset': 'x-bapi-limit-reset-timestamp', 'window': 1000, 'scope': 'group' },
+                ],
                 'enableDemoTrading': false,
                 'fetchMarkets': [ 'spot', 'linear', 'inverse', 'option' ],
                 'createOrder': {
@@ -3840,13 +3840,15 @@ export default class binance extends binanceRest {
         const positions = await this.fetchPositions (undefined, params);
         this.positions[type] = new ArrayCacheBySymbolBySide ();
         const cache = this.positions[type];
+        const openPositions = [];
         for (let i = 0; i < positions.length; i++) {
             const position = positions[i];
             const contracts = this.safeNumber (position, 'contracts', 0);
             if (contracts > 0) {
-                cache.append (position);
+                openPositions.push (position);
             }
         }
+        cache.appendMany (openPositions);
         // don't remove the future from the .futures cache
         const future = client.futures[messageHash];
         future.resolve (cache);
@@ -3902,8 +3904,8 @@ export default class binance extends binanceRest {
             position['timestamp'] = timestamp;
             position['datetime'] = this.iso8601 (timestamp);
             newPositions.push (position);
-            cache.append (position);
         }
+        cache.appendMany (newPositions);
         const messageHashes = this.findMessageHashes (client, accountType + ':positions::');
         for (let i = 0; i < messageHashes.length; i++) {
             const messageHash = messageHashes[i];
@@ -4330,6 +4332,38 @@ export default class binance extends binanceRest {
         }
     }
 
+    messageHandlers (): Dict {
+        return {
+            'events': {
+                'depthUpdate': this.handleOrderBook,
+                'trade': this.handleTrade,
+                'aggTrade': this.handleTrade,
+                'kline': this.handleOHLCV,
+                'markPrice_kline': this.handleOHLCV,
+                'indexPrice_kline': this.handleOHLCV,
+                '1hTicker@arr': this.handleTickers,
+                '4hTicker@arr': this.handleTickers,
+                '1dTicker@arr': this.handleTickers,
+                '24hrTicker@arr': this.handleTickers,
+                '24hrMiniTicker@arr': this.handleTickers,
+                '1hTicker': this.handleTickers,
+                '4hTicker': this.handleTickers,
+                '1dTicker': this.handleTickers,
+                '24hrTicker': this.handleTickers,
+                '24hrMiniTicker': this.handleTickers,
+                'markPriceUpdate': this.handleTickers,
+                'markPriceUpdate@arr': this.handleTickers,
+                'bookTicker': this.handleBidsAsks, // there is no "bookTicker@arr" endpoint
+                'outboundAccountPosition': this.handleBalance,
+                'balanceUpdate': this.handleBalance,
+                'ACCOUNT_UPDATE': this.handleAcountUpdate,
+                'executionReport': this.handleOrderUpdate,
+                'ORDER_TRADE_UPDATE': this.handleOrderUpdate,
+                'forceOrder': this.handleLiquidation,
+            },
+        };
+    }
+
     handleMessage (client: Client, message) {
         // handle WebSocketAPI
         const status = this.safeString (message, 'status');
@@ -4346,39 +4380,12 @@ export default class binance extends binanceRest {
             return;
         }
         // handle other APIs
-        const methods: Dict = {
-            'depthUpdate': this.handleOrderBook,
-            'trade': this.handleTrade,
-            'aggTrade': this.handleTrade,
-            'kline': this.handleOHLCV,
-            'markPrice_kline': this.handleOHLCV,
-            'indexPrice_kline': this.handleOHLCV,
-            '1hTicker@arr': this.handleTickers,
-            '4hTicker@arr': this.handleTickers,
-            '1dTicker@arr': this.handleTickers,
-            '24hrTicker@arr': this.handleTickers,
-            '24hrMiniTicker@arr': this.handleTickers,
-            '1hTicker': this.handleTickers,
-            '4hTicker': this.handleTickers,
-            '1dTicker': this.handleTickers,
-            '24hrTicker': this.handleTickers,
-            '24hrMiniTicker': this.handleTickers,
-            'markPriceUpdate': this.handleTickers,
-            'markPriceUpdate@arr': this.handleTickers,
-            'bookTicker': this.handleBidsAsks, // there is no "bookTicker@arr" endpoint
-            'outboundAccountPosition': this.handleBalance,
-            'balanceUpdate': this.handleBalance,
-            'ACCOUNT_UPDATE': this.handleAcountUpdate,
-            'executionReport': this.handleOrderUpdate,
-            'ORDER_TRADE_UPDATE': this.handleOrderUpdate,
-            'forceOrder': this.handleLiquidation,
-        };
         let event = this.safeString (message, 'e');
         if (Array.isArray (message)) {
             const data = message[0];
             event = this.safeString (data, 'e') + '@arr';
         }
-        method = this.safeValue (methods, event);
+        method = this.getMessageHandler ('events', event);
         if (method === undefined) {
             const requestId = this.safeString (message, 'id');
             if (requestId !== undefined) {
@@ -1906,6 +1906,25 @@ export default class bitget extends bitgetRest {
         }
     }
 
+    messageHandlers (): Dict {
+        return {
+            'channels': {
+                'ticker': this.handleTicker,
+                'trade': this.handleTrades,
+                'fill': this.handleMyTrades,
+                'orders': this.handleOrder,
+                'ordersAlgo': this.handleOrder,
+                'orders-algo': this.handleOrder,
+                'orders-crossed': this.handleOrder,
+                'orders-isolated': this.handleOrder,
+                'account': this.handleBalance,
+                'positions': this.handlePositions,
+                'account-isolated': this.handleBalance,
+                'account-crossed': this.handleBalance,
+            },
+        };
+    }
+
     handleMessage (client: Client, message) {
         //
         //   {
@@ -1977,23 +1996,9 @@ export default class bitget extends bitgetRest {
             this.handleUnSubscriptionStatus (client, message);
             return;
         }
-        const methods: Dict = {
-            'ticker': this.handleTicker,
-            'trade': this.handleTrades,
-            'fill': this.handleMyTrades,
-            'orders': this.handleOrder,
-            'ordersAlgo': this.handleOrder,
-            'orders-algo': this.handleOrder,
-            'orders-crossed': this.handleOrder,
-            'orders-isolated': this.handleOrder,
-            'account': this.handleBalance,
-            'positions': this.handlePositions,
-            'account-isolated': this.handleBalance,
-            'account-crossed': this.handleBalance,
-        };
         const arg = this.safeValue (message, 'arg', {});
         const topic = this.safeValue (arg, 'channel', '');
-        const method = this.safeValue (methods, topic);
+        const method = this.getMessageHandler ('channels', topic);
         if (method !== undefined) {
             method.call (this, client, message);
         }
@@ -2432,6 +2432,34 @@ export default class bybit extends bybitRest {
         }
     }
 
+    messageHandlers (): Dict {
+        return {
+            'topics': {
+                'orderbook': this.handleOrderBook,
+                'kline': this.handleOHLCV,
+                'order': this.handleOrder,
+                'stopOrder': this.handleOrder,
+                'ticker': this.handleTicker,
+                'trade': this.handleTrades,
+                'publicTrade': this.handleTrades,
+                'depth': this.handleOrderBook,
+                'wallet': this.handleBalance,
+                'outboundAccountInfo': this.handleBalance,
+                'execution': this.handleMyTrades,
+                'ticketInfo': this.handleMyTrades,
+                'user.openapi.perp.trade': this.handleMyTrades,
+                'position': this.handlePositions,
+                'liquidation': this.handleLiquidation,
+                'pong': this.handlePong,
+                'order.create': this.handleOrderWs,
+                'order.amend': this.handleOrderWs,
+                'order.cancel': this.handleOrderWs,
+                'auth': this.handleAuthenticate,
+                'unsubscribe': this.handleUnSubscribe,
+            },
+        };
+    }
+
     handleMessage (client: Client, message) {
         if (this.handleErrorMessage (client, message)) {
             return;
@@ -2455,29 +2483,7 @@ export default class bybit extends bybitRest {
             return;
         }
         const topic = this.safeString2 (message, 'topic', 'op', '');
-        const methods: Dict = {
-            'orderbook': this.handleOrderBook,
-            'kline': this.handleOHLCV,
-            'order': this.handleOrder,
-            'stopOrder': this.handleOrder,
-            'ticker': this.handleTicker,
-            'trade': this.handleTrades,
-            'publicTrade': this.handleTrades,
-            'depth': this.handleOrderBook,
-            'wallet': this.handleBalance,
-            'outboundAccountInfo': this.handleBalance,
-            'execution': this.handleMyTrades,
-            'ticketInfo': this.handleMyTrades,
-            'user.openapi.perp.trade': this.handleMyTrades,
-            'position': this.handlePositions,
-            'liquidation': this.handleLiquidation,
-            'pong': this.handlePong,
-            'order.create': this.handleOrderWs,
-            'order.amend': this.handleOrderWs,
-            'order.cancel': this.handleOrderWs,
-            'auth': this.handleAuthenticate,
-            'unsubscribe': this.handleUnSubscribe,
-        };
+        const methods = this.getMessageHandlers ('topics');
         const exacMethod = this.safeValue (methods, topic);
         if (exacMethod !== undefined) {
             exacMethod.call (this, client, message);
@@ -1782,6 +1782,23 @@ export default class gate extends gateRest {
         }
     }
 
+    messageHandlers (): Dict {
+        return {
+            'channels': {
+                'usertrades': this.handleMyTrades,
+                'candlesticks': this.handleOHLCV,
+                'orders': this.handleOrder,
+                'positions': this.handlePositions,
+                'tickers': this.handleTicker,
+                'book_ticker': this.handleBidAsk,
+                'trades': this.handleTrades,
+                'order_book_update': this.handleOrderBook,
+                'balances': this.handleBalance,
+                'liquidates': this.handleLiquidation,
+            },
+        };
+    }
+
     handleMessage (client: Client, message) {
         //
         // subscribe
@@ -1887,19 +1904,7 @@ export default class gate extends gateRest {
         const channel = this.safeString (message, 'channel', '');
         const channelParts = channel.split ('.');
         const channelType = this.safeValue (channelParts, 1);
-        const v4Methods: Dict = {
-            'usertrades': this.handleMyTrades,
-            'candlesticks': this.handleOHLCV,
-            'orders': this.handleOrder,
-            'positions': this.handlePositions,
-            'tickers': this.handleTicker,
-            'book_ticker': this.handleBidAsk,
-            'trades': this.handleTrades,
-            'order_book_update': this.handleOrderBook,
-            'balances': this.handleBalance,
-            'liquidates': this.handleLiquidation,
-        };
-        const method = this.safeValue (v4Methods, channelType);
+        const method = this.getMessageHandler ('channels', channelType);
         if (method !== undefined) {
             method.call (this, client, message);
         }
@@ -1393,20 +1393,7 @@ export default class kucoin extends kucoinRest {
             return;
         }
         const subject = this.safeString (message, 'subject');
-        const methods: Dict = {
-            'level1': this.handleBidAsk,
-            'level2': this.handleOrderBook,
-            'trade.l2update': this.handleOrderBook,
-            'trade.ticker': this.handleTicker,
-            'trade.snapshot': this.handleTicker,
-            'trade.l3match': this.handleTrade,
-            'trade.candles.update': this.handleOHLCV,
-            'account.balance': this.handleBalance,
-            'orderChange': this.handleOrder,
-            'stopOrder': this.handleOrder,
-            '/spot/tradeFills': this.handleMyTrade,
-        };
-        const method = this.safeValue (methods, subject);
+        const method = this.getMessageHandler ('subjects', subject);
         if (method !== undefined) {
             method.call (this, client, message);
         }
@@ -1448,17 +1435,35 @@ export default class kucoin extends kucoinRest {
         this.handleErrors (undefined, undefined, client.url, undefined, undefined, data, message, undefined, undefined);
     }
 
+    messageHandlers (): Dict {
+        return {
+            'types': {
+                // 'heartbeat': this.handleHeartbeat,
+                'welcome': this.handleSystemStatus,
+                'ack': this.handleSubscriptionStatus,
+                'message': this.handleSubject,
+                'pong': this.handlePong,
+                'error': this.handleErrorMessage,
+            },
+            'subjects': {
+                'level1': this.handleBidAsk,
+                'level2': this.handleOrderBook,
+                'trade.l2update': this.handleOrderBook,
+                'trade.ticker': this.handleTicker,
+                'trade.snapshot': this.handleTicker,
+                'trade.l3match': this.handleTrade,
+                'trade.candles.update': this.handleOHLCV,
+                'account.balance': this.handleBalance,
+                'orderChange': this.handleOrder,
+                'stopOrder': this.handleOrder,
+                '/spot/tradeFills': this.handleMyTrade,
+            },
+        };
+    }
+
     handleMessage (client: Client, message) {
         const type = this.safeString (message, 'type');
-        const methods: Dict = {
-            // 'heartbeat': this.handleHeartbeat,
-            'welcome': this.handleSystemStatus,
-            'ack': this.handleSubscriptionStatus,
-            'message': this.handleSubject,
-            'pong': this.handlePong,
-            'error': this.handleErrorMessage,
-        };
-        const method = this.safeValue (methods, type);
+        const method = this.getMessageHandler ('types', type);
         if (method !== undefined) {
             method.call (this, client, message);
         }
@@ -2358,6 +2358,45 @@ export default class okx extends okxRest {
         return message;
     }
 
+    messageHandlers (): Dict {
+        return {
+            'events': {
+                // 'info': this.handleSystemStatus,
+                // 'book': 'handleOrderBook',
+                'login': this.handleAuthenticate,
+                'subscribe': this.handleSubscriptionStatus,
+                'unsubscribe': this.handleUnsubscription,
+                'order': this.handlePlaceOrders,
+                'batch-orders': this.handlePlaceOrders,
+                'amend-order': this.handlePlaceOrders,
+                'batch-amend-orders': this.handlePlaceOrders,
+                'cancel-order': this.handlePlaceOrders,
+                'mass-cancel': this.handleCancelAllOrders,
+            },
+            'channels': {
+                'bbo-tbt': this.handleOrderBook, // newly added channel that sends tick-by-tick Level 1 data, all API users can subscribe, public depth channel, verification not required
+                'books': this.handleOrderBook, // all API users can subscribe, public depth channel, verification not required
+                'books5': this.handleOrderBook, // all API users can subscribe, public depth channel, verification not required, data feeds will be delivered every 100ms (vs. every 200ms now)
+                'books50-l2-tbt': this.handleOrderBook, // only users who're VIP4 and above can subscribe, identity verification required before subscription
+                'books-l2-tbt': this.handleOrderBook, // only users who're VIP5 and above can subscribe, identity verification required before subscription
+                'tickers': this.handleTicker,
+                'mark-price': this.handleTicker,
+                'positions': this.handlePositions,
+                'index-tickers': this.handleTicker,
+                'sprd-tickers': this.handleTicker,
+                'block-tickers': this.handleTicker,
+                'trades': this.handleTrades,
+                'account': this.handleBalance,
+                'funding-rate': this.handleFundingRate,
+                // 'margin_account': this.handleBalance,
+                'orders': this.handleOrders,
+                'orders-algo': this.handleOrders,
+                'liquidation-orders': this.handleLiquidation,
+                'balance_and_position': this.handleBalanceAndPosition,
+            },
+        };
+    }
+
     handleMessage (client: Client, message) {
         if (!this.handleErrorMessage (client, message)) {
             return;
@@ -2409,48 +2448,14 @@ export default class okx extends okxRest {
         // if (table === undefined) {
         const event = this.safeString2 (message, 'event', 'op');
         if (event !== undefined) {
-            const methods: Dict = {
-                // 'info': this.handleSystemStatus,
-                // 'book': 'handleOrderBook',
-                'login': this.handleAuthenticate,
-                'subscribe': this.handleSubscriptionStatus,
-                'unsubscribe': this.handleUnsubscription,
-                'order': this.handlePlaceOrders,
-                'batch-orders': this.handlePlaceOrders,
-                'amend-order': this.handlePlaceOrders,
-                'batch-amend-orders': this.handlePlaceOrders,
-                'cancel-order': this.handlePlaceOrders,
-                'mass-cancel': this.handleCancelAllOrders,
-            };
-            const method = this.safeValue (methods, event);
+            const method = this.getMessageHandler ('events', event);
             if (method !== undefined) {
                 method.call (this, client, message);
             }
         } else {
             const arg = this.safeValue (message, 'arg', {});
             const channel = this.safeString (arg, 'channel');
-            const methods: Dict = {
-                'bbo-tbt': this.handleOrderBook, // newly added channel that sends tick-by-tick Level 1 data, all API users can subscribe, public depth channel, verification not required
-                'books': this.handleOrderBook, // all API users can subscribe, public depth channel, verification not required
-                'books5': this.handleOrderBook, // all API users can subscribe, public depth channel, verification not required, data feeds will be delivered every 100ms (vs. every 200ms now)
-                'books50-l2-tbt': this.handleOrderBook, // only users who're VIP4 and above can subscribe, identity verification required before subscription
-                'books-l2-tbt': this.handleOrderBook, // only users who're VIP5 and above can subscribe, identity verification required before subscription
-                'tickers': this.handleTicker,
-                'mark-price': this.handleTicker,
-                'positions': this.handlePositions,
-                'index-tickers': this.handleTicker,
-                'sprd-tickers': this.handleTicker,
-                'block-tickers': this.handleTicker,
-                'trades': this.handleTrades,
-                'account': this.handleBalance,
-                'funding-rate': this.handleFundingRate,
-                // 'margin_account': this.handleBalance,
-                'orders': this.handleOrders,
-                'orders-algo': this.handleOrders,
-                'liquidation-orders': this.handleLiquidation,
-                'balance_and_position': this.handleBalanceAndPosition,
-            };
-            const method = this.safeValue (methods, channel);
+            const method = this.getMessageHandler ('channels', channel);
             if (method === undefined) {
                 if (channel.indexOf ('candle') === 0) {
                     this.handleOHLCV (client, message);